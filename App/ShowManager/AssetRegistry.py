@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, Executor
+from os import path
+
+from .Sync import hash_file, META_EXTENSION
+
+ASSET_CACHE_FILE_NAME: str = ".assets.json"
+""" Name of the file, kept in each shot folder, recording the state of every asset of the shot """
+
+
+class AssetChanges:
+    """ Asset files added, modified or removed, as paths relative to the shot folder """
+
+    def __init__(self):
+        self.added: list[str] = []
+        self.modified: list[str] = []
+        self.removed: list[str] = []
+
+    def is_empty(self) -> bool:
+        """ Check if nothing changed """
+        return not (self.added or self.modified or self.removed)
+
+
+class AssetRegistry:
+    """ Registry of the files artists put in a shot folder, with their size, modification time and content hash
+
+    The registry is persisted in the shot folder and doubles as a stat cache, a file is only hashed again when its size
+    or modification time changed. Each record keeps when the file was first seen and when its content last changed,
+    removed files are kept as tombstones, so changes since any point in time can be listed without scanning.
+
+    Attributes:
+        folder (str): The shot folder.
+        assets (dict): Relative path to {"size", "mtime_ns", "hash", "added_at", "changed_at"}.
+        removed (dict): Relative path to the time the file was found missing.
+    """
+
+    def __init__(self, folder: str):
+        self.folder: str = path.normpath(folder)
+        self.assets: dict[str, dict] = {}
+        self.removed: dict[str, float] = {}
+        self.load()
+
+    def get_file(self) -> str:
+        """ Get the path of the registry file """
+        return path.join(self.folder, ASSET_CACHE_FILE_NAME)
+
+    def load(self) -> None:
+        """ Load the registry from the shot folder, a missing or broken registry is treated as empty """
+        try:
+            with open(self.get_file(), "r") as stream:
+                data = json.load(stream)
+            self.assets, self.removed = data["assets"], data["removed"]
+        except (OSError, ValueError, KeyError):
+            self.assets, self.removed = {}, {}
+
+    def save(self) -> None:
+        """ Save the registry into the shot folder """
+        with open(self.get_file(), "w") as stream:
+            json.dump({"assets": self.assets, "removed": self.removed}, stream, indent=4)
+
+    def list_files(self) -> dict[str, os.stat_result]:
+        """ Stat every asset file of the shot folder, skipping metafiles and hidden pipeline files such as the registry """
+        files = {}
+        folders = [""]
+        while folders:
+            folder = folders.pop()
+            with os.scandir(path.join(self.folder, folder)) as entries:
+                for entry in entries:
+                    relative_path = f"{folder}/{entry.name}" if folder else entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        folders.append(relative_path)
+                    elif entry.is_file() and not entry.name.startswith(".") and not entry.name.endswith(META_EXTENSION):
+                        files[relative_path] = entry.stat()
+        return files
+
+    def list_stale(self, files: dict[str, os.stat_result]) -> list[str]:
+        """ List the files that are new or whose stat changed since they were last hashed """
+        return [relative_path for relative_path, stat in files.items()
+                if relative_path not in self.assets
+                or self.assets[relative_path]["size"] != stat.st_size
+                or self.assets[relative_path]["mtime_ns"] != stat.st_mtime_ns]
+
+    def apply(self, files: dict[str, os.stat_result], hashes: dict[str, str]) -> AssetChanges:
+        """ Update the registry from a listing of the shot folder and the hashes of its stale files, then save it """
+        changes = AssetChanges()
+        now = time.time()
+        for relative_path, file_hash in hashes.items():
+            stat = files[relative_path]
+            record = self.assets.get(relative_path)
+            if record is None:
+                record = self.assets[relative_path] = {"added_at": now, "changed_at": now}
+                self.removed.pop(relative_path, None)
+                changes.added.append(relative_path)
+            elif record["hash"] != file_hash:
+                record["changed_at"] = now
+                changes.modified.append(relative_path)
+            record.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns, hash=file_hash)
+
+        for relative_path in [relative_path for relative_path in self.assets if relative_path not in files]:
+            del self.assets[relative_path]
+            self.removed[relative_path] = now
+            changes.removed.append(relative_path)
+
+        if hashes or changes.removed or not path.exists(self.get_file()):
+            self.save()
+        for change_list in (changes.added, changes.modified, changes.removed):
+            change_list.sort()
+        return changes
+
+    def scan(self, executor: Executor | None = None) -> AssetChanges:
+        """ Update the registry from the shot folder and save it, hashing only new files and files whose stat changed
+
+        Hashes run on the given executor, or on a pool of this scan's own when none is given. Files touched without
+        any content change are not reported as modified.
+        """
+        if not path.isdir(self.folder):
+            return AssetChanges()
+
+        files = self.list_files()
+        stale = self.list_stale(files)
+        if stale:
+            own_executor = executor is None
+            executor = executor or ThreadPoolExecutor()
+            try:
+                hashes = list(executor.map(hash_file, [path.join(self.folder, relative_path) for relative_path in stale]))
+            finally:
+                if own_executor:
+                    executor.shutdown()
+        else:
+            hashes = []
+        return self.apply(files, dict(zip(stale, hashes)))
+
+    def changed_since(self, timestamp: float) -> AssetChanges:
+        """ List the changes recorded by scans made at or after a point in time, without touching the disk """
+        changes = AssetChanges()
+        for relative_path, record in sorted(self.assets.items()):
+            if record["added_at"] >= timestamp:
+                changes.added.append(relative_path)
+            elif record["changed_at"] >= timestamp:
+                changes.modified.append(relative_path)
+        changes.removed = sorted(relative_path for relative_path, removed_at in self.removed.items() if removed_at >= timestamp)
+        return changes
+
+
+def scan_show(show, max_workers: int | None = None) -> dict[str, AssetChanges]:
+    """ Scan the asset registry of every shot of a show on one pool
+
+    Every shot folder is listed at once, then the stale files of every shot are hashed together, so a show where each
+    shot changed a single file is hashed as fast as a single shot with as many changed files.
+    """
+    def list_files(registry: AssetRegistry) -> dict[str, os.stat_result] | None:
+        return registry.list_files() if path.isdir(registry.folder) else None
+
+    with ThreadPoolExecutor(max_workers) as executor:
+        shot_folders = {name: show[name].get_folder() for name in show.get_names()}
+        registries = dict(zip(shot_folders, executor.map(AssetRegistry, shot_folders.values())))
+        listings = dict(zip(registries, executor.map(list_files, registries.values())))
+        futures = {name: {relative_path: executor.submit(hash_file, path.join(registries[name].folder, relative_path))
+                          for relative_path in registries[name].list_stale(files)}
+                   for name, files in listings.items() if files is not None}
+        hashes = {name: {relative_path: future.result() for relative_path, future in shot_futures.items()}
+                  for name, shot_futures in futures.items()}
+        return {name: AssetChanges() if files is None else registries[name].apply(files, hashes[name])
+                for name, files in listings.items()}
+
+
+def show_changes_since(show, timestamp: float) -> dict[str, AssetChanges]:
+    """ List the asset changes of every shot of a show recorded at or after a point in time """
+    return {name: AssetRegistry(show[name].get_folder()).changed_since(timestamp) for name in show.get_names()}
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from fnmatch import fnmatchcase
+from typing import Callable
+
+from .Serializable.Encodable import NON_SERIALIZABLE_PREFIX, coerce_value
+
+
+class BulkOperation(Enum):
+    SET, ADD, REMOVE = 0, 1, 2
+
+
+class BulkEditExitCode(Enum):
+    SUCCESS, NO_MATCH, UNKNOWN_FIELD, INVALID_VALUE, INVALID_OPERATION, WRITE_ERRORS = 0, 1, 2, 3, 4, 5
+
+
+class BulkEditReport:
+    """ Outcome of a bulk edit
+
+    Attributes:
+        exit_code (BulkEditExitCode): The overall result.
+        matched (list[str]): Shots selected by the edit.
+        changed (list[str]): Shots whose field changed and were written.
+        failures (list[tuple[str, str]]): Shots that could not be written, with the reason.
+    """
+
+    def __init__(self, exit_code: BulkEditExitCode = BulkEditExitCode.SUCCESS):
+        self.exit_code: BulkEditExitCode = exit_code
+        self.matched: list[str] = []
+        self.changed: list[str] = []
+        self.failures: list[tuple[str, str]] = []
+
+
+def select_shots(show, selector: str | Callable[[str, object], bool]) -> list[str]:
+    """ Get the names of the shots of a show matching a case-sensitive glob pattern, or a predicate(name, shot) """
+    if isinstance(selector, str):
+        return [name for name in show.get_names() if fnmatchcase(name, selector)]
+    return [name for name in show.get_names() if selector(name, show[name])]
+
+
+def _edit(current, operation: BulkOperation, value):
+    if operation == BulkOperation.SET:
+        return value
+    if isinstance(current, set):
+        return current | value if operation == BulkOperation.ADD else current - value
+    if operation == BulkOperation.ADD:
+        return current + [element for element in value if element not in current]
+    return [element for element in current if element not in value]
+
+
+def bulk_edit_shots(show, selector: str | Callable[[str, object], bool], field: str, operation: BulkOperation,
+                    value, max_workers: int | None = None) -> BulkEditReport:
+    """ Set a field, or add to or remove from a collection field, on every matching shot of a show
+
+    The value is converted to the field's type, so text such as "forest, lake" works for collection fields. Shots are
+    edited in memory first, then only the shots that actually changed are written, in parallel.
+    """
+    defaults = show.get_value_type()().__dict__
+    if field.startswith(NON_SERIALIZABLE_PREFIX) or field not in defaults:
+        return BulkEditReport(BulkEditExitCode.UNKNOWN_FIELD)
+    if operation != BulkOperation.SET and not isinstance(defaults[field], (set, list)):
+        return BulkEditReport(BulkEditExitCode.INVALID_OPERATION)
+    try:
+        value = coerce_value(defaults[field], value)
+    except (TypeError, ValueError):
+        return BulkEditReport(BulkEditExitCode.INVALID_VALUE)
+
+    report = BulkEditReport()
+    report.matched = select_shots(show, selector)
+    if not report.matched:
+        report.exit_code = BulkEditExitCode.NO_MATCH
+        return report
+
+    for name in report.matched:
+        shot = show[name]
+        try: current = coerce_value(defaults[field], getattr(shot, field, defaults[field]))
+        except (TypeError, ValueError): current = defaults[field]
+        edited = _edit(current, operation, value)
+        if edited != getattr(shot, field, None):
+            setattr(shot, field, edited)
+            report.changed.append(name)
+
+    def write(name: str) -> str | None:
+        try:
+            show[name].serialize()
+        except OSError as error:
+            return str(error)
+
+    with ThreadPoolExecutor(max_workers) as executor:
+        for name, error in zip(report.changed, executor.map(write, report.changed)):
+            if error:
+                report.failures.append((name, error))
+
+    if report.failures:
+        report.exit_code = BulkEditExitCode.WRITE_ERRORS
+    return report
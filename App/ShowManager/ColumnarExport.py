@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import sys
+from array import array
+from datetime import date, time
+from enum import Enum
+from os import path
+
+from .Serializable.Encodable import NON_SERIALIZABLE_PREFIX
+from .Statistics import length_in_seconds
+
+MANIFEST_FILE_NAME: str = "columns.json"
+""" Name of the file describing every table and column of an export """
+
+SHOWS_TABLE, SHOTS_TABLE = "shows", "shots"
+
+
+class ColumnKind(str, Enum):
+    """ How a column is laid out on disk
+
+    INTEGER, REAL: One fixed size number per row.
+    DATE: Proleptic gregorian ordinal per row.
+    TIME: Seconds per row.
+    TEXT, JSON: Utf-8 blob, with row offsets into it.
+    SET: Dictionary of distinct values, row offsets into a flat array of dictionary codes.
+    """
+    INTEGER, REAL, DATE, TIME, TEXT, JSON, SET = "integer", "real", "date", "time", "text", "json", "set"
+
+
+TYPECODES: dict[ColumnKind, str] = {ColumnKind.INTEGER: "q", ColumnKind.REAL: "d", ColumnKind.DATE: "q", ColumnKind.TIME: "d"}
+""" Array typecode of the fixed size column kinds, offsets and codes are always stored as 'q' """
+
+
+def column_kind(value) -> ColumnKind:
+    """ Deduce the column kind of a field from its default value """
+    if isinstance(value, (set, list, tuple)):
+        return ColumnKind.SET
+    if isinstance(value, dict):
+        return ColumnKind.JSON
+    if isinstance(value, date):
+        return ColumnKind.DATE
+    if isinstance(value, time):
+        return ColumnKind.TIME
+    if isinstance(value, float):
+        return ColumnKind.REAL
+    if isinstance(value, int):
+        return ColumnKind.INTEGER
+    return ColumnKind.TEXT
+
+
+def _to_number(kind: ColumnKind, value) -> int | float:
+    try:
+        if kind == ColumnKind.DATE:
+            return (value if isinstance(value, date) else date.fromisoformat(value)).toordinal()
+        if kind == ColumnKind.TIME:
+            return length_in_seconds(value)
+        return float(value) if kind == ColumnKind.REAL else int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+class _ColumnWriter:
+    """ Accumulates the values of a column row by row, then writes its files """
+
+    def __init__(self, kind: ColumnKind):
+        self.kind = kind
+        self.values = array(TYPECODES.get(kind, "q"))
+        self.offsets = array("q", [0])
+        self.blob = bytearray()
+        self.dictionary: dict[str, int] = {}
+
+    def append(self, value) -> None:
+        if self.kind in TYPECODES:
+            self.values.append(_to_number(self.kind, value))
+        elif self.kind == ColumnKind.SET:
+            for element in sorted(str(element) for element in value or ()):
+                self.values.append(self.dictionary.setdefault(element, len(self.dictionary)))
+            self.offsets.append(len(self.values))
+        else:
+            text = json.dumps(value) if self.kind == ColumnKind.JSON else str(value)
+            self.blob += text.encode("utf-8")
+            self.offsets.append(len(self.blob))
+
+    def write(self, file_prefix: str) -> None:
+        if self.kind in (ColumnKind.TEXT, ColumnKind.JSON):
+            with open(f"{file_prefix}.bin", "wb") as stream:
+                stream.write(self.blob)
+        else:
+            with open(f"{file_prefix}.bin", "wb") as stream:
+                self.values.tofile(stream)
+        if self.kind in (ColumnKind.TEXT, ColumnKind.JSON, ColumnKind.SET):
+            with open(f"{file_prefix}.offsets.bin", "wb") as stream:
+                self.offsets.tofile(stream)
+        if self.kind == ColumnKind.SET:
+            with open(f"{file_prefix}.dictionary.json", "w") as stream:
+                json.dump(list(self.dictionary), stream)
+
+
+def _field_kinds(prototype) -> dict[str, ColumnKind]:
+    return {key: column_kind(value) for key, value in prototype.__dict__.items() if not key.startswith(NON_SERIALIZABLE_PREFIX)}
+
+
+def export_columns(manager, folder: str) -> None:
+    """ Write every show and shot of a project as one set of files per field
+
+    The export holds a 'shows' and a 'shots' table. Every field of Show and Shot becomes a column, shots also get
+    a 'show' column holding the row of their show. The folder is created if it does not exist.
+    """
+    os.makedirs(folder, exist_ok=True)
+    show_type = manager.get_value_type()
+    show_prototype = show_type()
+    show_kinds = {"name": ColumnKind.TEXT, **_field_kinds(show_prototype)}
+    shot_prototype = show_prototype.get_value_type()()
+    shot_kinds = {"name": ColumnKind.TEXT, "show": ColumnKind.INTEGER, **_field_kinds(shot_prototype)}
+
+    shows = {name: _ColumnWriter(kind) for name, kind in show_kinds.items()}
+    shots = {name: _ColumnWriter(kind) for name, kind in shot_kinds.items()}
+    show_count, shot_count = 0, 0
+
+    for show_row, show_name in enumerate(manager.get_names()):
+        show = manager[show_name]
+        row = {**show.__dict__, "name": show_name}
+        for name, writer in shows.items():
+            writer.append(row.get(name, getattr(show_prototype, name, None)))
+        show_count += 1
+
+        for shot_name, shot in show.items():
+            row = {**shot.__dict__, "name": shot_name, "show": show_row}
+            for name, writer in shots.items():
+                writer.append(row.get(name, getattr(shot_prototype, name, None)))
+            shot_count += 1
+
+    manifest = {"byteorder": sys.byteorder, "tables": {}}
+    for table, writers, rows in [(SHOWS_TABLE, shows, show_count), (SHOTS_TABLE, shots, shot_count)]:
+        for name, writer in writers.items():
+            writer.write(path.join(folder, f"{table}.{name}"))
+        manifest["tables"][table] = {"rows": rows, "columns": {name: writer.kind.value for name, writer in writers.items()}}
+
+    with open(path.join(folder, MANIFEST_FILE_NAME), "w") as stream:
+        json.dump(manifest, stream, indent=4)
+
+
+class TextColumn:
+    """ Read-only view over a text column, rows are decoded on access """
+
+    def __init__(self, blob: memoryview, offsets: memoryview, is_json: bool = False):
+        self.blob, self.offsets, self.is_json = blob, offsets, is_json
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, row: int):
+        text = bytes(self.blob[self.offsets[row]:self.offsets[row + 1]]).decode("utf-8")
+        return json.loads(text) if self.is_json else text
+
+
+class SetColumn:
+    """ Read-only view over a dictionary encoded set column
+
+    Attributes:
+        dictionary (list[str]): Distinct values of the column, indexed by code.
+        offsets (memoryview): Row i holds the codes between offsets[i] and offsets[i + 1].
+        codes (memoryview): Flat codes of every row.
+    """
+
+    def __init__(self, dictionary: list[str], offsets: memoryview, codes: memoryview):
+        self.dictionary, self.offsets, self.codes = dictionary, offsets, codes
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, row: int) -> set[str]:
+        return {self.dictionary[code] for code in self.codes[self.offsets[row]:self.offsets[row + 1]]}
+
+    def counts(self) -> dict[str, int]:
+        """ Number of rows each value appears in """
+        totals = [0] * len(self.dictionary)
+        for code in self.codes:
+            totals[code] += 1
+        return dict(zip(self.dictionary, totals))
+
+
+class ColumnarProject:
+    """ Memory maps a columnar export for read-only analysis, without building any Show or Shot object
+
+    Fixed size columns are returned as memoryviews straight over the mapped files, text and set columns are
+    returned as views that only decode the rows they are asked for.
+    """
+
+    def __init__(self, folder: str):
+        self._folder = folder
+        with open(path.join(folder, MANIFEST_FILE_NAME), "r") as stream:
+            self._manifest = json.load(stream)
+        if self._manifest["byteorder"] != sys.byteorder:
+            raise ValueError(f"Export at {folder} was written on a {self._manifest['byteorder']} endian machine")
+        self._maps: list[mmap.mmap] = []
+
+    def __enter__(self) -> ColumnarProject:
+        return self
+
+    def __exit__(self, *exception) -> None:
+        self.close()
+
+    def tables(self) -> list[str]:
+        """ Get the names of the exported tables """
+        return list(self._manifest["tables"])
+
+    def row_count(self, table: str) -> int:
+        """ Get the number of rows of a table """
+        return self._manifest["tables"][table]["rows"]
+
+    def columns(self, table: str) -> dict[str, ColumnKind]:
+        """ Get the name and kind of every column of a table """
+        return {name: ColumnKind(kind) for name, kind in self._manifest["tables"][table]["columns"].items()}
+
+    def _map(self, file_name: str, typecode: str = "B") -> memoryview:
+        with open(path.join(self._folder, file_name), "rb") as stream:
+            if os.fstat(stream.fileno()).st_size == 0:
+                return memoryview(array(typecode))
+            mapped = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        self._maps.append(mapped)
+        return memoryview(mapped).cast(typecode)
+
+    def column(self, table: str, name: str) -> memoryview | TextColumn | SetColumn:
+        """ Get a column of a table """
+        kind = self.columns(table)[name]
+        prefix = f"{table}.{name}"
+        if kind in TYPECODES:
+            return self._map(f"{prefix}.bin", TYPECODES[kind])
+        if kind == ColumnKind.SET:
+            with open(path.join(self._folder, f"{prefix}.dictionary.json"), "r") as stream:
+                dictionary = json.load(stream)
+            return SetColumn(dictionary, self._map(f"{prefix}.offsets.bin", "q"), self._map(f"{prefix}.bin", "q"))
+        return TextColumn(self._map(f"{prefix}.bin"), self._map(f"{prefix}.offsets.bin", "q"), kind == ColumnKind.JSON)
+
+    def close(self) -> None:
+        """ Unmap every file, columns handed out before must not be used afterwards """
+        for mapped in self._maps:
+            try: mapped.close()
+            except BufferError: pass
+        self._maps.clear()
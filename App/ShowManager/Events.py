@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import threading
+from enum import Enum
+from typing import Callable, Iterable
+
+
+class ChangeType(Enum):
+    CREATED, DELETED, UPDATED, RELOADED = 0, 1, 2, 3
+
+
+class ChangeEvent:
+    """ Record of a change made to the loaded project
+
+    Attributes:
+        change_type (ChangeType): What happened, RELOADED means the whole project may have changed.
+        show_name (str | None): The show affected, None for project wide changes.
+        shot_name (str | None): The shot affected, None for show or project wide changes.
+        fields (tuple[str]): The fields updated, empty unless the change is an update.
+    """
+
+    def __init__(self, change_type: ChangeType, show_name: str | None = None, shot_name: str | None = None,
+                 fields: Iterable[str] = ()):
+        self.change_type: ChangeType = change_type
+        self.show_name: str | None = show_name
+        self.shot_name: str | None = shot_name
+        self.fields: tuple[str, ...] = tuple(fields)
+
+    def __eq__(self, other: ChangeEvent) -> bool:
+        return (self.change_type, self.show_name, self.shot_name, self.fields) == \
+               (other.change_type, other.show_name, other.shot_name, other.fields)
+
+    def __repr__(self) -> str:
+        target = ".".join(name for name in (self.show_name, self.shot_name) if name) or "project"
+        return f"{self.change_type.name} {target}{' ' + ', '.join(self.fields) if self.fields else ''}"
+
+
+class EventBus:
+    """ Publishes change events to the subscribers interested in them
+
+    Subscribers are indexed by change type and show, so publishing only reaches matching subscribers, and a change
+    nobody listens to costs a dictionary lookup, its event is not even built. Subscriber lists are replaced rather than
+    changed, so publishing never locks and subscribers may subscribe or unsubscribe while being called.
+    RELOADED events reach every subscriber of their change type, whatever show they filter on.
+    """
+
+    def __init__(self):
+        self._subscribers: dict[tuple[ChangeType, str | None], tuple[tuple[int, Callable], ...]] = {}
+        self._subscriptions: dict[int, list[tuple[ChangeType, str | None]]] = {}
+        self._next_token: int = 0
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback: Callable[[ChangeEvent], None], change_types: Iterable[ChangeType] | None = None,
+                  show_name: str | None = None) -> int:
+        """ Call back on every change of some types, of every type by default, optionally only for one show
+
+        Returns a token to unsubscribe with.
+        """
+        keys = [(change_type, show_name) for change_type in (ChangeType if change_types is None else change_types)]
+        with self._lock:
+            token = self._next_token
+            self._next_token += 1
+            for key in keys:
+                self._subscribers[key] = self._subscribers.get(key, ()) + ((token, callback),)
+            self._subscriptions[token] = keys
+        return token
+
+    def unsubscribe(self, token: int) -> None:
+        """ Stop calling back a subscriber """
+        with self._lock:
+            for key in self._subscriptions.pop(token, []):
+                remaining = tuple(subscriber for subscriber in self._subscribers[key] if subscriber[0] != token)
+                if remaining:
+                    self._subscribers[key] = remaining
+                else:
+                    del self._subscribers[key]
+
+    def _match(self, change_type: ChangeType, show_name: str | None) -> tuple[tuple[int, Callable], ...]:
+        subscribers = self._subscribers.get((change_type, None), ())
+        if show_name is not None:
+            subscribers += self._subscribers.get((change_type, show_name), ())
+        elif change_type == ChangeType.RELOADED:
+            subscribers += tuple(subscriber for (key_type, key_show), matched in list(self._subscribers.items())
+                                 if key_type == change_type and key_show is not None for subscriber in matched)
+        return subscribers
+
+    def has_subscribers(self, change_type: ChangeType, show_name: str | None = None) -> bool:
+        """ Check if a change would reach any subscriber """
+        return bool(self._subscribers) and bool(self._match(change_type, show_name))
+
+    def publish(self, change_type: ChangeType, show_name: str | None = None, shot_name: str | None = None,
+                fields: Iterable[str] = ()) -> None:
+        """ Call back every subscriber interested in a change, in the order they subscribed """
+        if not self._subscribers:
+            return
+        subscribers = self._match(change_type, show_name)
+        if not subscribers:
+            return
+        event = ChangeEvent(change_type, show_name, shot_name, fields)
+        for _, callback in sorted(subscribers, key=lambda subscriber: subscriber[0]):
+            callback(event)
@@ -1,7 +1,14 @@
 from __future__ import annotations
+import os
+from enum import Enum
 from .Show import Show
 from .Serializable.SerializableDecorator import serializable
-from App.ShowManager.Serializable.SerializableDict import SerializableDict
+from .Serializable.SqliteStorage import SqliteStorage
+from .Serializable.PackStorage import PackStorage
+from .Serializable.Storage import FOLDER_STORAGE
+from .Sync import SyncDirection, SyncExitCode, SyncReport, sync_folders
+from .Residency import ResidencyManager
+from App.ShowManager.Serializable.SerializableDict import SerializableDict, LoadFromFolderExitCode
 
 FILE_HEADER: str = """FILE CREATED BY: Thiago de Araujo Silva
 BCIT - British Columbia Institute of Technology
@@ -9,8 +16,187 @@ Advanced Technical Arts Course
 This file contains serialized show manager information."""
 
 
+class MigrateExitCode(Enum):
+    SUCCESS, NO_PROJECT_FOUND, ALREADY_MIGRATED, MIGRATION_ERROR = 0, 1, 2, 3
+
+
+class ArchiveExitCode(Enum):
+    SUCCESS, NO_SHOW_FOUND, ALREADY_ARCHIVED, NOT_ARCHIVED, UNSUPPORTED_STORAGE, ARCHIVE_ERROR = 0, 1, 2, 3, 4, 5
+
+
 @serializable(FILE_HEADER)
 class Manager(SerializableDict):
     """ The Manager class handles the management of shows and their associated files """
+    _residency: ResidencyManager | None = None
+
     def __init__(self, folder=""):
         super().__init__(Show, folder)
+
+    def __getitem__(self, name: str) -> Show:
+        """ Get a show, keeping track of its residency when a residency manager is set """
+        show = super().__getitem__(name)
+        if self._residency:
+            self._residency.access(name, show)
+        return show
+
+    def set_residency(self, residency: ResidencyManager | None) -> None:
+        """ Set the residency manager deciding which shows keep their shots in memory, None keeps every show loaded
+
+        Shows are unloaded when a residency manager is set, then loaded back as they are accessed.
+        """
+        for show in self.values():
+            if residency:
+                show.unload()
+            else:
+                show.ensure_loaded()
+        self._residency = residency
+
+    def is_show_unloaded(self, name: str) -> bool:
+        """ Check if the shots of a show were dropped from memory, without loading them back """
+        show = dict.get(self, name)
+        return show is not None and show.is_unloaded()
+
+    def is_show_archived(self, name: str) -> bool:
+        """ Check if a show is read only because it was archived, without loading its shots """
+        show = dict.get(self, name)
+        return show is not None and self.is_archived(show)
+
+    def get_residency(self) -> ResidencyManager | None:
+        """ Get the residency manager deciding which shows keep their shots in memory """
+        return self._residency
+
+    def load_from_folder(self, perform_recursive_load: bool = True) -> LoadFromFolderExitCode:
+        """ Load the project's shows, archived ones included, with a residency manager set only shot names are listed
+        until a show is accessed """
+        for show in self.values():
+            if show and self.is_archived(show):
+                show.get_storage().close()
+
+        if not self._residency:
+            exit_code = super().load_from_folder(perform_recursive_load)
+        else:
+            self._residency.clear()
+            exit_code = super().load_from_folder(perform_recursive_load=False)
+
+        if exit_code == LoadFromFolderExitCode.SUCCESS and not isinstance(self.get_storage(), SqliteStorage):
+            for name in PackStorage.list_packed_folders(self._folder):
+                if name not in self:
+                    self._load_archived(name, perform_recursive_load and not self._residency)
+
+        if self._residency and perform_recursive_load:
+            for show in self.values():
+                show.load_names()
+        return exit_code
+
+    def _load_archived(self, name: str, perform_recursive_load: bool = True) -> Show:
+        show_folder = os.path.join(self._folder, name)
+        show = Show(show_folder)
+        show.set_storage(PackStorage(show_folder))
+        show.deserialize()
+        if perform_recursive_load:
+            show.load_from_folder()
+        self[name] = show
+        return show
+
+    @staticmethod
+    def is_archived(show: Show) -> bool:
+        """ Check if a show is read from a pack """
+        return isinstance(show.get_storage(), PackStorage)
+
+    def archive(self, name: str) -> ArchiveExitCode:
+        """ Pack a show and all its shots into a single compressed file, the show stays listed and readable """
+        if name not in self:
+            return ArchiveExitCode.NO_SHOW_FOUND
+        if isinstance(self.get_storage(), SqliteStorage):
+            return ArchiveExitCode.UNSUPPORTED_STORAGE
+        show = self[name]
+        if self.is_archived(show):
+            return ArchiveExitCode.ALREADY_ARCHIVED
+
+        try:
+            PackStorage.pack_folder(show.get_folder())
+        except OSError:
+            return ArchiveExitCode.ARCHIVE_ERROR
+        show.delete_folder()
+        archived = self._load_archived(name, not show.is_unloaded())
+        if show.is_unloaded():
+            archived.load_names()
+        if self._residency:
+            self._residency.forget(name)
+        return ArchiveExitCode.SUCCESS
+
+    def unarchive(self, name: str) -> ArchiveExitCode:
+        """ Restore the folder layout of an archived show and delete its pack """
+        if name not in self:
+            return ArchiveExitCode.NO_SHOW_FOUND
+        show = self[name]
+        if not self.is_archived(show):
+            return ArchiveExitCode.NOT_ARCHIVED
+
+        show.get_storage().close()
+        try:
+            PackStorage.unpack_folder(show.get_folder())
+            self.get_storage().invalidate(show.get_folder())
+        except OSError:
+            self._load_archived(name)
+            return ArchiveExitCode.ARCHIVE_ERROR
+        show.set_storage(self.get_storage())
+        show.deserialize()
+        if show.is_unloaded():
+            show.load_names()
+        else:
+            show.load_from_folder()
+        return ArchiveExitCode.SUCCESS
+
+    def delete(self, key: str):
+        super().delete(key)
+        if self._residency:
+            self._residency.forget(key)
+
+    def set_folder(self, folder_path):
+        """ Set the project folder, and pick the storage the project in that folder was saved with """
+        super().set_folder(folder_path)
+        self.get_storage().close()
+        self.set_storage(SqliteStorage(self._folder) if SqliteStorage.is_database_folder(self._folder) else FOLDER_STORAGE)
+
+    def use_database(self) -> None:
+        """ Keep this project in a sqlite database inside its folder instead of one folder per element """
+        self.get_storage().close()
+        self.set_storage(SqliteStorage(self._folder))
+
+    def migrate_to_database(self) -> MigrateExitCode:
+        """ Copy a project saved as one folder per element into a sqlite database inside the project folder """
+        if isinstance(self.get_storage(), SqliteStorage):
+            return MigrateExitCode.ALREADY_MIGRATED
+
+        if not self.file_exists() or self.load_from_folder() == LoadFromFolderExitCode.NO_FOLDER_FOUND:
+            return MigrateExitCode.NO_PROJECT_FOUND
+
+        storage = SqliteStorage(self._folder)
+        try:
+            with storage.batch():
+                self.transfer_to_storage(storage)
+        except Exception:
+            storage.close()
+            if os.path.exists(storage.get_database_file()):
+                os.remove(storage.get_database_file())
+                self.get_storage().invalidate(storage.get_database_file())
+            self.set_folder(self._folder)
+            self.load_from_folder()
+            return MigrateExitCode.MIGRATION_ERROR
+        return MigrateExitCode.SUCCESS
+
+    def sync(self, other_folder: str, direction: SyncDirection = SyncDirection.BOTH) -> SyncReport:
+        """ Transfer the show and shot files that differ between this project and the project in another folder """
+        other_folder = os.path.normpath(other_folder)
+        if SqliteStorage.is_database_folder(self._folder) or SqliteStorage.is_database_folder(other_folder):
+            return SyncReport(SyncExitCode.UNSUPPORTED_STORAGE)
+
+        if not self.file_exists() or not os.path.isfile(os.path.join(other_folder, self._file_name)):
+            return SyncReport(SyncExitCode.NO_PROJECT_FOUND)
+
+        report = sync_folders(self._folder, other_folder, direction)
+        if report.pulled:
+            self.get_storage().invalidate(self._folder)
+            self.load_from_folder()
+        return report
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Callable
+
+DEFAULT_MAX_CONCURRENT: int = 2
+""" Prefetches run at the same time by default """
+
+DEFAULT_MAX_PENDING: int = 16
+""" Prefetches waiting or running at the same time by default, requests above it are dropped """
+
+
+class Prefetcher:
+    """ Runs data accesses the user is likely to need next on background threads
+
+    Every request belongs to the current generation, cancel() starts a new generation, requests of older generations
+    that did not start yet are skipped, so navigating elsewhere drops the work queued for the previous view.
+
+    Attributes:
+        completed (int): Prefetches that ran.
+        cancelled (int): Prefetches skipped because they were cancelled before they started.
+        dropped (int): Prefetch requests refused because too many were pending.
+        failed (int): Prefetches that raised an exception, prefetching never surfaces errors.
+    """
+
+    def __init__(self, max_concurrent: int = DEFAULT_MAX_CONCURRENT, max_pending: int = DEFAULT_MAX_PENDING):
+        self._executor = ThreadPoolExecutor(max_concurrent, thread_name_prefix="prefetch")
+        self._max_pending: int = max_pending
+        self._pending: set[Future] = set()
+        self._requested: set[tuple] = set()
+        self._generation: int = 0
+        self._lock = threading.RLock()
+        self.completed, self.cancelled, self.dropped, self.failed = 0, 0, 0, 0
+
+    def prefetch(self, task: Callable, *args) -> Future | None:
+        """ Request task(*args) to run in the background, returns None if it was already requested or dropped """
+        with self._lock:
+            key = (task, args)
+            if key in self._requested:
+                return None
+            if len(self._pending) >= self._max_pending:
+                self.dropped += 1
+                return None
+            future = self._executor.submit(self._run, self._generation, task, args)
+            self._pending.add(future)
+            self._requested.add(key)
+        future.add_done_callback(self._forget)
+        return future
+
+    def _run(self, generation: int, task: Callable, args: tuple) -> None:
+        with self._lock:
+            if generation != self._generation:
+                self.cancelled += 1
+                return
+        try:
+            task(*args)
+        except Exception:
+            with self._lock:
+                self.failed += 1
+            return
+        with self._lock:
+            self.completed += 1
+
+    def _forget(self, future: Future) -> None:
+        with self._lock:
+            self._pending.discard(future)
+
+    def cancel(self) -> None:
+        """ Skip every request that did not start yet, requests already running are left to finish """
+        with self._lock:
+            self._generation += 1
+            self._requested.clear()
+            for future in list(self._pending):
+                if future.cancel():
+                    self.cancelled += 1
+
+    def shutdown(self) -> None:
+        """ Cancel pending requests and stop the background threads """
+        self.cancel()
+        self._executor.shutdown(wait=False)
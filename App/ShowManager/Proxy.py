@@ -1,15 +1,39 @@
-from .Manager import Manager
+from .Manager import Manager, MigrateExitCode, ArchiveExitCode
+from .Show import Show
+from .Shot import Shot
+from .Statistics import ProjectStatistics
+from .ColumnarExport import export_columns
+from .Sync import SyncDirection, SyncExitCode
+from .Scrub import ScrubExitCode, scrub_project
+from .Residency import ResidencyManager
+from .SchemaMigration import SchemaMigrationExitCode, migrate_project
+from .Snapshot import ProjectSnapshot
+from .BulkEdit import BulkOperation, BulkEditExitCode, bulk_edit_shots
+from .AssetRegistry import AssetChanges, scan_show, show_changes_since
+from .Scheduler import Scheduler, Task, TaskStatus, get_task_status
+from .Events import ChangeEvent, ChangeType, EventBus
+from .Serializable.Encodable import NON_SERIALIZABLE_PREFIX, coerce_value
 from .Serializable.Serializable import BuildExitCode
+from .Serializable.Storage import FOLDER_STORAGE
+from .Serializable.StatCache import StatCache
 from .Serializable.SerializableDict import CreateElementExitCode, LoadFromFolderExitCode
 
 manager = Manager()
 
+events = EventBus()
+""" Bus publishing every change made through this module """
 
-def install(folder: str) -> int:
+statistics: ProjectStatistics | None = None
+
+
+def install(folder: str, use_database: bool = False) -> int:
     manager.set_folder(folder)
+    if use_database:
+        manager.use_database()
     exit_code = manager.build()
     if exit_code == BuildExitCode.SUCCESS:
         print("Installed Successfully")
+        events.publish(ChangeType.RELOADED)
     elif exit_code == BuildExitCode.FOLDER_COLLISION:
         print("Folder path not empty")
     elif exit_code == BuildExitCode.PROJECT_OVERRIDE:
@@ -26,6 +50,21 @@ def load(folder: str) -> None:
         print(f"Folder at {folder} not found")
     elif exit_code == LoadFromFolderExitCode.SUCCESS:
         print(f"Project at {folder} loaded successfully")
+        events.publish(ChangeType.RELOADED)
+
+
+def migrate_to_database(folder: str) -> int:
+    manager.set_folder(folder)
+    exit_code = manager.migrate_to_database()
+    if exit_code == MigrateExitCode.SUCCESS:
+        print(f"Project at {folder} migrated to {manager.get_storage().get_database_file()}")
+    elif exit_code == MigrateExitCode.NO_PROJECT_FOUND:
+        print(f"No project found at {folder}")
+    elif exit_code == MigrateExitCode.ALREADY_MIGRATED:
+        print(f"Project at {folder} is already stored in a database")
+    else:
+        print("An error has occurred, the project was left untouched")
+    return exit_code.value
 
 
 def get_shows_list() -> list[str]:
@@ -38,6 +77,7 @@ def create_show(show_name: str) -> None:
     exit_code = manager.create_element(show_name)
     if exit_code == CreateElementExitCode.SUCCESS:
         print(f"Show {show_name} created successfully.")
+        events.publish(ChangeType.CREATED, show_name)
     elif exit_code == CreateElementExitCode.ELEMENT_EXISTS:
         print(f"Show {show_name} already present in folder.")
     elif exit_code == CreateElementExitCode.NO_NAME_PROVIDED:
@@ -48,15 +88,67 @@ def create_show(show_name: str) -> None:
 
 def delete_show(show_name: str) -> None:
     manager.delete(show_name)
+    events.publish(ChangeType.DELETED, show_name)
 
 
 def get_show_data(show_name: str) -> str:
     return manager[show_name].encode()
 
 
+def _refuse_archived(show_name: str) -> bool:
+    if manager.is_archived(manager[show_name]):
+        print(f"Show {show_name} is archived, unarchive it to make changes")
+        return True
+    return False
+
+
+def _coerce_data(defaults: dict[str, object], data: dict[str, object]) -> dict[str, object] | None:
+    coerced = {}
+    for key, value in data.items():
+        try:
+            if key.startswith(NON_SERIALIZABLE_PREFIX):
+                raise KeyError(key)
+            coerced[key] = coerce_value(defaults[key], value)
+        except KeyError:
+            print(f"There is no {key} field")
+            return None
+        except (ValueError, TypeError):
+            print(f"{value} is not a valid {key}")
+            return None
+    return coerced
+
+
 def set_show_data(show_name: str, data: dict[str, object]):
+    if _refuse_archived(show_name):
+        return
+    data = _coerce_data(Show().__dict__, data)
+    if data is None:
+        return
     manager[show_name].__dict__.update(data)
     manager[show_name].serialize()
+    events.publish(ChangeType.UPDATED, show_name, fields=data)
+
+
+def warm_show(show_name: str) -> None:
+    if manager.is_show_unloaded(show_name):
+        manager[show_name]
+
+
+def get_shows_to_warm(show_names: list[str], limit: int) -> list[str]:
+    """ Pick, in order, the shows worth loading ahead of time, those unloaded that fit in the residency budget """
+    residency = manager.get_residency()
+    if not residency:
+        return []
+    free_slots = residency.get_free_slots()
+    limit = limit if free_slots is None else min(limit, free_slots)
+    return [show_name for show_name in show_names if manager.is_show_unloaded(show_name)][:limit]
+
+
+def pin_show(show_name: str | None) -> None:
+    """ Keep a show, usually the one being inspected, from being unloaded, None pins no show """
+    residency = manager.get_residency()
+    if residency:
+        residency.set_pinned([show_name] if show_name else [])
 
 
 def get_shot_list(show_name):
@@ -66,9 +158,12 @@ def get_shot_list(show_name):
 
 
 def create_shot(show_name: str, shot_name: str):
+    if _refuse_archived(show_name):
+        return
     exit_code = manager[show_name].create_element(shot_name)
     if exit_code == CreateElementExitCode.SUCCESS:
         print(f"Shot {shot_name} created successfully.")
+        events.publish(ChangeType.CREATED, show_name, shot_name)
     elif exit_code == CreateElementExitCode.ELEMENT_EXISTS:
         print(f"Shot {shot_name} already present in folder.")
     elif exit_code == CreateElementExitCode.NO_NAME_PROVIDED:
@@ -82,9 +177,214 @@ def get_shot_data(show_name, shot_name) -> str:
 
 
 def delete_shot(show_name, shot_name):
+    if _refuse_archived(show_name):
+        return
     manager[show_name].delete(shot_name)
+    events.publish(ChangeType.DELETED, show_name, shot_name)
 
 
 def set_shot_data(show_name, shot_name, data: dict[str, object]):
+    if _refuse_archived(show_name):
+        return
+    data = _coerce_data(Shot().__dict__, data)
+    if data is None:
+        return
     manager[show_name][shot_name].__dict__.update(data)
     manager[show_name][shot_name].serialize()
+    events.publish(ChangeType.UPDATED, show_name, shot_name, data)
+
+
+def bulk_edit(show_name: str, selector, field: str, operation: BulkOperation, value) -> int:
+    if _refuse_archived(show_name):
+        return BulkEditExitCode.WRITE_ERRORS.value
+    report = bulk_edit_shots(manager[show_name], selector, field, operation, value)
+    if report.exit_code == BulkEditExitCode.UNKNOWN_FIELD:
+        print(f"Shots do not have a {field} field")
+    elif report.exit_code == BulkEditExitCode.INVALID_OPERATION:
+        print(f"Can only set {field}, it is not a collection")
+    elif report.exit_code == BulkEditExitCode.INVALID_VALUE:
+        print(f"{value} is not a valid {field}")
+    elif report.exit_code == BulkEditExitCode.NO_MATCH:
+        print(f"No shot of {show_name} matches {selector}")
+    else:
+        for shot_name, reason in report.failures:
+            print(f"Could not write {shot_name}: {reason}")
+        print(f"{len(report.matched)} shots matched, {len(report.changed) - len(report.failures)} changed, {len(report.failures)} failed")
+    failed = {shot_name for shot_name, _ in report.failures}
+    for shot_name in report.changed:
+        if shot_name not in failed:
+            events.publish(ChangeType.UPDATED, show_name, shot_name, [field])
+    return report.exit_code.value
+
+
+def _update_statistics(event: ChangeEvent) -> None:
+    if event.change_type == ChangeType.RELOADED:
+        statistics.rebuild()
+    elif event.shot_name is None:
+        if event.change_type == ChangeType.DELETED:
+            statistics.remove_show(event.show_name)
+    elif event.change_type == ChangeType.DELETED:
+        statistics.remove_shot(event.show_name, event.shot_name)
+    else:
+        statistics.update_shot(event.show_name, event.shot_name)
+
+
+def get_statistics() -> ProjectStatistics:
+    """ Get the statistics of the loaded project, built on first use then kept up to date through the event bus """
+    global statistics
+    if not statistics:
+        statistics = ProjectStatistics(manager)
+        events.subscribe(_update_statistics)
+    return statistics
+
+
+def export_project(folder: str) -> None:
+    try:
+        export_columns(manager, folder)
+        print(f"Project exported to {folder}")
+    except OSError as error:
+        print(f"Could not export project to {folder}: {error}")
+
+
+def sync(folder: str, direction: SyncDirection = SyncDirection.BOTH) -> int:
+    report = manager.sync(folder, direction)
+    if report.exit_code == SyncExitCode.NO_PROJECT_FOUND:
+        print(f"No project found at {folder}")
+    elif report.exit_code == SyncExitCode.UNSUPPORTED_STORAGE:
+        print("Projects stored in a database can not be synced file by file")
+    else:
+        print(f"Pushed {len(report.pushed)}, pulled {len(report.pulled)}, skipped {len(report.skipped)} files")
+        for conflict in report.conflicts:
+            print(f"Conflict, {conflict} changed on both sides")
+        if report.pulled:
+            events.publish(ChangeType.RELOADED)
+    return report.exit_code.value
+
+
+def scrub(repair: bool = False) -> int:
+    report = scrub_project(manager, repair)
+    if report.exit_code == ScrubExitCode.NO_PROJECT_FOUND:
+        print("No project loaded")
+        return report.exit_code.value
+
+    for issue in report.issues:
+        print(issue)
+    for folder in report.skipped:
+        print(f"Skipped {folder}, it is archived")
+    print(f"Checked {report.files_checked} files, found {len(report.issues)} issues, skipped {len(report.skipped)} archived shows")
+    if report.exit_code == ScrubExitCode.ISSUES_REPAIRED:
+        manager.load_from_folder()
+        events.publish(ChangeType.RELOADED)
+    return report.exit_code.value
+
+
+def set_residency_budget(max_shows: int | None = None, max_bytes: int | None = None) -> None:
+    if max_shows is None and max_bytes is None:
+        manager.set_residency(None)
+        print("Every show is kept in memory")
+    else:
+        manager.set_residency(ResidencyManager(max_shows, max_bytes))
+        print(f"Shows kept in memory limited to {max_shows or 'any number of'} shows and {max_bytes or 'any number of'} bytes")
+
+
+def get_residency_counters() -> dict[str, int]:
+    residency = manager.get_residency()
+    return residency.get_counters() if residency else {}
+
+
+def migrate_schema(dry_run: bool = False) -> int:
+    report = migrate_project(manager, dry_run, progress=lambda done, total: print(f"\rMigrating {done}/{total}", end=""))
+    print()
+    if report.exit_code == SchemaMigrationExitCode.NO_PROJECT_FOUND:
+        print("No project loaded")
+        return report.exit_code.value
+
+    for folder in report.migrated:
+        print(f"{'Would migrate' if dry_run else 'Migrated'} {folder}")
+    for folder, reason in report.failures:
+        print(f"Could not migrate {folder}: {reason}")
+    for folder in report.skipped:
+        print(f"Skipped {folder}, it is archived")
+    print(f"Checked {report.files_checked} files, skipped {len(report.skipped)} archived shows, {len(report.migrated)} {'to migrate' if dry_run else 'migrated'}, {len(report.failures)} failed")
+    if report.migrated and not dry_run:
+        manager.load_from_folder()
+        events.publish(ChangeType.RELOADED)
+    return report.exit_code.value
+
+
+def publish_snapshot(name: str | None = None) -> ProjectSnapshot:
+    snapshot = ProjectSnapshot.publish(manager, name)
+    print(f"Project published to shared memory as {snapshot.get_name()}")
+    return snapshot
+
+
+def _print_asset_changes(show_name: str, changes: dict[str, AssetChanges]) -> None:
+    for shot_name, shot_changes in changes.items():
+        for label, relative_paths in (("Added", shot_changes.added), ("Modified", shot_changes.modified), ("Removed", shot_changes.removed)):
+            for relative_path in relative_paths:
+                print(f"{label} {show_name}/{shot_name}/{relative_path}")
+    print(f"{sum(not shot_changes.is_empty() for shot_changes in changes.values())} of {len(changes)} shots changed")
+
+
+def scan_assets(show_name: str) -> dict[str, AssetChanges]:
+    changes = scan_show(manager[show_name])
+    _print_asset_changes(show_name, changes)
+    return changes
+
+
+def get_asset_changes_since(show_name: str, timestamp: float) -> dict[str, AssetChanges]:
+    changes = show_changes_since(manager[show_name], timestamp)
+    _print_asset_changes(show_name, changes)
+    return changes
+
+
+def run_tasks(tasks: list[Task], show_name: str | None = None, force: bool = False, max_workers: int | None = None) -> int:
+    scheduler = Scheduler(manager, tasks, max_workers)
+    for name in (manager.get_names() if show_name is None else [show_name]):
+        if manager.is_show_archived(name):
+            print(f"Skipped show {name}, it is archived, unarchive it to run tasks on it")
+    report = scheduler.run(scheduler.list_shots(None if show_name is None else [show_name]), force)
+    for show, shot, task, reason in report.failed:
+        print(f"{task} failed on {show}/{shot}: {reason}")
+    for show, shot, task in report.blocked:
+        print(f"{task} did not run on {show}/{shot}, a dependency failed")
+    print(f"{len(report.succeeded)} tasks succeeded, {len(report.failed)} failed, {len(report.skipped)} up to date, {len(report.blocked)} blocked")
+    return report.exit_code.value
+
+
+def get_shot_task_status(show_name: str, shot_name: str, task_names: list[str]) -> dict[str, TaskStatus]:
+    shot = manager[show_name][shot_name]
+    return {task_name: get_task_status(shot, task_name) for task_name in task_names}
+
+
+def archive_show(show_name: str) -> int:
+    exit_code = manager.archive(show_name)
+    if exit_code == ArchiveExitCode.SUCCESS:
+        print(f"Show {show_name} archived, it can still be read")
+    elif exit_code == ArchiveExitCode.NO_SHOW_FOUND:
+        print(f"Show {show_name} not found")
+    elif exit_code == ArchiveExitCode.ALREADY_ARCHIVED:
+        print(f"Show {show_name} is already archived")
+    elif exit_code == ArchiveExitCode.UNSUPPORTED_STORAGE:
+        print("Shows of projects stored in a database can not be archived")
+    else:
+        print(f"An error has occurred, show {show_name} was left untouched")
+    return exit_code.value
+
+
+def unarchive_show(show_name: str) -> int:
+    exit_code = manager.unarchive(show_name)
+    if exit_code == ArchiveExitCode.SUCCESS:
+        print(f"Show {show_name} restored to {manager[show_name].get_folder()}")
+    elif exit_code == ArchiveExitCode.NO_SHOW_FOUND:
+        print(f"Show {show_name} not found")
+    elif exit_code == ArchiveExitCode.NOT_ARCHIVED:
+        print(f"Show {show_name} is not archived")
+    else:
+        print(f"An error has occurred, show {show_name} is still archived")
+    return exit_code.value
+
+
+def set_stat_cache_ttl(ttl: float) -> None:
+    """ Answer existence checks of projects kept in folders from listings trusted for ttl seconds, 0 disables it """
+    FOLDER_STORAGE.set_stat_cache(StatCache(ttl) if ttl > 0 else None)
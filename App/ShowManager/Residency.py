@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Iterable
+
+
+class ResidencyManager:
+    """ Keeps the shots of the most recently used shows in memory, within a budget of shows and of bytes
+
+    Shows are tracked as they are accessed, once the budget is exceeded the shots of the least recently used shows
+    are unloaded, keeping their names, and loaded back the next time the show or any of its shots is accessed. The size
+    of a show is estimated from the encoded size of its shots when it is loaded, and again whenever its number of shots
+    changed since.
+
+    Attributes:
+        max_shows (int | None): Most shows kept loaded, None for no limit.
+        max_bytes (int | None): Most estimated bytes kept loaded, None for no limit.
+        hits (int): Accesses to a show that was loaded.
+        misses (int): Accesses to a show that had to be loaded back.
+        evictions (int): Shows unloaded to stay within budget.
+        pinned (set[str]): Shows never unloaded, such as the show being inspected.
+    """
+
+    def __init__(self, max_shows: int | None = None, max_bytes: int | None = None):
+        self.max_shows: int | None = max_shows
+        self.max_bytes: int | None = max_bytes
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.pinned: set[str] = set()
+        self._resident: OrderedDict[str, tuple[object, int, int]] = OrderedDict()
+        self._resident_bytes: int = 0
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def estimate_size(show) -> int:
+        """ Estimate the memory held by the shots of a show """
+        return sum(len(shot.encode()) for shot in show.values())
+
+    def access(self, name: str, show) -> None:
+        """ Record an access to a show, loading it back if needed and unloading cold shows if over budget """
+        with self._lock:
+            if show.is_unloaded():
+                self.misses += 1
+                show.ensure_loaded()
+            else:
+                self.hits += 1
+
+            if name in self._resident and self._resident[name][2] == len(show):
+                self._resident.move_to_end(name)
+            else:
+                self.forget(name)
+                size = self.estimate_size(show)
+                self._resident[name] = (show, size, len(show))
+                self._resident_bytes += size
+            self._evict(keep=name)
+
+    def _over_budget(self) -> bool:
+        if self.max_shows is not None and len(self._resident) > self.max_shows:
+            return True
+        return self.max_bytes is not None and self._resident_bytes > self.max_bytes
+
+    def _evict(self, keep: str) -> None:
+        for name in list(self._resident):
+            if not self._over_budget():
+                break
+            if name == keep or name in self.pinned:
+                continue
+            show, size, _ = self._resident.pop(name)
+            self._resident_bytes -= size
+            show.unload()
+            self.evictions += 1
+
+    def set_pinned(self, names: Iterable[str]) -> None:
+        """ Set the shows never unloaded, replacing the shows pinned before """
+        with self._lock:
+            self.pinned = set(names)
+
+    def get_free_slots(self) -> int | None:
+        """ Get how many more shows can be loaded without unloading a pinned show, None when shows are not limited """
+        with self._lock:
+            if self.max_shows is None:
+                return None
+            return max(0, self.max_shows - len(self.pinned))
+
+    def forget(self, name: str) -> None:
+        """ Stop tracking a show, used when it is deleted """
+        with self._lock:
+            if name in self._resident:
+                self._resident_bytes -= self._resident.pop(name)[1]
+
+    def clear(self) -> None:
+        """ Stop tracking every show, used when the project is loaded again """
+        with self._lock:
+            self._resident.clear()
+            self._resident_bytes = 0
+
+    def get_counters(self) -> dict[str, int]:
+        """ Get the hit, miss and eviction counters, with the number of shows and estimated bytes kept loaded """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                    "resident_shows": len(self._resident), "resident_bytes": self._resident_bytes}
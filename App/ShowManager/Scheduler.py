@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import hashlib
+import heapq
+import json
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+from enum import Enum
+from os import path
+from typing import Callable, Iterable
+
+TASKS_FILE_NAME: str = ".tasks.json"
+""" Name of the file, kept next to each shot metafile, recording the status of every task run on the shot """
+
+
+class TaskStatus(Enum):
+    PENDING, RUNNING, SUCCEEDED, FAILED, STALE = 0, 1, 2, 3, 4
+
+
+class SchedulerExitCode(Enum):
+    SUCCESS, TASKS_FAILED = 0, 1
+
+
+class Task:
+    """ A pipeline task run on every scheduled shot
+
+    The action is called as action(show_name, shot_name, shot_folder, shot_data) in a worker process, so it must be a
+    module level function, and it reports failure by raising.
+
+    Attributes:
+        name (str): The task name, unique in a scheduler.
+        action (Callable): The work done on each shot.
+        dependencies (tuple[str]): Tasks that must succeed on a shot before this one runs on it.
+        priority (int): Ready tasks with a higher priority are started first.
+        retries (int): Times a failed run is tried again before the task is marked as failed.
+    """
+
+    def __init__(self, name: str, action: Callable[[str, str, str, dict], None], dependencies: Iterable[str] = (),
+                 priority: int = 0, retries: int = 0):
+        self.name: str = name
+        self.action: Callable[[str, str, str, dict], None] = action
+        self.dependencies: tuple[str, ...] = tuple(dependencies)
+        self.priority: int = priority
+        self.retries: int = retries
+
+
+class SchedulerReport:
+    """ Outcome of a scheduler run, each entry is a (show name, shot name, task name) tuple
+
+    Attributes:
+        exit_code (SchedulerExitCode): The overall result.
+        succeeded (list[tuple]): Tasks that ran and succeeded.
+        failed (list[tuple[str, str, str, str]]): Tasks that failed every attempt, with the last error.
+        skipped (list[tuple]): Tasks that already succeeded on unchanged shots.
+        blocked (list[tuple]): Tasks that did not run because a dependency failed.
+        archived (list[tuple[str, str]]): (show name, shot name) of shots not run on because their show is archived.
+    """
+
+    def __init__(self):
+        self.exit_code: SchedulerExitCode = SchedulerExitCode.SUCCESS
+        self.succeeded: list[tuple[str, str, str]] = []
+        self.failed: list[tuple[str, str, str, str]] = []
+        self.skipped: list[tuple[str, str, str]] = []
+        self.blocked: list[tuple[str, str, str]] = []
+        self.archived: list[tuple[str, str]] = []
+
+
+def hash_shot(shot) -> str:
+    """ Get the hash of the data of a shot, a task that succeeded on other data is stale """
+    return hashlib.sha256(shot.encode().encode("utf-8")).hexdigest()
+
+
+def get_tasks_file(shot) -> str:
+    """ Get the path of the task status file of a shot """
+    return path.join(shot.get_folder(), TASKS_FILE_NAME)
+
+
+def load_task_records(shot) -> dict[str, dict]:
+    """ Load the task records of a shot, a missing or broken file means no task ran on it yet """
+    try:
+        return json.loads(shot.get_storage().read_file(get_tasks_file(shot)))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_task_records(shot, records: dict[str, dict]) -> None:
+    """ Save the task records of a shot through the storage of the shot """
+    shot.get_storage().write_file(get_tasks_file(shot), json.dumps(records, indent=4))
+
+
+def get_task_status(shot, task_name: str, records: dict[str, dict] | None = None) -> TaskStatus:
+    """ Get the status of a task on a shot, a task that succeeded before the shot data changed is stale """
+    record = (load_task_records(shot) if records is None else records).get(task_name)
+    if record is None:
+        return TaskStatus.PENDING
+    status = TaskStatus[record["status"]]
+    if status == TaskStatus.SUCCEEDED and record.get("shot_hash") != hash_shot(shot):
+        return TaskStatus.STALE
+    return status
+
+
+class Scheduler:
+    """ Runs a graph of tasks over the shots of a project on a process pool
+
+    Every (shot, task) pair is a job, a job is ready once the tasks it depends on succeeded on the same shot, ready jobs
+    start by priority whenever a worker is free, so a job released by a finishing dependency starts before lower
+    priority jobs that were ready earlier. The status of each job is written next to the shot metafile as it changes,
+    so a later run resumes where an earlier one stopped: jobs that succeeded on unchanged data are skipped, unless a
+    dependency ran again.
+    """
+
+    def __init__(self, manager, tasks: list[Task], max_workers: int | None = None,
+                 executor_factory: Callable[[int | None], Executor] = ProcessPoolExecutor):
+        self.manager = manager
+        self.tasks: dict[str, Task] = {task.name: task for task in tasks}
+        self.max_workers: int | None = max_workers
+        self.executor_factory: Callable[[int | None], Executor] = executor_factory
+        if len(self.tasks) != len(tasks):
+            raise ValueError("Task names must be unique")
+        self.order: list[str] = self._sort_tasks()
+
+    def _sort_tasks(self) -> list[str]:
+        order, visiting = [], set()
+
+        def visit(name: str) -> None:
+            if name in order:
+                return
+            if name in visiting:
+                raise ValueError(f"Task {name} depends on itself")
+            visiting.add(name)
+            for dependency in self.tasks[name].dependencies:
+                if dependency not in self.tasks:
+                    raise ValueError(f"Task {name} depends on unknown task {dependency}")
+                visit(dependency)
+            order.append(name)
+
+        for name in self.tasks:
+            visit(name)
+        return order
+
+    def list_shots(self, show_names: Iterable[str] | None = None) -> list[tuple[str, str]]:
+        """ List the (show name, shot name) of every shot of some shows, of every show by default, archived shows are left out """
+        return [(show_name, shot_name)
+                for show_name in (self.manager.get_names() if show_names is None else show_names)
+                if not self.manager.is_show_archived(show_name)
+                for shot_name in self.manager[show_name].get_names()]
+
+    def run(self, shots: Iterable[tuple[str, str]] | None = None, force: bool = False) -> SchedulerReport:
+        """ Run every task on some (show name, shot name) shots, on every shot by default, force runs up to date tasks too """
+        report = SchedulerReport()
+        shots = self.list_shots() if shots is None else list(shots)
+        report.archived = [key for key in shots if self.manager.is_show_archived(key[0])]
+        shots = [key for key in shots if key not in report.archived]
+        records = {key: load_task_records(self.manager[key[0]][key[1]]) for key in shots}
+        reran: set[tuple[str, str, str]] = set()
+        waiting: dict[tuple[str, str, str], int] = {}
+        ready: list[tuple[int, int, tuple[str, str, str]]] = []
+        attempts: dict[tuple[str, str, str], int] = {}
+        sequence = 0
+
+        def push(job: tuple[str, str, str]) -> None:
+            nonlocal sequence
+            heapq.heappush(ready, (-self.tasks[job[2]].priority, sequence, job))
+            sequence += 1
+
+        def record(job: tuple[str, str, str], status: TaskStatus, **fields) -> None:
+            shot = self.manager[job[0]][job[1]]
+            shot_records = records[job[:2]]
+            shot_records[job[2]] = {**shot_records.get(job[2], {}), "status": status.name, "updated_at": time.time(), **fields}
+            save_task_records(shot, shot_records)
+
+        def release(job: tuple[str, str, str]) -> None:
+            for name in self.order:
+                if job[2] in self.tasks[name].dependencies:
+                    dependent = (*job[:2], name)
+                    waiting[dependent] -= 1
+                    if waiting[dependent] == 0:
+                        push(dependent)
+
+        def block(job: tuple[str, str, str]) -> None:
+            for name in self.order:
+                dependent = (*job[:2], name)
+                if job[2] in self.tasks[name].dependencies and dependent not in report.blocked:
+                    report.blocked.append(dependent)
+                    block(dependent)
+
+        for key in shots:
+            for name in self.order:
+                job = (*key, name)
+                waiting[job] = len(self.tasks[name].dependencies)
+                if waiting[job] == 0:
+                    push(job)
+
+        workers = self.max_workers or os.cpu_count() or 1
+        with self.executor_factory(self.max_workers) as executor:
+            running = {}
+            while ready or running:
+                while ready and len(running) < workers:
+                    job = heapq.heappop(ready)[2]
+                    shot = self.manager[job[0]][job[1]]
+                    dependencies_reran = any((*job[:2], dependency) in reran for dependency in self.tasks[job[2]].dependencies)
+                    if not force and not dependencies_reran and get_task_status(shot, job[2], records[job[:2]]) == TaskStatus.SUCCEEDED:
+                        report.skipped.append(job)
+                        release(job)
+                        continue
+                    attempts[job] = attempts.get(job, 0) + 1
+                    record(job, TaskStatus.RUNNING, attempts=attempts[job])
+                    data = json.loads(shot.encode())
+                    future = executor.submit(self.tasks[job[2]].action, job[0], job[1], shot.get_folder(), data)
+                    running[future] = (job, hash_shot(shot))
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job, shot_hash = running.pop(future)
+                    error = future.exception()
+                    if error is None:
+                        record(job, TaskStatus.SUCCEEDED, shot_hash=shot_hash, error=None)
+                        report.succeeded.append(job)
+                        reran.add(job)
+                        release(job)
+                    elif attempts[job] <= self.tasks[job[2]].retries:
+                        push(job)
+                    else:
+                        record(job, TaskStatus.FAILED, error=repr(error))
+                        report.failed.append((*job, repr(error)))
+                        block(job)
+
+        if report.failed:
+            report.exit_code = SchedulerExitCode.TASKS_FAILED
+        return report
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from enum import Enum
+from os import path
+from typing import Callable, Type
+
+from .Serializable.Encodable import NON_SERIALIZABLE_PREFIX
+from .Serializable.PackStorage import PackStorage
+from .Serializable.SerializableDict import SerializableDict
+from .Serializable.Storage import Storage
+
+
+class SchemaMigrationExitCode(Enum):
+    SUCCESS, NO_PROJECT_FOUND, FAILURES = 0, 1, 2
+
+
+class SchemaMigrationReport:
+    """ Outcome of a project schema migration
+
+    Attributes:
+        exit_code (SchemaMigrationExitCode): The overall result.
+        dry_run (bool): If files were only checked and left untouched.
+        files_checked (int): Number of element folders checked.
+        migrated (list[str]): Folders whose metafile was rewritten, or would be rewritten on a dry run.
+        failures (list[tuple[str, str]]): Folders whose metafile could not be migrated, with the reason.
+        skipped (list[str]): Folders of archived shows, which are read only and were not checked.
+    """
+
+    def __init__(self, dry_run: bool, exit_code: SchemaMigrationExitCode = SchemaMigrationExitCode.SUCCESS):
+        self.exit_code: SchemaMigrationExitCode = exit_code
+        self.dry_run: bool = dry_run
+        self.files_checked: int = 0
+        self.migrated: list[str] = []
+        self.failures: list[tuple[str, str]] = []
+        self.skipped: list[str] = []
+
+
+def _list_elements(manager, storage: Storage, executor: ThreadPoolExecutor) -> list[tuple[Type, str]]:
+    """ List the type and folder of every element of a project, one level at a time with the listings run in parallel """
+    elements = []
+    level = [(type(manager), manager.get_folder())]
+    while level:
+        elements += level
+        dictionaries = [(element_type, folder) for element_type, folder in level if issubclass(element_type, SerializableDict)]
+        listings = executor.map(lambda element: storage.list_folders(element[1]), dictionaries)
+        level = [(element_type(folder).get_value_type(), path.join(folder, name))
+                 for (element_type, folder), names in zip(dictionaries, listings) for name in names]
+    return elements
+
+
+def _migrate_element(element_type: Type, folder: str, storage: Storage, dry_run: bool) -> bool:
+    """ Bring the metafile of a folder to the current schema of its class, returns True if the file had to change
+
+    A file changes when it was written with an older schema version, or when its fields differ from the class fields,
+    files with neither difference are left untouched so running a migration twice does nothing the second time.
+    """
+    element = element_type(folder)
+    element.set_storage(storage)
+    if not element.file_exists():
+        return False
+
+    version, data_string = element.split_file_data(storage.read_file(element.get_file()))
+    data = element.migrate_data(json.loads(data_string), version)
+    fields = {key for key in element.__dict__ if not key.startswith(NON_SERIALIZABLE_PREFIX)}
+    if version == element.get_schema_version() and set(data) == fields:
+        return False
+
+    if not dry_run:
+        element.decode(json.dumps(data))
+        element.serialize()
+    return True
+
+
+def migrate_project(manager, dry_run: bool = False, max_workers: int | None = None,
+                    progress: Callable[[int, int], None] | None = None) -> SchemaMigrationReport:
+    """ Upgrade every metafile of a project to the current schema of its class, in parallel
+
+    Args:
+        manager: The project, only its folder and storage are used.
+        dry_run: Report the files that would change without writing them.
+        max_workers: Most files handled at once.
+        progress: Called with the number of files done and the total after each file.
+    """
+    if not manager.file_exists():
+        return SchemaMigrationReport(dry_run, SchemaMigrationExitCode.NO_PROJECT_FOUND)
+
+    storage = manager.get_storage()
+    report = SchemaMigrationReport(dry_run)
+    report.skipped = [path.join(manager.get_folder(), name) for name in PackStorage.list_packed_folders(manager.get_folder())]
+    with ThreadPoolExecutor(max_workers) as executor:
+        elements = _list_elements(manager, storage, executor)
+        futures = {executor.submit(_migrate_element, element_type, folder, storage, dry_run): folder for element_type, folder in elements}
+        for future in as_completed(futures):
+            report.files_checked += 1
+            try:
+                if future.result():
+                    report.migrated.append(futures[future])
+            except Exception as error:
+                report.failures.append((futures[future], str(error)))
+            if progress:
+                progress(report.files_checked, len(futures))
+
+    report.migrated.sort()
+    report.failures.sort()
+    if report.failures:
+        report.exit_code = SchemaMigrationExitCode.FAILURES
+    return report
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from enum import Enum
+from os import path
+from typing import Type
+
+from .Serializable.PackStorage import PackStorage
+from .Serializable.Serializable import FileIssue
+from .Serializable.SerializableDict import SerializableDict
+from .Serializable.Storage import Storage
+
+
+class ScrubExitCode(Enum):
+    CLEAN, ISSUES_FOUND, ISSUES_REPAIRED, NO_PROJECT_FOUND = 0, 1, 2, 3
+
+
+class ScrubIssue:
+    """ A problem found in a metafile or in a folder of a project
+
+    Attributes:
+        target (str): The metafile, or the folder when the metafile is missing.
+        kind (FileIssue): What is wrong.
+        detail (str): Human readable description of the problem.
+        repaired (bool): If the problem was repaired.
+    """
+
+    def __init__(self, target: str, kind: FileIssue, detail: str):
+        self.target: str = target
+        self.kind: FileIssue = kind
+        self.detail: str = detail
+        self.repaired: bool = False
+
+    def __repr__(self) -> str:
+        return f"{self.kind.name} {self.target}: {self.detail}{' (repaired)' if self.repaired else ''}"
+
+
+class ScrubReport:
+    """ Outcome of a project scrub
+
+    Attributes:
+        exit_code (ScrubExitCode): The overall result.
+        files_checked (int): Number of folders whose metafile was checked.
+        issues (list[ScrubIssue]): Every problem found, sorted by target.
+        skipped (list[str]): Folders of archived shows, which were not checked.
+    """
+
+    def __init__(self, exit_code: ScrubExitCode = ScrubExitCode.CLEAN):
+        self.exit_code: ScrubExitCode = exit_code
+        self.files_checked: int = 0
+        self.issues: list[ScrubIssue] = []
+        self.skipped: list[str] = []
+
+    def count(self) -> dict[FileIssue, int]:
+        """ Number of issues of each kind """
+        counts = {}
+        for issue in self.issues:
+            counts[issue.kind] = counts.get(issue.kind, 0) + 1
+        return counts
+
+
+def _scrub_element(element_type: Type, folder: str, storage: Storage, repair: bool) -> tuple[list[ScrubIssue], list[tuple[Type, str]]]:
+    """ Check the metafile of a single folder, and list the folders of its elements when it holds a dictionary """
+    element = element_type(folder)
+    element.set_storage(storage)
+    children = []
+    if isinstance(element, SerializableDict):
+        children = [(element.get_value_type(), path.join(folder, name)) for name in storage.list_folders(folder)]
+
+    try:
+        file_string = storage.read_file(element.get_file())
+    except FileNotFoundError:
+        issue = ScrubIssue(folder, FileIssue.MISSING_FILE, "Folder has no metafile")
+        if repair:
+            element.serialize()
+            issue.repaired = True
+        return [issue], children
+    except ValueError as error:
+        issue = ScrubIssue(element.get_file(), FileIssue.UNREADABLE_FILE, f"File is not text: {error}")
+        if repair:
+            storage.write_file(element.get_file(), element.repair_file_data(""))
+            issue.repaired = True
+        return [issue], children
+    except OSError as error:
+        return [ScrubIssue(element.get_file(), FileIssue.UNREADABLE_FILE, f"File can not be read: {error}")], children
+
+    issues = [ScrubIssue(element.get_file(), kind, detail) for kind, detail in element.inspect_file_data(file_string)]
+    if issues and repair:
+        storage.write_file(element.get_file(), element.repair_file_data(file_string))
+        for issue in issues:
+            issue.repaired = True
+    return issues, children
+
+
+def scrub_project(manager, repair: bool = False, max_workers: int | None = None) -> ScrubReport:
+    """ Check every metafile of a project in parallel, optionally rewriting the broken ones
+
+    Missing headers and markers are restored, unknown keys are dropped, values of the wrong type are converted when
+    possible and reset to their default otherwise, folders without a metafile get a default one. A folder that can not
+    be checked at all is reported as an unreadable file, and the scrub carries on with the others.
+    """
+    storage = manager.get_storage()
+    if not manager.file_exists():
+        return ScrubReport(ScrubExitCode.NO_PROJECT_FOUND)
+
+    report = ScrubReport()
+    report.skipped = [path.join(manager.get_folder(), name) for name in PackStorage.list_packed_folders(manager.get_folder())]
+    with ThreadPoolExecutor(max_workers) as executor:
+        def submit(element_type: Type, folder: str):
+            future = executor.submit(_scrub_element, element_type, folder, storage, repair)
+            folders[future] = folder
+            return future
+
+        folders = {}
+        pending = {submit(type(manager), manager.get_folder())}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                report.files_checked += 1
+                try:
+                    issues, children = future.result()
+                except Exception as error:
+                    report.issues.append(ScrubIssue(folders[future], FileIssue.UNREADABLE_FILE, f"Folder can not be checked: {error!r}"))
+                    continue
+                report.issues += issues
+                pending |= {submit(element_type, folder) for element_type, folder in children}
+
+    report.issues.sort(key=lambda issue: (issue.target, issue.kind.value))
+    if report.issues:
+        report.exit_code = ScrubExitCode.ISSUES_REPAIRED if repair else ScrubExitCode.ISSUES_FOUND
+    return report
@@ -4,6 +4,54 @@ from datetime import date, time
 NON_SERIALIZABLE_PREFIX: str = "_"
 """ Prefix used to indicate that a field should not be serialized when encoding an object into a JSON string. """
 
+TRUE_STRINGS: tuple[str, ...] = ("true", "yes", "1")
+""" Text values read as True when a boolean field is coerced from a string. """
+
+
+def is_value_legal(default: object, value: object) -> bool:
+    """ Check if a JSON value has the JSON type a field holding the default value is encoded to. """
+    try:
+        if default is None:
+            return True
+        if isinstance(default, bool):
+            return isinstance(value, bool)
+        if isinstance(default, int):
+            return isinstance(value, int) and not isinstance(value, bool)
+        if isinstance(default, float):
+            return isinstance(value, (int, float)) and not isinstance(value, bool)
+        if isinstance(default, time):
+            return isinstance(value, str) and time.fromisoformat(value) is not None
+        if isinstance(default, date):
+            return isinstance(value, str) and date.fromisoformat(value) is not None
+        if isinstance(default, (set, list, tuple)):
+            return isinstance(value, list)
+        if isinstance(default, (str, dict)):
+            return isinstance(value, type(default))
+    except ValueError:
+        return False
+    return True
+
+
+def coerce_value(default: object, value: object) -> object:
+    """ Convert a value into the type of the default value, raise ValueError or TypeError if it can not be done. """
+    if default is None or isinstance(value, type(default)):
+        return value
+    if isinstance(default, bool):
+        return value.strip().lower() in TRUE_STRINGS if isinstance(value, str) else bool(int(value))
+    if isinstance(default, (int, float, str)):
+        return type(default)(value)
+    if isinstance(default, (time, date)):
+        return type(default).fromisoformat(str(value))
+    if isinstance(default, (set, list, tuple)):
+        elements = [element.strip() for element in value.split(",")] if isinstance(value, str) else value
+        return type(default)(elements)
+    if isinstance(default, dict):
+        value = json.loads(value) if isinstance(value, str) else value
+        if not isinstance(value, dict):
+            raise TypeError(f"{value} is not a dictionary")
+        return value
+    raise TypeError(f"Can not convert {value} to {type(default).__name__}")
+
 
 class Encodable:
     """ Provides methods to encode and decode data from and to a JSON string
@@ -1,7 +1,7 @@
-import os
-import shutil
 from os import path
 
+from .Storage import Storage, FOLDER_STORAGE
+
 
 class FolderManager:
     """
@@ -9,6 +9,7 @@ class FolderManager:
 
     Attributes:
         _folder (str): The path to the managed folder.
+        _storage (Storage): Where the managed folder is kept, the file system unless told otherwise.
 
     Methods:
         get_folder(): Get the path of the managed folder.
@@ -16,8 +17,12 @@ class FolderManager:
         create_folder(): Create the managed folder.
         delete_folder(): Delete the managed folder.
         folder_exists(): Check if the managed folder exists.
+        get_storage(): Get the storage holding the managed folder.
+        set_storage(storage): Set the storage holding the managed folder.
     """
 
+    _storage: Storage = FOLDER_STORAGE
+
     def __init__(self, folder_path: str = ""):
         """Initialize a FolderManager object."""
         try: self._folder
@@ -34,14 +39,21 @@ class FolderManager:
 
     def create_folder(self):
         """Create the managed folder."""
-
-        os.mkdir(self._folder)
+        self._storage.create_folder(self._folder)
 
     def delete_folder(self):
         """Delete the managed folder."""
         if self.folder_exists():
-            shutil.rmtree(self._folder)
+            self._storage.delete_folder(self._folder)
 
     def folder_exists(self):
         """Check if the managed folder exists."""
-        return path.exists(self._folder)
+        return self._storage.exists(self._folder)
+
+    def get_storage(self) -> Storage:
+        """Get the storage holding the managed folder."""
+        return self._storage
+
+    def set_storage(self, storage: Storage):
+        """Set the storage holding the managed folder."""
+        self._storage = storage
@@ -0,0 +1,128 @@
+import os
+import posixpath
+import zipfile
+from os import path
+
+from .Storage import Storage
+
+PACK_EXTENSION: str = ".pack"
+""" Extension of the file an archived folder is packed into, next to where the folder was """
+
+
+class PackStorage(Storage):
+    """ Read only storage serving a folder packed into a single compressed file
+
+    The pack is a zip file, its central directory is the offset index used to read any single file without unpacking
+    the others. Every write raises a PermissionError, deleting the packed folder itself deletes the pack.
+
+    Attributes:
+        root (str): The folder that was packed, paths below it are read from the pack.
+    """
+
+    def __init__(self, root: str):
+        self.root: str = path.normpath(root)
+        self._pack = zipfile.ZipFile(self.get_pack_file(self.root), "r")
+        self._files: set[str] = set()
+        self._folders: set[str] = {"."}
+        for name in self._pack.namelist():
+            if name.endswith("/"):
+                self._folders.add(name.rstrip("/"))
+            else:
+                self._files.add(name)
+            parent = posixpath.dirname(name.rstrip("/"))
+            while parent:
+                self._folders.add(parent)
+                parent = posixpath.dirname(parent)
+
+    @staticmethod
+    def get_pack_file(folder: str) -> str:
+        """ Get the path of the pack a folder is archived into """
+        return path.normpath(folder) + PACK_EXTENSION
+
+    @staticmethod
+    def is_packed_folder(folder: str) -> bool:
+        """ Check if a folder was archived into a pack """
+        return path.isfile(PackStorage.get_pack_file(folder))
+
+    @staticmethod
+    def list_packed_folders(folder: str) -> list[str]:
+        """ List the names of the folders archived into packs inside a folder """
+        try:
+            return sorted(name[:-len(PACK_EXTENSION)] for name in os.listdir(folder)
+                          if name.endswith(PACK_EXTENSION) and path.isfile(path.join(folder, name)))
+        except (FileNotFoundError, NotADirectoryError):
+            return []
+
+    @staticmethod
+    def pack_folder(folder: str) -> str:
+        """ Pack a folder and everything inside it, the folder is left untouched, returns the pack file """
+        folder = path.normpath(folder)
+        pack_file = PackStorage.get_pack_file(folder)
+        temporary_file = pack_file + ".tmp"
+        try:
+            with zipfile.ZipFile(temporary_file, "w", zipfile.ZIP_DEFLATED) as pack:
+                for parent, folder_names, file_names in os.walk(folder):
+                    relative_parent = path.relpath(parent, folder).replace(os.sep, "/")
+                    for name in sorted(folder_names):
+                        pack.write(path.join(parent, name), posixpath.normpath(f"{relative_parent}/{name}") + "/")
+                    for name in sorted(file_names):
+                        pack.write(path.join(parent, name), posixpath.normpath(f"{relative_parent}/{name}"))
+            with zipfile.ZipFile(temporary_file, "r") as pack:
+                if pack.testzip() is not None:
+                    raise OSError(f"Pack of {folder} is corrupted")
+            os.replace(temporary_file, pack_file)
+        finally:
+            if path.exists(temporary_file):
+                os.remove(temporary_file)
+        return pack_file
+
+    @staticmethod
+    def unpack_folder(folder: str) -> None:
+        """ Restore a packed folder, then delete its pack """
+        folder = path.normpath(folder)
+        temporary_folder = folder + ".unpack"
+        with zipfile.ZipFile(PackStorage.get_pack_file(folder), "r") as pack:
+            pack.extractall(temporary_folder)
+        os.rename(temporary_folder, folder)
+        os.remove(PackStorage.get_pack_file(folder))
+
+    def _key(self, target_path: str) -> str | None:
+        relative_path = path.relpath(path.normpath(target_path), self.root)
+        if relative_path == ".." or relative_path.startswith(".." + os.sep):
+            return None
+        return relative_path.replace(os.sep, "/")
+
+    def _refuse(self, target_path: str):
+        return PermissionError(f"{target_path} is archived, unarchive it to make changes")
+
+    def exists(self, target_path: str) -> bool:
+        key = self._key(target_path)
+        return key in self._files or key in self._folders
+
+    def create_folder(self, folder: str) -> None:
+        raise self._refuse(folder)
+
+    def delete_folder(self, folder: str) -> None:
+        if self._key(folder) != ".":
+            raise self._refuse(folder)
+        self.close()
+        os.remove(self.get_pack_file(self.root))
+
+    def list_folders(self, folder: str) -> list[str]:
+        key = self._key(folder)
+        if key not in self._folders:
+            raise FileNotFoundError(folder)
+        return sorted(posixpath.basename(other) for other in self._folders
+                      if other != "." and posixpath.dirname(other) == ("" if key == "." else key))
+
+    def read_file(self, file: str) -> str:
+        key = self._key(file)
+        if key not in self._files:
+            raise FileNotFoundError(file)
+        return self._pack.read(key).decode("utf-8")
+
+    def write_file(self, file: str, text: str) -> None:
+        raise self._refuse(file)
+
+    def close(self) -> None:
+        self._pack.close()
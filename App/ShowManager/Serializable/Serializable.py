@@ -1,25 +1,39 @@
 import json
-import os
 from os import path
 from enum import Enum
+from typing import Callable
 
-from .Encodable import Encodable
+from .Encodable import Encodable, NON_SERIALIZABLE_PREFIX, is_value_legal, coerce_value
 from .FolderManager import FolderManager
 
 FILE_DATA_BULLET: str = "\nDATA>>>\n"
 
+FILE_SCHEMA_BULLET: str = "\nSCHEMA>>>"
+""" Marker preceding the schema version of a file, files without it are at version 0 """
+
 
 class BuildExitCode(Enum):
     SUCCESS, PATH_BROKEN, PROJECT_OVERRIDE, FOLDER_COLLISION = 0, 1, 2, 3
 
 
+class FileIssue(Enum):
+    MISSING_FILE, MISSING_HEADER, MISSING_DATA_BULLET, BAD_JSON, UNKNOWN_KEY, WRONG_TYPE, OUTDATED_SCHEMA, NEWER_SCHEMA, UNREADABLE_FILE = 0, 1, 2, 3, 4, 5, 6, 7, 8
+
+
 class Serializable(Encodable, FolderManager):
     """ Represents a class that can be serialized to a JSON file
 
     Inherits from:
         Encodable: Provides methods to encode and decode data from and to a JSON string.
         FolderManager: Manages a folder for storing the serialized file.
+
+    Class attributes:
+        _schema_version (int): Version of the file structure written by this class.
+        _migrations (dict): Maps each version above 0 to the step converting file data from the previous version.
     """
+    _schema_version: int = 0
+    _migrations: dict[int, Callable[[dict], dict]] = {}
+
     def __init__(self, folder_path: str = "", file_name: str = "", header: str = ""):
         FolderManager.__init__(self)
         if not self._folder:
@@ -29,10 +43,10 @@ class Serializable(Encodable, FolderManager):
 
     def build(self) -> BuildExitCode:
         """ Sets the main folder path for tracking show files and generate a folder to receive such files. """
-        if not os.path.exists(os.path.dirname(self._folder)):
+        if not self._storage.exists(path.dirname(self._folder)):
             return BuildExitCode.PATH_BROKEN
 
-        if os.path.exists(self._folder):
+        if self._storage.exists(self._folder):
             if self.file_exists():
                 return BuildExitCode.PROJECT_OVERRIDE
             else:
@@ -44,23 +58,42 @@ class Serializable(Encodable, FolderManager):
 
     def serialize(self) -> None:
         """  Serialize the object to a file. """
-        file_text = self.compose_file_data()
-        with open(self.get_file(), "w") as file:
-            file.write(file_text)
+        self._storage.write_file(self.get_file(), self.compose_file_data())
 
     def deserialize(self) -> None:
         """ Deserialize the object from a file. """
-        with open(self.get_file(), "r") as file:
-            file_string = file.read()
-        self.incorporate_file_data(file_string)
+        self.incorporate_file_data(self._storage.read_file(self.get_file()))
 
     def incorporate_file_data(self, file_string: str) -> None:
-        """ Incorporate file data from into the object. """
-        return self.decode(file_string.split(FILE_DATA_BULLET)[-1])
+        """ Incorporate file data from into the object, migrating it first if it was written with an older schema. """
+        version, data_string = self.split_file_data(file_string)
+        if version == self._schema_version:
+            return self.decode(data_string)
+        return self.decode(json.dumps(self.migrate_data(json.loads(data_string), version)))
 
     def compose_file_data(self) -> str:
         """ Compose the file data including the header and encoded object. """
-        return f"{self._header}{FILE_DATA_BULLET}{self.encode()}"
+        schema = f"{FILE_SCHEMA_BULLET}{self._schema_version}" if self._schema_version else ""
+        return f"{self._header}{schema}{FILE_DATA_BULLET}{self.encode()}"
+
+    @staticmethod
+    def split_file_data(file_string: str) -> tuple[int, str]:
+        """ Split file data into its schema version and its encoded object. """
+        head, _, data_string = file_string.rpartition(FILE_DATA_BULLET)
+        _, bullet, version = head.rpartition(FILE_SCHEMA_BULLET)
+        return int(version) if bullet and version.strip().isdigit() else 0, data_string
+
+    def get_schema_version(self) -> int:
+        """ Get the version of the file structure written by this object. """
+        return self._schema_version
+
+    def migrate_data(self, data: dict, version: int) -> dict:
+        """ Convert decoded file data from an older schema version to the current one. """
+        if version > self._schema_version:
+            raise ValueError(f"Schema version {version} is newer than {self._schema_version}")
+        for step_version in range(version + 1, self._schema_version + 1):
+            data = self._migrations[step_version](data)
+        return data
 
     def get_file(self) -> str:
         """ Get the full path of the serialized file. """
@@ -68,7 +101,7 @@ class Serializable(Encodable, FolderManager):
 
     def file_exists(self) -> bool:
         """ Check if the serialized file exists. """
-        return path.exists(self.get_file())
+        return self._storage.exists(self.get_file())
 
     def is_built(self) -> bool:
         return self.file_exists() and self.is_file_legal()
@@ -76,14 +109,64 @@ class Serializable(Encodable, FolderManager):
     def is_file_legal(self) -> bool:
         """ Check if the serialized file matches the object's structure. """
         try:
-            with open(self.get_file(), "r") as file:
-                file_string = file.read()
-            file_string = file_string.split(FILE_DATA_BULLET)[-1]
-            data = json.loads(file_string)
-            type_matrix = self.__dict__
-            for key, _ in data.items():
-                if key not in type_matrix:
-                    raise Exception("Data mismatch between python object to file text")
-        except:
+            file_string = self._storage.read_file(self.get_file())
+        except (OSError, ValueError):
             return False
-        return True
+        return not self.inspect_file_data(file_string)
+
+    def inspect_file_data(self, file_string: str) -> list[tuple[FileIssue, str]]:
+        """ List every way in which file data does not match the object's structure, each issue comes with a detail. """
+        issues = []
+        if not file_string.startswith(self._header):
+            issues.append((FileIssue.MISSING_HEADER, "File does not start with the expected header"))
+        if FILE_DATA_BULLET not in file_string:
+            issues.append((FileIssue.MISSING_DATA_BULLET, f"File has no {FILE_DATA_BULLET.strip()} marker"))
+
+        version, data_string = self.split_file_data(file_string)
+        try:
+            data = json.loads(data_string)
+        except ValueError as error:
+            return issues + [(FileIssue.BAD_JSON, str(error))]
+        if not isinstance(data, dict):
+            return issues + [(FileIssue.BAD_JSON, "File data is not a JSON object")]
+
+        if version > self._schema_version:
+            return issues + [(FileIssue.NEWER_SCHEMA, f"Schema version {version} is newer than {self._schema_version}")]
+        if version < self._schema_version:
+            issues.append((FileIssue.OUTDATED_SCHEMA, f"Schema version {version} is older than {self._schema_version}"))
+            data = self.migrate_data(data, version)
+
+        type_matrix = self.__dict__
+        for key, value in data.items():
+            if key.startswith(NON_SERIALIZABLE_PREFIX) or key not in type_matrix:
+                issues.append((FileIssue.UNKNOWN_KEY, key))
+            elif not is_value_legal(type_matrix[key], value):
+                issues.append((FileIssue.WRONG_TYPE, f"{key} = {value!r}"))
+        return issues
+
+    def repair_file_data(self, file_string: str) -> str:
+        """ Compose file data keeping every known field of the given file data that can be converted to its type.
+
+        File data written with a newer schema version is returned untouched.
+        """
+        version, data_string = self.split_file_data(file_string)
+        if version > self._schema_version:
+            return file_string
+        try:
+            data = json.loads(data_string)
+        except ValueError:
+            data = {}
+        if not isinstance(data, dict):
+            data = {}
+        elif version < self._schema_version:
+            data = self.migrate_data(data, version)
+
+        type_matrix = self.__dict__
+        for key, value in data.items():
+            if key.startswith(NON_SERIALIZABLE_PREFIX) or key not in type_matrix:
+                continue
+            try:
+                type_matrix[key] = coerce_value(type_matrix[key], value)
+            except (TypeError, ValueError):
+                continue
+        return self.compose_file_data()
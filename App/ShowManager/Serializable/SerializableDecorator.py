@@ -1,11 +1,26 @@
+from typing import Callable
+
 from .Serializable import Serializable
 
 
-def serializable(header_text: str = ""):
-    """ Decorator that adds serialization and deserialization features to a class """
+def serializable(header_text: str = "", schema_version: int = 0, migrations: dict[int, Callable[[dict], dict]] | None = None):
+    """ Decorator that adds serialization and deserialization features to a class
+
+    Args:
+        header_text: Text written at the top of every file.
+        schema_version: Version of the file structure, to be raised whenever fields are renamed, retyped or added.
+        migrations: Maps each version from 1 to schema_version to a step converting decoded file data from the previous version.
+    """
+    migrations = migrations or {}
+    missing_steps = [version for version in range(1, schema_version + 1) if version not in migrations]
+    if missing_steps:
+        raise ValueError(f"No migration step declared for schema versions {missing_steps}")
 
     def decorator(cls):
         class DecoratedClass(cls, Serializable):
+            _schema_version = schema_version
+            _migrations = migrations
+
             def __init__(self, folder="", *args, **kwargs):
                 Serializable.__init__(self, folder_path=folder, file_name=f"{cls.__name__}", header=header_text)
                 if not self._folder:
@@ -1,11 +1,12 @@
 from __future__ import annotations
-import os
+import threading
 import warnings
 from os import path
 from typing import Type
 from enum import Enum
 from .FolderManager import FolderManager
 from .Serializable import Serializable
+from .Storage import Storage
 
 
 class CreateElementExitCode(Enum):
@@ -17,7 +18,14 @@ class LoadFromFolderExitCode(Enum):
 
 
 class SerializableDict(dict, FolderManager):
-    """ This class describes a dictionary that manages serializable elements """
+    """ This class describes a dictionary that manages serializable elements
+
+    Elements dropped from memory by unload() are loaded back by any access to them, so references held to this
+    dictionary stay usable.
+    """
+
+    _unloaded: bool = False
+    """ True while the elements were dropped from memory, only their names are kept """
 
     def __init__(self, value_type: Type, folder_path: str = ""):
         dict.__init__(self)
@@ -25,6 +33,31 @@ class SerializableDict(dict, FolderManager):
         if not self._folder:
             self._folder = path.normpath(folder_path)
         self._value_type: Type = value_type
+        self._lock = threading.RLock()
+
+    def __getitem__(self, name: str):
+        """ Get an element, loading the elements back first if they were dropped from memory """
+        with self._lock:
+            self.ensure_loaded()
+            return dict.__getitem__(self, name)
+
+    def get(self, name: str, default=None):
+        """ Get an element or a default, loading the elements back first if they were dropped from memory """
+        with self._lock:
+            self.ensure_loaded()
+            return dict.get(self, name, default)
+
+    def values(self) -> list:
+        """ List the elements, loading them back first if they were dropped from memory """
+        with self._lock:
+            self.ensure_loaded()
+            return list(dict.values(self))
+
+    def items(self) -> list[tuple[str, object]]:
+        """ List the names and elements, loading the elements back first if they were dropped from memory """
+        with self._lock:
+            self.ensure_loaded()
+            return list(dict.items(self))
 
     def create_element(self, name: str, *args, **kwargs) -> CreateElementExitCode:
         """ Create an element in the dictionary, then build a folder and metafile for said element. """
@@ -40,6 +73,7 @@ class SerializableDict(dict, FolderManager):
         except: return CreateElementExitCode.CREATION_ERROR
 
         element.set_folder(element_folder)
+        element.set_storage(self._storage)
         element.create_folder()
         element.serialize()
         self[name] = element
@@ -52,15 +86,18 @@ class SerializableDict(dict, FolderManager):
         if not self.folder_exists():
             return LoadFromFolderExitCode.NO_FOLDER_FOUND
 
+        with self._lock:
+            return self._load_elements(perform_recursive_load)
+
+    def _load_elements(self, perform_recursive_load: bool) -> LoadFromFolderExitCode:
         self.clear()
-        for folder_name in os.listdir(self._folder):
+        self._unloaded = False
+        for folder_name in self._storage.list_folders(self._folder):
             path_to_folder = path.join(self._folder, folder_name)
 
-            if path.isfile(path_to_folder):
-                continue
-
             try:
                 element = self._value_type(path_to_folder)
+                element.set_storage(self._storage)
                 if element.file_exists():
                     element.deserialize()
             except:
@@ -74,6 +111,10 @@ class SerializableDict(dict, FolderManager):
 
         return LoadFromFolderExitCode.SUCCESS
 
+    def get_value_type(self) -> Type:
+        """ Get the type of the elements stored in this dictionary """
+        return self._value_type
+
     def get_names(self) -> list[str]:
         """ Get a list of elements names stored in this dictionary """
         return list(self.keys())
@@ -82,3 +123,49 @@ class SerializableDict(dict, FolderManager):
         """ Delete an element from the dictionary and its folder """
         self[key].delete_folder()
         del self[key]
+
+    def load_names(self) -> LoadFromFolderExitCode:
+        """ List the elements found in the folder without loading them, they are loaded on ensure_loaded """
+        if not self.folder_exists():
+            return LoadFromFolderExitCode.NO_FOLDER_FOUND
+
+        with self._lock:
+            self.clear()
+            for folder_name in self._storage.list_folders(self._folder):
+                self[folder_name] = None
+            self._unloaded = True
+        return LoadFromFolderExitCode.SUCCESS
+
+    def unload(self) -> None:
+        """ Drop every element from memory, keeping only their names """
+        with self._lock:
+            for key in self:
+                self[key] = None
+            self._unloaded = True
+
+    def is_unloaded(self) -> bool:
+        """ Check if the elements were dropped from memory """
+        return self._unloaded
+
+    def ensure_loaded(self) -> None:
+        """ Load the elements back from the storage if they were dropped from memory """
+        with self._lock:
+            if self._unloaded:
+                self.load_from_folder()
+
+    def transfer_to_storage(self, storage: Storage) -> None:
+        """ Copy this dictionary and every element below it into another storage, then keep working from it """
+        self.ensure_loaded()
+        self.set_storage(storage)
+        if not storage.exists(self._folder):
+            storage.create_folder(self._folder)
+        if isinstance(self, Serializable):
+            self.serialize()
+
+        for element in self.values():
+            if isinstance(element, SerializableDict):
+                element.transfer_to_storage(storage)
+            else:
+                element.set_storage(storage)
+                element.create_folder()
+                element.serialize()
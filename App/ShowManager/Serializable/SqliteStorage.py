@@ -0,0 +1,183 @@
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from os import path
+
+from .Storage import Storage, FOLDER_STORAGE
+
+DATABASE_FILE_NAME: str = "project.sqlite"
+""" Name of the database file created inside a project folder that uses the sqlite storage """
+
+ROOT_KEY: str = "."
+""" Key of the project folder itself, it is the parent of every top level folder and never has a row of its own """
+
+SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS folders (
+    path TEXT PRIMARY KEY,
+    parent TEXT NOT NULL,
+    name TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS folders_parent ON folders (parent);
+CREATE TABLE IF NOT EXISTS files (
+    folder TEXT NOT NULL,
+    name TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (folder, name)
+);
+"""
+
+
+class SqliteStorage(Storage):
+    """ Storage that keeps a whole project inside a single sqlite database file
+
+    The project folder itself lives on the file system and holds the database file, every folder and file below it
+    is a row in the database. Paths outside the project folder are answered by the file system.
+
+    Attributes:
+        _root (str): The project folder.
+        _database_file (str): The path to the database file.
+    """
+
+    def __init__(self, root: str):
+        self._root: str = path.normpath(root)
+        self._database_file: str = path.join(self._root, DATABASE_FILE_NAME)
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.RLock()
+        self._depth: int = 0
+
+    @staticmethod
+    def is_database_folder(folder: str) -> bool:
+        """ Check if a folder holds a project stored in a sqlite database. """
+        return path.isfile(path.join(folder, DATABASE_FILE_NAME))
+
+    def get_database_file(self) -> str:
+        """ Get the path of the database file. """
+        return self._database_file
+
+    def _key(self, target_path: str) -> str | None:
+        """ Convert a path into a database key, None if the path is outside the project folder. """
+        relative_path = path.relpath(path.normpath(target_path), self._root)
+        if relative_path == os.pardir or relative_path.startswith(os.pardir + os.sep):
+            return None
+        return relative_path.replace(os.sep, "/")
+
+    @staticmethod
+    def _split(key: str) -> tuple[str, str]:
+        """ Split a key into its parent key and its name. """
+        parent, _, name = key.rpartition("/")
+        return parent or ROOT_KEY, name
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = sqlite3.connect(self._database_file, check_same_thread=False)
+            self._connection.executescript(SCHEMA)
+        return self._connection
+
+    @contextmanager
+    def _transaction(self):
+        """ Run the enclosed statements in a transaction, nested transactions join the outermost one. """
+        with self._lock:
+            connection = self._connect()
+            self._depth += 1
+            try:
+                yield connection
+            except BaseException:
+                if self._depth == 1:
+                    connection.rollback()
+                raise
+            else:
+                if self._depth == 1:
+                    connection.commit()
+            finally:
+                self._depth -= 1
+
+    def exists(self, target_path: str) -> bool:
+        key = self._key(target_path)
+        if key is None or key == ROOT_KEY:
+            return FOLDER_STORAGE.exists(target_path)
+        if not path.isfile(self._database_file):
+            return False
+
+        folder, name = self._split(key)
+        with self._transaction() as connection:
+            row = connection.execute("SELECT 1 FROM folders WHERE path = ?", (key,)).fetchone()
+            if row is None:
+                row = connection.execute("SELECT 1 FROM files WHERE folder = ? AND name = ?", (folder, name)).fetchone()
+        return row is not None
+
+    def create_folder(self, folder: str) -> None:
+        key = self._key(folder)
+        if key is None:
+            raise ValueError(f"{folder} is outside of the project folder {self._root}")
+
+        if key == ROOT_KEY:
+            FOLDER_STORAGE.create_folder(self._root)
+            self._connect()
+            return
+
+        parent, name = self._split(key)
+        with self._transaction() as connection:
+            if parent != ROOT_KEY and connection.execute("SELECT 1 FROM folders WHERE path = ?", (parent,)).fetchone() is None:
+                raise FileNotFoundError(f"Parent folder of {folder} does not exist")
+            try:
+                connection.execute("INSERT INTO folders (path, parent, name) VALUES (?, ?, ?)", (key, parent, name))
+            except sqlite3.IntegrityError:
+                raise FileExistsError(f"{folder} already exists")
+
+    def delete_folder(self, folder: str) -> None:
+        key = self._key(folder)
+        if key is None:
+            raise ValueError(f"{folder} is outside of the project folder {self._root}")
+
+        if key == ROOT_KEY:
+            self.close()
+            FOLDER_STORAGE.delete_folder(self._root)
+            return
+
+        prefix = f"{key}/"
+        with self._transaction() as connection:
+            connection.execute("DELETE FROM folders WHERE path = ? OR substr(path, 1, ?) = ?", (key, len(prefix), prefix))
+            connection.execute("DELETE FROM files WHERE folder = ? OR substr(folder, 1, ?) = ?", (key, len(prefix), prefix))
+
+    def list_folders(self, folder: str) -> list[str]:
+        key = self._key(folder)
+        if key is None:
+            raise ValueError(f"{folder} is outside of the project folder {self._root}")
+
+        with self._transaction() as connection:
+            rows = connection.execute("SELECT name FROM folders WHERE parent = ? ORDER BY rowid", (key,)).fetchall()
+        return [name for name, in rows]
+
+    def read_file(self, file: str) -> str:
+        key = self._key(file)
+        if key is None:
+            return FOLDER_STORAGE.read_file(file)
+
+        folder, name = self._split(key)
+        with self._transaction() as connection:
+            row = connection.execute("SELECT data FROM files WHERE folder = ? AND name = ?", (folder, name)).fetchone()
+        if row is None:
+            raise FileNotFoundError(f"{file} not found in {self._database_file}")
+        return row[0]
+
+    def write_file(self, file: str, text: str) -> None:
+        key = self._key(file)
+        if key is None:
+            return FOLDER_STORAGE.write_file(file, text)
+
+        folder, name = self._split(key)
+        with self._transaction() as connection:
+            connection.execute("INSERT OR REPLACE INTO files (folder, name, data) VALUES (?, ?, ?)", (folder, name, text))
+
+    @contextmanager
+    def batch(self):
+        """ Commit every operation performed inside this context in a single transaction. """
+        with self._transaction():
+            yield self
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
@@ -0,0 +1,116 @@
+import os
+import threading
+import time
+from os import path
+
+DEFAULT_TTL: float = 2.0
+""" Seconds a folder listing is trusted by default, changes made by other programs are seen after at most that long """
+
+
+class StatCache:
+    """ Cache of folder listings answering existence checks from memory
+
+    A folder is listed with a single os.scandir call the first time anything inside it is checked, the listing then
+    answers every check on its entries, and the listing of the folder itself, until its time to live runs out. Changes
+    made through the storage owning the cache update the cached listings instead of waiting for them to expire, and a
+    listing taken while such a change happened is not kept.
+
+    Attributes:
+        ttl (float): Seconds a listing is trusted, 0 disables caching.
+        hits (int): Checks answered from memory.
+        misses (int): Checks that listed a folder.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_TTL):
+        self.ttl: float = ttl
+        self.hits, self.misses = 0, 0
+        self._listings: dict[str, tuple[float, dict[str, tuple[str, bool]] | None]] = {}
+        self._generation: int = 0
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _split(target_path: str) -> tuple[str, str]:
+        target_path = path.normcase(path.normpath(target_path))
+        return path.dirname(target_path) or os.curdir, path.basename(target_path)
+
+    def listing(self, folder: str) -> dict[str, tuple[str, bool]] | None:
+        """ Get the entries of a folder, None if the folder does not exist
+
+        Entries map each case normalized name to the name as listed and whether the entry is a folder.
+        """
+        folder = path.normcase(path.normpath(folder))
+        with self._lock:
+            cached = self._listings.get(folder)
+            if cached and time.monotonic() - cached[0] < self.ttl:
+                self.hits += 1
+                return cached[1]
+            self.misses += 1
+            generation = self._generation
+
+        try:
+            with os.scandir(folder) as entries:
+                entries = {path.normcase(entry.name): (entry.name, entry.is_dir()) for entry in entries}
+        except (FileNotFoundError, NotADirectoryError):
+            entries = None
+
+        with self._lock:
+            if self.ttl > 0 and generation == self._generation:
+                self._listings[folder] = (time.monotonic(), entries)
+        return entries
+
+    def exists(self, target_path: str) -> bool:
+        """ Check if a folder or file exists """
+        parent, name = self._split(target_path)
+        if name in ("", os.curdir, os.pardir):
+            return path.exists(target_path)
+        entries = self.listing(parent)
+        return entries is not None and name in entries
+
+    def list_folders(self, folder: str) -> list[str]:
+        """ List the names of the folders inside a folder """
+        entries = self.listing(folder)
+        if entries is None:
+            raise FileNotFoundError(folder)
+        with self._lock:
+            return [name for name, is_folder in entries.values() if is_folder]
+
+    def added(self, target_path: str, is_folder: bool) -> None:
+        """ Record a folder or file created through the storage """
+        parent, name = self._split(target_path)
+        with self._lock:
+            self._generation += 1
+            cached = self._listings.get(parent)
+            if cached and cached[1] is not None:
+                cached[1].setdefault(name, (path.basename(path.normpath(target_path)), is_folder))
+            elif cached:
+                del self._listings[parent]
+            if is_folder:
+                self._listings.pop(path.join(parent, name), None)
+
+    def removed(self, target_path: str) -> None:
+        """ Record a folder or file deleted through the storage, with everything inside it """
+        parent, name = self._split(target_path)
+        target_path = path.join(parent, name)
+        with self._lock:
+            self._generation += 1
+            cached = self._listings.get(parent)
+            if cached and cached[1] is not None:
+                cached[1].pop(name, None)
+            for folder in [folder for folder in self._listings if folder == target_path or folder.startswith(target_path + os.sep)]:
+                del self._listings[folder]
+
+    def invalidate(self, target_path: str) -> None:
+        """ Forget every listing of a path, of its parent and of everything inside it, after changes made elsewhere """
+        parent, name = self._split(target_path)
+        target_path = path.join(parent, name)
+        with self._lock:
+            self._generation += 1
+            self._listings.pop(parent, None)
+            for folder in [folder for folder in self._listings if folder == target_path or folder.startswith(target_path + os.sep)]:
+                del self._listings[folder]
+
+    def clear(self) -> None:
+        """ Forget every listing """
+        with self._lock:
+            self._generation += 1
+            self._listings.clear()
@@ -0,0 +1,116 @@
+import os
+import shutil
+from contextlib import contextmanager
+from os import path
+
+from .StatCache import StatCache
+
+
+class Storage:
+    """ Describes where folders and files managed by FolderManager and Serializable objects are kept
+
+    Methods:
+        exists(target_path): Check if a folder or file exists.
+        create_folder(folder): Create a folder.
+        delete_folder(folder): Delete a folder and everything inside it.
+        list_folders(folder): List the names of the folders inside a folder.
+        read_file(file): Read a text file.
+        write_file(file, text): Write a text file.
+        batch(): Context in which a group of operations is committed together.
+        invalidate(target_path): Forget anything cached about a path changed by other means than this storage.
+        close(): Release any resource held by the storage.
+    """
+
+    def exists(self, target_path: str) -> bool:
+        """ Check if a folder or file exists. """
+        raise NotImplementedError
+
+    def create_folder(self, folder: str) -> None:
+        """ Create a folder. """
+        raise NotImplementedError
+
+    def delete_folder(self, folder: str) -> None:
+        """ Delete a folder and everything inside it. """
+        raise NotImplementedError
+
+    def list_folders(self, folder: str) -> list[str]:
+        """ List the names of the folders inside a folder. """
+        raise NotImplementedError
+
+    def read_file(self, file: str) -> str:
+        """ Read a text file. """
+        raise NotImplementedError
+
+    def write_file(self, file: str, text: str) -> None:
+        """ Write a text file. """
+        raise NotImplementedError
+
+    @contextmanager
+    def batch(self):
+        """ Context in which a group of operations is committed together. """
+        yield self
+
+    def invalidate(self, target_path: str) -> None:
+        """ Forget anything cached about a path changed by other means than this storage. """
+
+    def close(self) -> None:
+        """ Release any resource held by the storage. """
+
+
+class FolderStorage(Storage):
+    """ Storage that keeps every folder and file on the file system, one folder per element
+
+    Existence checks and folder listings are answered by a stat cache when one is set, changes made by other programs
+    are then only seen once the listings they affect expire, or once invalidate() is called.
+
+    Attributes:
+        stat_cache (StatCache | None): The cache of folder listings, None checks the file system every time.
+    """
+
+    def __init__(self, stat_cache: StatCache | None = None):
+        self.stat_cache: StatCache | None = stat_cache
+
+    def set_stat_cache(self, stat_cache: StatCache | None) -> None:
+        """ Set the cache of folder listings, None checks the file system every time """
+        self.stat_cache = stat_cache
+
+    def exists(self, target_path: str) -> bool:
+        if self.stat_cache:
+            return self.stat_cache.exists(target_path)
+        return path.exists(target_path)
+
+    def create_folder(self, folder: str) -> None:
+        os.mkdir(folder)
+        if self.stat_cache:
+            self.stat_cache.added(folder, True)
+
+    def delete_folder(self, folder: str) -> None:
+        try:
+            shutil.rmtree(folder)
+        finally:
+            if self.stat_cache:
+                self.stat_cache.removed(folder)
+
+    def list_folders(self, folder: str) -> list[str]:
+        if self.stat_cache:
+            return self.stat_cache.list_folders(folder)
+        with os.scandir(folder) as entries:
+            return [entry.name for entry in entries if not entry.is_file()]
+
+    def read_file(self, file: str) -> str:
+        with open(file, "r") as stream:
+            return stream.read()
+
+    def write_file(self, file: str, text: str) -> None:
+        with open(file, "w") as stream:
+            stream.write(text)
+        if self.stat_cache:
+            self.stat_cache.added(file, False)
+
+    def invalidate(self, target_path: str) -> None:
+        if self.stat_cache:
+            self.stat_cache.invalidate(target_path)
+
+
+FOLDER_STORAGE: FolderStorage = FolderStorage()
+""" Default storage shared by every object that was not given a storage of its own """
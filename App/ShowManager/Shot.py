@@ -7,10 +7,17 @@ Advanced Technical Arts Course
 This file contains serialized shot information."""
 
 
-@serializable(FILE_HEADER)
+def add_clip_number_and_length(data: dict) -> dict:
+    """ Schema 1, clip_number and length became persisted fields """
+    data.setdefault("clip_number", 0)
+    data.setdefault("length", time().isoformat())
+    return data
+
+
+@serializable(FILE_HEADER, schema_version=1, migrations={1: add_clip_number_and_length})
 class Shot:
     def __init__(self):
-        self.clip_number: int
-        self.length: time
+        self.clip_number: int = 0
+        self.length: time = time()
         self.characters: set[str] = set()
         self.environments: set[str] = set()
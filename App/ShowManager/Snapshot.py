@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import json
+import mmap
+import struct
+from multiprocessing import shared_memory
+from typing import Callable, Iterator
+
+MAGIC: bytes = b"SHOWSNAP"
+""" First bytes of every snapshot """
+
+HEADER = struct.Struct("<8sQ")
+""" Magic followed by the byte size of the index """
+
+
+def _compact(json_string: str) -> bytes:
+    return json.dumps(json.loads(json_string), separators=(",", ":")).encode("utf-8")
+
+
+def compose_snapshot(manager) -> bytes:
+    """ Compose the snapshot bytes of a project
+
+    A snapshot is a header, a JSON index and a data region. The index maps each show name to the offset and size of
+    its data, and to the offset and size of the data of each of its shots. Data is the compact encoding of each element.
+    """
+    data = bytearray()
+    index = {}
+
+    def append(json_string: str) -> list[int]:
+        encoded = _compact(json_string)
+        data.extend(encoded)
+        return [len(data) - len(encoded), len(encoded)]
+
+    for show_name in manager.get_names():
+        show = manager[show_name]
+        index[show_name] = [*append(show.encode()), {shot_name: append(shot.encode()) for shot_name, shot in show.items()}]
+
+    index_bytes = json.dumps(index, separators=(",", ":")).encode("utf-8")
+    return HEADER.pack(MAGIC, len(index_bytes)) + index_bytes + bytes(data)
+
+
+class ProjectSnapshot:
+    """ Immutable view of a whole project held in shared memory or in a memory-mapped file
+
+    A loaded Manager publishes a snapshot once, worker processes attach to it by name or path, without copying it and
+    without reading any metafile, then look up shows and shots. Only the records asked for are decoded.
+    """
+
+    def __init__(self, buffer: memoryview, shared: shared_memory.SharedMemory | None = None, mapped: mmap.mmap | None = None):
+        magic, index_size = HEADER.unpack_from(buffer)
+        if magic != MAGIC:
+            raise ValueError("Buffer does not hold a project snapshot")
+        self._buffer: memoryview = buffer.toreadonly()
+        self._shared = shared
+        self._mapped = mapped
+        self._index: dict[str, list] = json.loads(bytes(buffer[HEADER.size:HEADER.size + index_size]))
+        self._data_start: int = HEADER.size + index_size
+
+    @classmethod
+    def publish(cls, manager, name: str | None = None) -> ProjectSnapshot:
+        """ Publish a project in a new shared memory block, the publisher must unlink it once workers are done """
+        snapshot = compose_snapshot(manager)
+        shared = shared_memory.SharedMemory(name, create=True, size=len(snapshot))
+        shared.buf[:len(snapshot)] = snapshot
+        return cls(shared.buf, shared=shared)
+
+    @classmethod
+    def attach(cls, name: str) -> ProjectSnapshot:
+        """ Attach to a snapshot published in shared memory by another process
+
+        Workers started through multiprocessing share the publisher's resource tracker, which only frees the block
+        when the publisher unlinks it. Unrelated processes should run on Python 3.13 or later, where attaching does not
+        register the block with a tracker of their own that would free it when they exit.
+        """
+        try:
+            shared = shared_memory.SharedMemory(name, track=False)
+        except TypeError:
+            shared = shared_memory.SharedMemory(name)
+        return cls(shared.buf, shared=shared)
+
+    @staticmethod
+    def save(manager, file: str) -> None:
+        """ Write a project snapshot to a file, to be opened with open() """
+        with open(file, "wb") as stream:
+            stream.write(compose_snapshot(manager))
+
+    @classmethod
+    def open(cls, file: str) -> ProjectSnapshot:
+        """ Memory map a snapshot file written with save() """
+        with open(file, "rb") as stream:
+            mapped = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(memoryview(mapped), mapped=mapped)
+
+    def get_name(self) -> str | None:
+        """ Get the shared memory name workers attach to, None for file snapshots """
+        return self._shared.name if self._shared else None
+
+    def _decode(self, location: list) -> dict:
+        start = self._data_start + location[0]
+        return json.loads(bytes(self._buffer[start:start + location[1]]))
+
+    def get_show_names(self) -> list[str]:
+        """ Get the names of the shows """
+        return list(self._index)
+
+    def get_shot_names(self, show_name: str) -> list[str]:
+        """ Get the names of the shots of a show """
+        return list(self._index[show_name][2])
+
+    def get_show_data(self, show_name: str) -> dict:
+        """ Get the data of a show """
+        return self._decode(self._index[show_name])
+
+    def get_shot_data(self, show_name: str, shot_name: str) -> dict:
+        """ Get the data of a shot """
+        return self._decode(self._index[show_name][2][shot_name])
+
+    def find_shots(self, predicate: Callable[[str, str, dict], bool]) -> Iterator[tuple[str, str, dict]]:
+        """ Yield the show name, shot name and data of every shot for which predicate(show, shot, data) is true """
+        for show_name, (_, _, shots) in self._index.items():
+            for shot_name, location in shots.items():
+                data = self._decode(location)
+                if predicate(show_name, shot_name, data):
+                    yield show_name, shot_name, data
+
+    def close(self) -> None:
+        """ Detach from the snapshot, the snapshot must not be used afterwards """
+        self._buffer.release()
+        if self._shared:
+            self._shared.close()
+        if self._mapped:
+            self._mapped.close()
+
+    def unlink(self) -> None:
+        """ Free the shared memory block, called once by the publisher after every worker is done """
+        if self._shared:
+            self._shared.unlink()
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+from array import array
+from datetime import time
+
+DEFAULT_FRAME_RATE: float = 24.0
+""" Frames per second used to convert shot lengths into frames """
+
+
+def length_in_seconds(length: time | str | None) -> float:
+    """ Convert a shot length into seconds, lengths typed as text are parsed as iso formatted times """
+    if isinstance(length, str):
+        try: length = time.fromisoformat(length)
+        except ValueError: return 0.0
+    if not isinstance(length, time):
+        return 0.0
+    return length.hour * 3600 + length.minute * 60 + length.second + length.microsecond / 1_000_000
+
+
+class Vocabulary:
+    """ Maps the names of a categorical field to dense integer codes and back """
+
+    def __init__(self):
+        self.codes: dict[str, int] = {}
+        self.names: list[str] = []
+
+    def encode(self, name: str) -> int:
+        """ Get the code of a name, registering it if it was never seen """
+        code = self.codes.get(name)
+        if code is None:
+            code = self.codes[name] = len(self.names)
+            self.names.append(name)
+        return code
+
+
+class ProjectStatistics:
+    """ Keeps the shot data of a project in columns, with running totals maintained row by row
+
+    Every shot is a row, rows of removed shots are recycled. Shows, characters and environments are stored as
+    vocabulary codes, and per show and per code totals are updated as rows change, so rollups never walk the shots.
+
+    Methods:
+        rebuild(): Rebuild every column from the manager.
+        update_shot(show_name, shot_name): Refresh the row of a shot.
+        remove_shot(show_name, shot_name): Drop the row of a shot.
+        remove_show(show_name): Drop the rows of every shot of a show.
+        runtime_per_show(in_frames): Total length of the shots of each show.
+        shot_counts(): Number of shots of each show.
+        character_frequency(): Number of shots each character appears in.
+        environment_frequency(): Number of shots each environment appears in.
+        clip_number_gaps(): Clip numbers missing between the first and last clip of each show.
+    """
+
+    def __init__(self, manager, frame_rate: float = DEFAULT_FRAME_RATE):
+        self._manager = manager
+        self.frame_rate: float = frame_rate
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """ Rebuild every column from the manager """
+        self._rows: dict[tuple[str, str], int] = {}
+        self._free_rows: list[int] = []
+
+        self._show_codes: array = array("q")
+        self._lengths: array = array("d")
+        self._clip_numbers: array = array("q")
+        self._alive: array = array("b")
+        self._character_codes: list[tuple[int, ...]] = []
+        self._environment_codes: list[tuple[int, ...]] = []
+
+        self._shows, self._characters, self._environments = Vocabulary(), Vocabulary(), Vocabulary()
+        self._show_runtimes: array = array("d")
+        self._show_shot_counts: array = array("q")
+        self._character_counts: array = array("q")
+        self._environment_counts: array = array("q")
+
+        for show_name in self._manager.get_names():
+            for shot_name in self._manager[show_name].get_names():
+                self.update_shot(show_name, shot_name)
+
+    @staticmethod
+    def _encode_all(vocabulary: Vocabulary, counts: array, names) -> tuple[int, ...]:
+        codes = tuple(vocabulary.encode(str(name)) for name in names)
+        counts.extend([0] * (len(vocabulary.names) - len(counts)))
+        return codes
+
+    def _show_code(self, show_name: str) -> int:
+        code = self._shows.encode(show_name)
+        if code == len(self._show_runtimes):
+            self._show_runtimes.append(0.0)
+            self._show_shot_counts.append(0)
+        return code
+
+    def _release_row(self, row: int) -> None:
+        show_code = self._show_codes[row]
+        self._show_runtimes[show_code] -= self._lengths[row]
+        self._show_shot_counts[show_code] -= 1
+        for code in self._character_codes[row]:
+            self._character_counts[code] -= 1
+        for code in self._environment_codes[row]:
+            self._environment_counts[code] -= 1
+        self._alive[row] = 0
+
+    def update_shot(self, show_name: str, shot_name: str) -> None:
+        """ Refresh the row of a shot, creating it when the shot is new """
+        shot = self._manager[show_name][shot_name]
+        row = self._rows.get((show_name, shot_name))
+        if row is None:
+            row = self._free_rows.pop() if self._free_rows else self._append_row()
+            self._rows[show_name, shot_name] = row
+        elif self._alive[row]:
+            self._release_row(row)
+
+        show_code = self._show_code(show_name)
+        self._show_codes[row] = show_code
+        self._lengths[row] = length_in_seconds(getattr(shot, "length", None))
+        try: self._clip_numbers[row] = int(getattr(shot, "clip_number", 0))
+        except (TypeError, ValueError): self._clip_numbers[row] = 0
+        self._character_codes[row] = self._encode_all(self._characters, self._character_counts, shot.characters)
+        self._environment_codes[row] = self._encode_all(self._environments, self._environment_counts, shot.environments)
+        self._alive[row] = 1
+
+        self._show_runtimes[show_code] += self._lengths[row]
+        self._show_shot_counts[show_code] += 1
+        for code in self._character_codes[row]:
+            self._character_counts[code] += 1
+        for code in self._environment_codes[row]:
+            self._environment_counts[code] += 1
+
+    def _append_row(self) -> int:
+        self._show_codes.append(0)
+        self._lengths.append(0.0)
+        self._clip_numbers.append(0)
+        self._alive.append(0)
+        self._character_codes.append(())
+        self._environment_codes.append(())
+        return len(self._alive) - 1
+
+    def remove_shot(self, show_name: str, shot_name: str) -> None:
+        """ Drop the row of a shot """
+        row = self._rows.pop((show_name, shot_name), None)
+        if row is not None:
+            self._release_row(row)
+            self._free_rows.append(row)
+
+    def remove_show(self, show_name: str) -> None:
+        """ Drop the rows of every shot of a show """
+        for key in [key for key in self._rows if key[0] == show_name]:
+            self.remove_shot(*key)
+
+    def runtime_per_show(self, in_frames: bool = False) -> dict[str, float]:
+        """ Total length of the shots of each show, in seconds or in frames """
+        scale = self.frame_rate if in_frames else 1.0
+        return {name: runtime * scale for name, runtime, count in zip(self._shows.names, self._show_runtimes, self._show_shot_counts) if count}
+
+    def shot_counts(self) -> dict[str, int]:
+        """ Number of shots of each show """
+        return {name: count for name, count in zip(self._shows.names, self._show_shot_counts) if count}
+
+    def character_frequency(self) -> dict[str, int]:
+        """ Number of shots each character appears in """
+        return {name: count for name, count in zip(self._characters.names, self._character_counts) if count}
+
+    def environment_frequency(self) -> dict[str, int]:
+        """ Number of shots each environment appears in """
+        return {name: count for name, count in zip(self._environments.names, self._environment_counts) if count}
+
+    def clip_number_gaps(self) -> dict[str, list[int]]:
+        """ Clip numbers missing between the first and last clip of each show, shots numbered zero are unnumbered and ignored """
+        clip_numbers: dict[int, set[int]] = {}
+        for show_code, clip_number, alive in zip(self._show_codes, self._clip_numbers, self._alive):
+            if alive and clip_number > 0:
+                clip_numbers.setdefault(show_code, set()).add(clip_number)
+
+        gaps = {}
+        for show_code, numbers in clip_numbers.items():
+            missing = sorted(set(range(min(numbers), max(numbers) + 1)) - numbers)
+            if missing:
+                gaps[self._shows.names[show_code]] = missing
+        return gaps
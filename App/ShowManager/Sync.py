@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+from enum import Enum
+from os import path
+
+from .Serializable.PackStorage import PACK_EXTENSION
+
+MANIFEST_FILE_NAME: str = ".sync_manifest.json"
+""" Name of the file, kept in a project folder, caching the hash of each metafile and the state of the last syncs """
+
+META_EXTENSION: str = ".meta"
+
+MAX_DEPTH: int = 2
+""" Depth of the deepest metafiles, project files are at 0, show files at 1 and shot files at 2 """
+
+
+class SyncDirection(Enum):
+    PUSH, PULL, BOTH = 0, 1, 2
+
+
+class SyncExitCode(Enum):
+    SUCCESS, NO_PROJECT_FOUND, CONFLICTS, UNSUPPORTED_STORAGE = 0, 1, 2, 3
+
+
+def hash_file(file: str) -> str:
+    """ Get the sha256 hash of a file """
+    digest = hashlib.sha256()
+    with open(file, "rb") as stream:
+        for chunk in iter(lambda: stream.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class HashManifest:
+    """ Cache of the hashes of every metafile of a project, and of the state it was in after each sync
+
+    The packs of archived shows, kept in the project folder, are tracked like metafiles, so archiving a show replaces
+    its metafiles by its pack on the other side instead of only deleting them.
+
+    A file is only hashed again when its size or modification time changed since it was last hashed.
+
+    Attributes:
+        root (str): The project folder.
+        files (dict): Relative path to [size, mtime_ns, hash] of each metafile.
+        synced (dict): Peer project folder to {relative path: hash} as it was after the last sync with that peer.
+    """
+
+    def __init__(self, root: str):
+        self.root: str = path.normpath(root)
+        self.files: dict[str, list] = {}
+        self.synced: dict[str, dict[str, str]] = {}
+        self.load()
+
+    def get_file(self) -> str:
+        """ Get the path of the manifest file """
+        return path.join(self.root, MANIFEST_FILE_NAME)
+
+    def load(self) -> None:
+        """ Load the manifest from the project folder, a missing or broken manifest is treated as empty """
+        try:
+            with open(self.get_file(), "r") as stream:
+                data = json.load(stream)
+            self.files, self.synced = data["files"], data["synced"]
+        except (OSError, ValueError, KeyError):
+            self.files, self.synced = {}, {}
+
+    def save(self) -> None:
+        """ Save the manifest into the project folder """
+        with open(self.get_file(), "w") as stream:
+            json.dump({"files": self.files, "synced": self.synced}, stream, indent=4)
+
+    def _list_meta_files(self, folder: str = "", depth: int = 0) -> list[str]:
+        files = []
+        with os.scandir(path.join(self.root, folder)) as entries:
+            for entry in entries:
+                relative_path = f"{folder}/{entry.name}" if folder else entry.name
+                if entry.is_file() and (entry.name.endswith(META_EXTENSION) or depth == 0 and entry.name.endswith(PACK_EXTENSION)):
+                    files.append(relative_path)
+                elif entry.is_dir() and depth < MAX_DEPTH:
+                    files += self._list_meta_files(relative_path, depth + 1)
+        return files
+
+    def scan(self) -> dict[str, str]:
+        """ Get the hash of every metafile of the project, hashing only the files that changed """
+        hashes = {}
+        files = {}
+        for relative_path in self._list_meta_files():
+            stat = os.stat(path.join(self.root, relative_path))
+            cached = self.files.get(relative_path)
+            if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+                files[relative_path] = cached
+            else:
+                files[relative_path] = [stat.st_size, stat.st_mtime_ns, hash_file(path.join(self.root, relative_path))]
+            hashes[relative_path] = files[relative_path][2]
+        self.files = files
+        return hashes
+
+    def record(self, relative_path: str, file_hash: str | None) -> None:
+        """ Record a file that was just written with a known hash, or removed when the hash is None """
+        if file_hash is None:
+            self.files.pop(relative_path, None)
+            return
+        stat = os.stat(path.join(self.root, relative_path))
+        self.files[relative_path] = [stat.st_size, stat.st_mtime_ns, file_hash]
+
+
+class SyncReport:
+    """ Outcome of a sync between two project folders, every list holds relative metafile paths
+
+    Attributes:
+        exit_code (SyncExitCode): The overall result.
+        pushed (list[str]): Files copied or deleted on the other project.
+        pulled (list[str]): Files copied or deleted on this project.
+        conflicts (list[str]): Files changed on both sides since the last sync, left untouched.
+        skipped (list[str]): Files that differ but were not transferred because of the sync direction.
+    """
+
+    def __init__(self, exit_code: SyncExitCode = SyncExitCode.SUCCESS):
+        self.exit_code: SyncExitCode = exit_code
+        self.pushed: list[str] = []
+        self.pulled: list[str] = []
+        self.conflicts: list[str] = []
+        self.skipped: list[str] = []
+
+
+def _transfer(relative_path: str, source: HashManifest, target: HashManifest, file_hash: str) -> None:
+    """ Copy a metafile from the source to the target project """
+    target_file = path.join(target.root, relative_path)
+    os.makedirs(path.dirname(target_file), exist_ok=True)
+    shutil.copy2(path.join(source.root, relative_path), target_file)
+    target.record(relative_path, file_hash)
+
+
+def _delete(relative_path: str, target: HashManifest, deleted: set[str]) -> bool:
+    """ Delete a metafile from the target project, with the folder of its element and everything inside it
+
+    The folder holds the asset and task files of the element as well, so leaving it behind would load the element again
+    with its data reset. The folder is kept, and False returned, when it holds a metafile that is not deleted as well.
+    Project metafiles and packs are deleted alone.
+    """
+    folder = path.dirname(relative_path)
+    if not folder:
+        if path.exists(path.join(target.root, relative_path)):
+            os.remove(path.join(target.root, relative_path))
+        target.record(relative_path, None)
+        return True
+
+    prefix = folder + "/"
+    if any(other.startswith(prefix) and other not in deleted for other in target.files):
+        return False
+    if path.isdir(path.join(target.root, folder)):
+        shutil.rmtree(path.join(target.root, folder))
+    for other in [other for other in target.files if other.startswith(prefix)]:
+        target.record(other, None)
+    return True
+
+
+def sync_folders(local_root: str, remote_root: str, direction: SyncDirection = SyncDirection.BOTH) -> SyncReport:
+    """ Transfer the metafiles that differ between two project folders
+
+    Each side is compared with the state both were in after their last sync, a file changed on one side only is
+    transferred to the other side, a file changed differently on both sides is reported as a conflict. Deleting a
+    metafile deletes the folder of its element, once every copy is done, and is reported as a conflict instead when
+    that folder still holds a metafile kept by the sync.
+    """
+    local, remote = HashManifest(local_root), HashManifest(remote_root)
+    local_key, remote_key = path.realpath(local.root), path.realpath(remote.root)
+    local_hashes, remote_hashes = local.scan(), remote.scan()
+    base = local.synced.get(remote_key, {})
+
+    report = SyncReport()
+    synced = {}
+    deletions: list[tuple[str, HashManifest, list[str]]] = []
+    for relative_path in sorted(set(local_hashes) | set(remote_hashes) | set(base)):
+        local_hash, remote_hash, base_hash = local_hashes.get(relative_path), remote_hashes.get(relative_path), base.get(relative_path)
+
+        if local_hash == remote_hash:
+            pass
+        elif remote_hash == base_hash:
+            if direction == SyncDirection.PULL:
+                report.skipped.append(relative_path)
+                continue
+            if local_hash is None:
+                deletions.append((relative_path, remote, report.pushed))
+                continue
+            _transfer(relative_path, local, remote, local_hash)
+            report.pushed.append(relative_path)
+        elif local_hash == base_hash:
+            if direction == SyncDirection.PUSH:
+                report.skipped.append(relative_path)
+                continue
+            if remote_hash is None:
+                deletions.append((relative_path, local, report.pulled))
+                continue
+            _transfer(relative_path, remote, local, remote_hash)
+            report.pulled.append(relative_path)
+            local_hash = remote_hash
+        else:
+            report.conflicts.append(relative_path)
+            continue
+
+        if local_hash is not None:
+            synced[relative_path] = local_hash
+
+    for relative_path, target, transferred in deletions:
+        deleted = {other for other, other_target, _ in deletions if other_target is target}
+        (transferred if _delete(relative_path, target, deleted) else report.conflicts).append(relative_path)
+    for paths in (report.pushed, report.pulled, report.conflicts):
+        paths.sort()
+
+    for relative_path in report.skipped + report.conflicts:
+        if relative_path in base:
+            synced[relative_path] = base[relative_path]
+
+    local.synced[remote_key], remote.synced[local_key] = synced, synced
+    local.save()
+    remote.save()
+
+    if report.conflicts:
+        report.exit_code = SyncExitCode.CONFLICTS
+    return report
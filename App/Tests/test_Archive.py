@@ -0,0 +1,86 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from App.ShowManager.Manager import Manager, ArchiveExitCode
+from App.ShowManager.Residency import ResidencyManager
+from App.ShowManager.Scheduler import Scheduler, SchedulerExitCode, Task
+from App.ShowManager.SchemaMigration import migrate_project
+from App.ShowManager.Scrub import scrub_project, ScrubExitCode
+from App.ShowManager.Serializable.PackStorage import PackStorage
+from App.Tests.test_setup import SetupBaseDirectory
+
+
+class TestArchive(SetupBaseDirectory):
+    def setUp(self) -> None:
+        super().setUp()
+        self.manager = Manager()
+        self.manager.set_folder(os.path.join(self.test_folder_path, "archive"))
+        self.manager.build()
+        self.manager.create_element("show")
+        self.show_folder = self.manager["show"].get_folder()
+        for shot_name in ["sh010", "sh020"]:
+            self.manager["show"].create_element(shot_name)
+        self.manager["show"]["sh010"].characters = {"ana"}
+        self.manager["show"]["sh010"].serialize()
+        with open(os.path.join(self.show_folder, "sh010", "plate.exr"), "w") as stream:
+            stream.write("plate")
+
+    def tearDown(self) -> None:
+        self.manager.delete_folder()
+        super().tearDown()
+
+    def reload(self, residency: ResidencyManager | None = None) -> Manager:
+        manager = Manager()
+        manager.set_folder(self.manager.get_folder())
+        manager.set_residency(residency)
+        manager.load_from_folder()
+        return manager
+
+    def test_archive_and_unarchive(self):
+        self.assertEqual(self.manager.archive("show"), ArchiveExitCode.SUCCESS)
+        self.assertFalse(os.path.exists(self.show_folder))
+        self.assertTrue(PackStorage.is_packed_folder(self.show_folder))
+        self.assertEqual(self.manager.archive("show"), ArchiveExitCode.ALREADY_ARCHIVED)
+
+        for manager in [self.manager, self.reload(), self.reload(ResidencyManager(1))]:
+            self.assertListEqual(manager.get_names(), ["show"])
+            self.assertTrue(manager.is_archived(manager["show"]))
+            self.assertListEqual(sorted(manager["show"].get_names()), ["sh010", "sh020"])
+            self.assertSetEqual(manager["show"]["sh010"].characters, {"ana"})
+
+        with self.assertRaises(PermissionError):
+            self.manager["show"]["sh010"].serialize()
+        with self.assertRaises(PermissionError):
+            self.manager["show"].create_element("sh030")
+
+        self.assertEqual(self.manager.unarchive("show"), ArchiveExitCode.SUCCESS)
+        self.assertEqual(self.manager.unarchive("show"), ArchiveExitCode.NOT_ARCHIVED)
+        self.assertFalse(PackStorage.is_packed_folder(self.show_folder))
+        with open(os.path.join(self.show_folder, "sh010", "plate.exr")) as stream:
+            self.assertEqual(stream.read(), "plate")
+        self.manager["show"].create_element("sh030")
+        self.assertListEqual(sorted(self.reload()["show"].get_names()), ["sh010", "sh020", "sh030"])
+
+    def test_delete_archived(self):
+        self.manager.archive("show")
+        self.manager.delete("show")
+        self.assertFalse(PackStorage.is_packed_folder(self.show_folder))
+        self.assertListEqual(self.reload().get_names(), [])
+
+    def test_tools_skip_archived(self):
+        self.manager.create_element("other")
+        self.manager.archive("show")
+
+        scheduler = Scheduler(self.manager, [Task("noop", print)], executor_factory=ThreadPoolExecutor)
+        self.assertListEqual(scheduler.list_shots(), [])
+        report = scheduler.run([("show", "sh010")])
+        self.assertEqual(report.exit_code, SchedulerExitCode.SUCCESS)
+        self.assertListEqual(report.archived, [("show", "sh010")])
+        self.assertListEqual(report.succeeded, [])
+
+        report = scrub_project(self.manager)
+        self.assertEqual(report.exit_code, ScrubExitCode.CLEAN)
+        self.assertListEqual(report.skipped, [self.show_folder])
+        self.assertEqual(report.files_checked, 2)
+        self.assertListEqual(migrate_project(self.manager).skipped, [self.show_folder])
+        self.assertListEqual(scrub_project(self.reload()).skipped, [self.show_folder])
@@ -0,0 +1,86 @@
+import os
+import threading
+import time
+from unittest import mock
+
+from App.ShowManager import AssetRegistry as asset_registry
+from App.ShowManager.AssetRegistry import AssetRegistry, scan_show, show_changes_since
+from App.ShowManager.Manager import Manager
+from App.Tests.test_setup import SetupBaseDirectory
+
+
+class TestAssetRegistry(SetupBaseDirectory):
+    def setUp(self) -> None:
+        super().setUp()
+        self.manager = Manager()
+        self.manager.set_folder(os.path.join(self.test_folder_path, "assets"))
+        self.manager.build()
+        self.manager.create_element("show")
+        self.show = self.manager["show"]
+        for shot_name in ["sh010", "sh020"]:
+            self.show.create_element(shot_name)
+        self.shot_folder = self.show["sh010"].get_folder()
+
+    def tearDown(self) -> None:
+        self.manager.delete_folder()
+        super().tearDown()
+
+    def write(self, relative_path: str, content: str) -> None:
+        file = os.path.join(self.shot_folder, relative_path)
+        os.makedirs(os.path.dirname(file), exist_ok=True)
+        with open(file, "w") as stream:
+            stream.write(content)
+
+    def test_incremental_scan(self):
+        self.write("plate.exr", "plate")
+        self.write("renders/beauty.exr", "beauty")
+        changes = AssetRegistry(self.shot_folder).scan()
+        self.assertListEqual(changes.added, ["plate.exr", "renders/beauty.exr"], "Metafiles or the registry were tracked")
+
+        with mock.patch.object(asset_registry, "hash_file", wraps=asset_registry.hash_file) as hash_file:
+            self.assertTrue(AssetRegistry(self.shot_folder).scan().is_empty())
+            self.assertEqual(hash_file.call_count, 0, "Unchanged files were hashed again")
+
+            file = os.path.join(self.shot_folder, "plate.exr")
+            os.utime(file, ns=(0, 0))
+            self.assertTrue(AssetRegistry(self.shot_folder).scan().is_empty(), "Touched file reported as modified")
+
+            self.write("plate.exr", "PLATE")
+            os.remove(os.path.join(self.shot_folder, "renders/beauty.exr"))
+            changes = AssetRegistry(self.shot_folder).scan()
+            self.assertListEqual(changes.modified, ["plate.exr"])
+            self.assertListEqual(changes.removed, ["renders/beauty.exr"])
+            self.assertEqual(hash_file.call_count, 2)
+
+    def test_show_changes_since(self):
+        self.write("plate.exr", "plate")
+        scan_show(self.show)
+        since = time.time()
+        self.write("comp.nk", "comp")
+        changes = scan_show(self.show)
+        self.assertListEqual(changes["sh010"].added, ["comp.nk"])
+        self.assertTrue(changes["sh020"].is_empty())
+
+        changes = show_changes_since(self.show, since)
+        self.assertListEqual(changes["sh010"].added, ["comp.nk"])
+        self.assertListEqual(show_changes_since(self.show, 0)["sh010"].added, ["comp.nk", "plate.exr"])
+
+        manager = Manager()
+        manager.set_folder(self.manager.get_folder())
+        manager.load_from_folder()
+        self.assertListEqual(sorted(manager["show"].get_names()), ["sh010", "sh020"])
+
+    def test_show_hashes_shots_together(self):
+        for shot_name in ["sh010", "sh020"]:
+            with open(os.path.join(self.show[shot_name].get_folder(), "plate.exr"), "w") as stream:
+                stream.write(shot_name)
+        barrier = threading.Barrier(2, timeout=5)
+
+        def hash_file(file: str) -> str:
+            barrier.wait()
+            return file
+
+        with mock.patch.object(asset_registry, "hash_file", hash_file):
+            changes = scan_show(self.show, max_workers=2)
+        self.assertListEqual([changes[name].added for name in ["sh010", "sh020"]], [["plate.exr"], ["plate.exr"]],
+                             "Files of different shots were not hashed at the same time")
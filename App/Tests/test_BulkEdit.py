@@ -0,0 +1,53 @@
+import os
+
+from App.ShowManager.BulkEdit import bulk_edit_shots, select_shots, BulkOperation, BulkEditExitCode
+from App.ShowManager.Manager import Manager
+from App.Tests.test_setup import SetupBaseDirectory
+
+
+class TestBulkEdit(SetupBaseDirectory):
+    def setUp(self) -> None:
+        super().setUp()
+        self.manager = Manager()
+        self.manager.set_folder(os.path.join(self.test_folder_path, "bulk"))
+        self.manager.build()
+        self.manager.create_element("show")
+        self.show = self.manager["show"]
+        for shot_name in ["sh010", "sh020", "sh030", "extra"]:
+            self.show.create_element(shot_name)
+        self.show["sh010"].environments = {"forest"}
+
+    def tearDown(self) -> None:
+        self.manager.delete_folder()
+        super().tearDown()
+
+    def reload(self):
+        show = Manager()
+        show.set_folder(self.manager.get_folder())
+        show.load_from_folder()
+        return show["show"]
+
+    def test_select_shots(self):
+        self.assertListEqual(select_shots(self.show, "sh0*"), ["sh010", "sh020", "sh030"])
+        self.assertListEqual(select_shots(self.show, lambda name, shot: "forest" in shot.environments), ["sh010"])
+
+    def test_add_and_remove(self):
+        report = bulk_edit_shots(self.show, "sh0*", "environments", BulkOperation.ADD, "forest, lake")
+        self.assertEqual(report.exit_code, BulkEditExitCode.SUCCESS)
+        self.assertListEqual(report.changed, ["sh010", "sh020", "sh030"])
+        self.assertSetEqual(self.reload()["sh020"].environments, {"forest", "lake"})
+
+        report = bulk_edit_shots(self.show, "*", "environments", BulkOperation.REMOVE, "forest")
+        self.assertListEqual(report.changed, ["sh010", "sh020", "sh030"], "Unchanged shot was written")
+        self.assertSetEqual(self.reload()["sh030"].environments, {"lake"})
+
+    def test_set(self):
+        report = bulk_edit_shots(self.show, "sh0*", "clip_number", BulkOperation.SET, "7")
+        self.assertEqual(len(report.changed), 3)
+        self.assertEqual(self.reload()["sh010"].clip_number, 7)
+
+    def test_errors(self):
+        self.assertEqual(bulk_edit_shots(self.show, "*", "unknown", BulkOperation.SET, 1).exit_code, BulkEditExitCode.UNKNOWN_FIELD)
+        self.assertEqual(bulk_edit_shots(self.show, "*", "clip_number", BulkOperation.ADD, 1).exit_code, BulkEditExitCode.INVALID_OPERATION)
+        self.assertEqual(bulk_edit_shots(self.show, "*", "clip_number", BulkOperation.SET, "x").exit_code, BulkEditExitCode.INVALID_VALUE)
+        self.assertEqual(bulk_edit_shots(self.show, "none*", "clip_number", BulkOperation.SET, 1).exit_code, BulkEditExitCode.NO_MATCH)
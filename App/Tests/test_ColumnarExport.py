@@ -0,0 +1,47 @@
+import os
+from datetime import date, time
+
+from App.ShowManager.ColumnarExport import export_columns, ColumnarProject, ColumnKind, SHOWS_TABLE, SHOTS_TABLE
+from App.ShowManager.Manager import Manager
+from App.Tests.test_setup import SetupBaseDirectory
+
+
+class TestColumnarExport(SetupBaseDirectory):
+    def setUp(self) -> None:
+        super().setUp()
+        self.manager = Manager()
+        self.manager.set_folder(os.path.join(self.test_folder_path, "columnar"))
+        self.manager.build()
+        self.manager.create_element("one")
+        self.manager["one"].release = date(2020, 7, 23)
+        self.manager["one"].certification = {"CA": "PG"}
+        self.manager.create_element("two")
+        for show_name, shot_name, characters in [("one", "a", {"hero", "villain"}), ("one", "b", set()), ("two", "c", {"hero"})]:
+            self.manager[show_name].create_element(shot_name)
+            self.manager[show_name][shot_name].characters = characters
+            self.manager[show_name][shot_name].length = time(0, 0, 30)
+        self.export_folder = os.path.join(self.test_folder_path, "export")
+        export_columns(self.manager, self.export_folder)
+
+    def tearDown(self) -> None:
+        self.manager.delete_folder()
+        super().tearDown()
+
+    def test_round_trip(self):
+        with ColumnarProject(self.export_folder) as project:
+            self.assertListEqual(project.tables(), [SHOWS_TABLE, SHOTS_TABLE])
+            self.assertEqual(project.row_count(SHOWS_TABLE), 2)
+            self.assertEqual(project.row_count(SHOTS_TABLE), 3)
+            self.assertEqual(project.columns(SHOTS_TABLE)["characters"], ColumnKind.SET)
+
+            show_names = project.column(SHOWS_TABLE, "name")
+            self.assertListEqual([show_names[row] for row in range(len(show_names))], ["one", "two"])
+            self.assertEqual(project.column(SHOWS_TABLE, "release")[0], date(2020, 7, 23).toordinal())
+            self.assertDictEqual(project.column(SHOWS_TABLE, "certification")[0], {"CA": "PG"})
+
+            self.assertListEqual(project.column(SHOTS_TABLE, "show").tolist(), [0, 0, 1])
+            self.assertEqual(sum(project.column(SHOTS_TABLE, "length")), 90)
+            characters = project.column(SHOTS_TABLE, "characters")
+            self.assertSetEqual(characters[0], {"hero", "villain"})
+            self.assertSetEqual(characters[1], set())
+            self.assertDictEqual(characters.counts(), {"hero": 2, "villain": 1})
@@ -0,0 +1,81 @@
+import os
+import unittest
+
+from App.ShowManager import Proxy
+from App.ShowManager.BulkEdit import BulkOperation
+from App.ShowManager.Events import ChangeEvent, ChangeType, EventBus
+from App.Tests.test_setup import SetupBaseDirectory
+
+
+class TestEventBus(unittest.TestCase):
+    def test_filters(self):
+        bus = EventBus()
+        every, show_updates = [], []
+        bus.subscribe(every.append)
+        token = bus.subscribe(show_updates.append, [ChangeType.UPDATED, ChangeType.RELOADED], "show")
+
+        bus.publish(ChangeType.CREATED, "show", "sh010")
+        bus.publish(ChangeType.UPDATED, "other", "sh010", ["characters"])
+        bus.publish(ChangeType.UPDATED, "show", "sh010", ["characters"])
+        bus.publish(ChangeType.RELOADED)
+        self.assertEqual(len(every), 4)
+        self.assertListEqual(show_updates, [ChangeEvent(ChangeType.UPDATED, "show", "sh010", ["characters"]),
+                                            ChangeEvent(ChangeType.RELOADED)])
+
+        bus.unsubscribe(token)
+        bus.publish(ChangeType.UPDATED, "show")
+        self.assertEqual(len(show_updates), 2)
+
+    def test_has_subscribers(self):
+        bus = EventBus()
+        self.assertFalse(bus.has_subscribers(ChangeType.CREATED, "show"))
+        token = bus.subscribe(print, [ChangeType.CREATED], "show")
+        self.assertTrue(bus.has_subscribers(ChangeType.CREATED, "show"))
+        self.assertFalse(bus.has_subscribers(ChangeType.CREATED, "other"))
+        bus.unsubscribe(token)
+        self.assertFalse(bus.has_subscribers(ChangeType.CREATED, "show"))
+
+
+class TestProxyEvents(SetupBaseDirectory):
+    def setUp(self) -> None:
+        super().setUp()
+        self.received = []
+        self.token = Proxy.events.subscribe(self.received.append)
+        Proxy.install(os.path.join(self.test_folder_path, "events"))
+
+    def tearDown(self) -> None:
+        Proxy.events.unsubscribe(self.token)
+        Proxy.manager.delete_folder()
+        super().tearDown()
+
+    def test_mutations_publish(self):
+        Proxy.create_show("show")
+        Proxy.set_show_data("show", {"description": "Pilot"})
+        Proxy.create_shot("show", "sh010")
+        Proxy.set_shot_data("show", "sh010", {"clip_number": 3})
+        Proxy.bulk_edit("show", "*", "characters", BulkOperation.ADD, "ana")
+        Proxy.delete_shot("show", "sh010")
+        Proxy.delete_show("show")
+        self.assertListEqual(self.received, [ChangeEvent(ChangeType.RELOADED),
+                                             ChangeEvent(ChangeType.CREATED, "show"),
+                                             ChangeEvent(ChangeType.UPDATED, "show", fields=["description"]),
+                                             ChangeEvent(ChangeType.CREATED, "show", "sh010"),
+                                             ChangeEvent(ChangeType.UPDATED, "show", "sh010", ["clip_number"]),
+                                             ChangeEvent(ChangeType.UPDATED, "show", "sh010", ["characters"]),
+                                             ChangeEvent(ChangeType.DELETED, "show", "sh010"),
+                                             ChangeEvent(ChangeType.DELETED, "show")])
+
+    def test_invalid_data_refused(self):
+        Proxy.create_show("show")
+        Proxy.create_shot("show", "sh010")
+        del self.received[:]
+        Proxy.set_shot_data("show", "sh010", {"length": "5"})
+        Proxy.set_shot_data("show", "sh010", {"_folder": "elsewhere"})
+        Proxy.set_show_data("show", {"rating": "high"})
+        self.assertListEqual(self.received, [], "Invalid data was persisted")
+
+        Proxy.set_shot_data("show", "sh010", {"clip_number": "7", "length": "00:00:05"})
+        Proxy.load(Proxy.manager.get_folder())
+        self.assertEqual(Proxy.manager["show"]["sh010"].clip_number, 7)
+        self.assertEqual(Proxy.manager["show"]["sh010"].length.second, 5)
+        Proxy.delete_show("show")
@@ -0,0 +1,45 @@
+import threading
+from unittest import TestCase
+
+from App.ShowManager.Prefetcher import Prefetcher
+
+
+class TestPrefetcher(TestCase):
+    def setUp(self) -> None:
+        self.prefetcher = Prefetcher(max_concurrent=1, max_pending=3)
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.done = []
+
+    def tearDown(self) -> None:
+        self.release.set()
+        self.prefetcher.shutdown()
+
+    def block(self, name: str) -> None:
+        self.started.set()
+        self.release.wait(5)
+        self.done.append(name)
+
+    def test_prefetch_and_deduplicate(self):
+        future = self.prefetcher.prefetch(self.done.append, "a")
+        self.assertIsNone(self.prefetcher.prefetch(self.done.append, "a"), "Repeated request was not ignored")
+        future.result(5)
+        self.assertListEqual(self.done, ["a"])
+        self.assertEqual(self.prefetcher.completed, 1)
+
+    def test_cap_and_cancel(self):
+        running = self.prefetcher.prefetch(self.block, "running")
+        self.started.wait(5)
+        queued = [self.prefetcher.prefetch(self.block, name) for name in ["b", "c", "d"]]
+        self.assertIsNone(queued[-1], "Request above the pending cap was not dropped")
+        self.assertEqual(self.prefetcher.dropped, 1)
+
+        self.prefetcher.cancel()
+        self.release.set()
+        running.result(5)
+        self.assertListEqual(self.done, ["running"], "Cancelled requests ran")
+        self.assertTrue(all(future.cancelled() for future in queued[:-1]))
+
+    def test_errors_are_counted(self):
+        self.prefetcher.prefetch(lambda: 1 / 0).result(5)
+        self.assertEqual(self.prefetcher.failed, 1)
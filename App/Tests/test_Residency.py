@@ -0,0 +1,92 @@
+import os
+
+from App.ShowManager import Proxy
+from App.ShowManager.Manager import Manager
+from App.ShowManager.Residency import ResidencyManager
+from App.Tests.test_setup import SetupBaseDirectory
+
+
+class TestResidency(SetupBaseDirectory):
+    def setUp(self) -> None:
+        super().setUp()
+        self.folder_path = os.path.join(self.test_folder_path, "residency")
+        builder = Manager()
+        builder.set_folder(self.folder_path)
+        builder.build()
+        for show_name in ["one", "two", "three"]:
+            builder.create_element(show_name)
+            for shot_name in ["a", "b"]:
+                builder[show_name].create_element(shot_name)
+
+        self.manager = Manager()
+        self.manager.set_folder(self.folder_path)
+        self.residency = ResidencyManager(max_shows=2)
+        self.manager.set_residency(self.residency)
+        self.manager.load_from_folder()
+
+    def tearDown(self) -> None:
+        self.manager.delete_folder()
+        super().tearDown()
+
+    def test_names_without_loading(self):
+        self.assertTrue(all(show.is_unloaded() for show in dict.values(self.manager)), "Shows were loaded eagerly")
+        self.assertListEqual(sorted(dict.__getitem__(self.manager, "one").get_names()), ["a", "b"], "Shot names were not kept")
+
+    def test_lru_eviction(self):
+        self.assertIsNotNone(self.manager["one"]["a"], "Accessed show was not loaded back")
+        self.manager["two"]
+        self.manager["one"]
+        self.manager["three"]
+        self.assertTrue(dict.__getitem__(self.manager, "two").is_unloaded(), "Least recently used show was not evicted")
+        self.assertFalse(dict.__getitem__(self.manager, "one").is_unloaded(), "Recently used show was evicted")
+        self.assertDictEqual(self.residency.get_counters(), {"hits": 1, "misses": 3, "evictions": 1, "resident_shows": 2,
+                                                             "resident_bytes": self.residency.get_counters()["resident_bytes"]})
+
+    def test_byte_budget(self):
+        self.residency.max_shows = None
+        self.residency.max_bytes = 1
+        self.manager["one"]
+        self.manager["two"]
+        self.assertEqual(self.residency.get_counters()["resident_shows"], 1, "Byte budget was not enforced")
+
+    def test_remove_residency(self):
+        self.manager.set_residency(None)
+        self.assertFalse(any(show.is_unloaded() for show in self.manager.values()), "Shows were not loaded back")
+
+    def test_held_reference_after_eviction(self):
+        show = self.manager["one"]
+        self.manager["two"]
+        self.manager["three"]
+        self.assertTrue(dict.__getitem__(self.manager, "one").is_unloaded(), "Show was not evicted")
+        self.assertIsNotNone(show["a"], "Evicted show did not load back through a held reference")
+        self.assertTrue(all(shot is not None for show in self.manager.values() for shot in show.values()),
+                        "Iterating evicted shows gave unloaded shots")
+
+    def test_size_refreshed_when_shots_added(self):
+        self.manager["one"]
+        size = self.residency.get_counters()["resident_bytes"]
+        self.manager["one"].create_element("c")
+        self.manager["one"]
+        self.assertGreater(self.residency.get_counters()["resident_bytes"], size, "Added shot was not counted")
+
+    def test_pinned_show_not_evicted(self):
+        self.residency.set_pinned(["one"])
+        self.manager["one"]
+        self.manager["two"]
+        self.manager["three"]
+        self.assertFalse(dict.__getitem__(self.manager, "one").is_unloaded(), "Pinned show was evicted")
+        self.assertTrue(dict.__getitem__(self.manager, "two").is_unloaded())
+        self.assertEqual(self.residency.get_free_slots(), 1)
+        self.assertTrue(self.manager.is_show_unloaded("two"))
+        self.assertTrue(dict.__getitem__(self.manager, "two").is_unloaded(), "Checking residency loaded the show")
+
+    def test_shows_to_warm(self):
+        Proxy.load(self.folder_path)
+        self.assertListEqual(Proxy.get_shows_to_warm(["one", "two", "three"], 8), [], "Shows loaded eagerly were warmed")
+        Proxy.manager.set_residency(ResidencyManager(max_shows=2))
+        try:
+            Proxy.manager["two"]
+            Proxy.pin_show("one")
+            self.assertListEqual(Proxy.get_shows_to_warm(["one", "two", "three"], 8), ["one"], "Budget or loaded shows ignored")
+        finally:
+            Proxy.manager.set_residency(None)
@@ -0,0 +1,88 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from App.ShowManager.Manager import Manager
+from App.ShowManager.Scheduler import Scheduler, SchedulerExitCode, Task, TaskStatus, get_task_status
+from App.Tests.test_setup import SetupBaseDirectory
+
+
+def log_run(shot_folder: str, task_name: str) -> None:
+    with open(os.path.join(shot_folder, "runs.log"), "a") as stream:
+        stream.write(task_name + "\n")
+
+
+def validate(show_name: str, shot_name: str, shot_folder: str, data: dict) -> None:
+    log_run(shot_folder, "validate")
+
+
+def publish(show_name: str, shot_name: str, shot_folder: str, data: dict) -> None:
+    log_run(shot_folder, "publish")
+    if "broken" in data["environments"]:
+        raise RuntimeError("Can not publish a broken shot")
+
+
+def thumbnail(show_name: str, shot_name: str, shot_folder: str, data: dict) -> None:
+    log_run(shot_folder, "thumbnail")
+
+
+class TestScheduler(SetupBaseDirectory):
+    def setUp(self) -> None:
+        super().setUp()
+        self.manager = Manager()
+        self.manager.set_folder(os.path.join(self.test_folder_path, "scheduler"))
+        self.manager.build()
+        self.manager.create_element("show")
+        self.show = self.manager["show"]
+        for shot_name in ["sh010", "sh020"]:
+            self.show.create_element(shot_name)
+        self.tasks = [Task("thumbnail", thumbnail, ["publish"]),
+                      Task("publish", publish, ["validate"], retries=1),
+                      Task("validate", validate, priority=1)]
+
+    def tearDown(self) -> None:
+        self.manager.delete_folder()
+        super().tearDown()
+
+    def runs(self, shot_name: str) -> list[str]:
+        log = os.path.join(self.show[shot_name].get_folder(), "runs.log")
+        if not os.path.exists(log):
+            return []
+        with open(log) as stream:
+            return stream.read().split()
+
+    def test_run_and_resume(self):
+        self.show["sh020"].environments = {"broken"}
+        self.show["sh020"].serialize()
+        report = Scheduler(self.manager, self.tasks, 2).run()
+        self.assertEqual(report.exit_code, SchedulerExitCode.TASKS_FAILED)
+        self.assertListEqual(self.runs("sh010"), ["validate", "publish", "thumbnail"])
+        self.assertListEqual(self.runs("sh020"), ["validate", "publish", "publish"], "Failed task was not retried")
+        self.assertListEqual(report.blocked, [("show", "sh020", "thumbnail")])
+        self.assertEqual(get_task_status(self.show["sh020"], "publish"), TaskStatus.FAILED)
+
+        self.show["sh020"].environments = set()
+        self.show["sh020"].serialize()
+        self.assertEqual(get_task_status(self.show["sh020"], "validate"), TaskStatus.STALE)
+        report = Scheduler(self.manager, self.tasks, executor_factory=ThreadPoolExecutor).run()
+        self.assertEqual(report.exit_code, SchedulerExitCode.SUCCESS)
+        self.assertEqual(len(report.skipped), 3, "Up to date tasks ran again")
+        self.assertListEqual(self.runs("sh010"), ["validate", "publish", "thumbnail"])
+        self.assertListEqual(self.runs("sh020")[3:], ["validate", "publish", "thumbnail"])
+
+        reloaded = Manager()
+        reloaded.set_folder(self.manager.get_folder())
+        reloaded.load_from_folder()
+        self.assertEqual(get_task_status(reloaded["show"]["sh020"], "thumbnail"), TaskStatus.SUCCEEDED)
+
+    def test_priority_picks_next_job(self):
+        tasks = [Task("setup", validate, priority=2), Task("urgent", validate, ["setup"], priority=3),
+                 Task("chore", validate, priority=1)]
+        report = Scheduler(self.manager, tasks, 1, ThreadPoolExecutor).run([("show", "sh010")])
+        self.assertListEqual([job[2] for job in report.succeeded], ["setup", "urgent", "chore"],
+                             "Released job waited behind a lower priority job")
+
+    def test_invalid_graph(self):
+        with self.assertRaises(ValueError):
+            Scheduler(self.manager, [Task("a", validate, ["b"]), Task("b", validate, ["a"])])
+        with self.assertRaises(ValueError):
+            Scheduler(self.manager, [Task("a", validate, ["missing"])])
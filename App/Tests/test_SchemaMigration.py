@@ -0,0 +1,58 @@
+import json
+import os
+
+from App.ShowManager.Manager import Manager
+from App.ShowManager.SchemaMigration import migrate_project, SchemaMigrationExitCode
+from App.ShowManager.Serializable.Serializable import FILE_DATA_BULLET, FILE_SCHEMA_BULLET
+from App.ShowManager.Serializable.SerializableDecorator import serializable
+from App.Tests.test_setup import SetupBaseDirectory
+
+
+class TestSchemaMigration(SetupBaseDirectory):
+    def setUp(self) -> None:
+        super().setUp()
+        self.manager = Manager()
+        self.manager.set_folder(os.path.join(self.test_folder_path, "schema"))
+        self.manager.build()
+        self.manager.create_element("show")
+        for shot_name in ["a", "b"]:
+            self.manager["show"].create_element(shot_name)
+        self.old_shot = self.manager["show"]["a"]
+        with open(self.old_shot.get_file(), "w") as stream:
+            stream.write(f"{self.old_shot._header}{FILE_DATA_BULLET}{json.dumps({'characters': ['hero']})}")
+
+    def tearDown(self) -> None:
+        self.manager.delete_folder()
+        super().tearDown()
+
+    def read_old_shot(self) -> str:
+        with open(self.old_shot.get_file(), "r") as stream:
+            return stream.read()
+
+    def test_missing_steps(self):
+        with self.assertRaises(ValueError):
+            serializable("HEADER", schema_version=2, migrations={1: dict})
+
+    def test_load_migrates_in_memory(self):
+        self.old_shot.deserialize()
+        self.assertSetEqual(self.old_shot.characters, {"hero"})
+
+    def test_dry_run(self):
+        original = self.read_old_shot()
+        report = migrate_project(self.manager, dry_run=True)
+        self.assertListEqual(report.migrated, [self.old_shot.get_folder()])
+        self.assertEqual(self.read_old_shot(), original, "Dry run wrote a file")
+
+    def test_migrate_project(self):
+        progress = []
+        report = migrate_project(self.manager, progress=lambda done, total: progress.append((done, total)))
+        self.assertEqual(report.exit_code, SchemaMigrationExitCode.SUCCESS)
+        self.assertEqual(report.files_checked, 4)
+        self.assertListEqual(report.migrated, [self.old_shot.get_folder()])
+        self.assertEqual(progress[-1], (4, 4))
+
+        version, data_string = self.old_shot.split_file_data(self.read_old_shot())
+        self.assertIn(f"{FILE_SCHEMA_BULLET}1{FILE_DATA_BULLET}", self.read_old_shot())
+        self.assertEqual(version, 1)
+        self.assertDictEqual(json.loads(data_string), {"clip_number": 0, "length": "00:00:00", "characters": ["hero"], "environments": []})
+        self.assertListEqual(migrate_project(self.manager).migrated, [], "Second migration was not a no-op")
@@ -0,0 +1,63 @@
+import json
+import os
+
+from App.ShowManager.Manager import Manager
+from App.ShowManager.Scrub import scrub_project, ScrubExitCode
+from App.ShowManager.Serializable.Serializable import FileIssue, FILE_DATA_BULLET
+from App.Tests.test_setup import SetupBaseDirectory
+
+
+class TestScrub(SetupBaseDirectory):
+    def setUp(self) -> None:
+        super().setUp()
+        self.manager = Manager()
+        self.manager.set_folder(os.path.join(self.test_folder_path, "scrub"))
+        self.manager.build()
+        self.manager.create_element("show")
+        for shot_name in ["a", "b", "c"]:
+            self.manager["show"].create_element(shot_name)
+
+    def tearDown(self) -> None:
+        self.manager.delete_folder()
+        super().tearDown()
+
+    def write(self, file: str, text: str) -> None:
+        with open(file, "w") as stream:
+            stream.write(text)
+
+    def test_clean_project(self):
+        report = scrub_project(self.manager)
+        self.assertEqual(report.exit_code, ScrubExitCode.CLEAN)
+        self.assertEqual(report.files_checked, 5)
+
+    def test_find_and_repair(self):
+        show = self.manager["show"]
+        self.write(show["a"].get_file(), json.dumps({"clip_number": "12", "unknown": 1}))
+        self.write(show["b"].get_file(), f"{show['b']._header}{FILE_DATA_BULLET}{{not json")
+        os.mkdir(os.path.join(show.get_folder(), "orphan"))
+
+        report = scrub_project(self.manager)
+        self.assertEqual(report.exit_code, ScrubExitCode.ISSUES_FOUND)
+        self.assertDictEqual(report.count(), {
+            FileIssue.MISSING_HEADER: 1, FileIssue.MISSING_DATA_BULLET: 1, FileIssue.UNKNOWN_KEY: 1,
+            FileIssue.WRONG_TYPE: 1, FileIssue.BAD_JSON: 1, FileIssue.MISSING_FILE: 1, FileIssue.OUTDATED_SCHEMA: 1})
+        self.assertFalse(show["a"].is_file_legal())
+
+        report = scrub_project(self.manager, repair=True)
+        self.assertEqual(report.exit_code, ScrubExitCode.ISSUES_REPAIRED)
+        self.assertTrue(all(issue.repaired for issue in report.issues))
+        self.assertEqual(scrub_project(self.manager).exit_code, ScrubExitCode.CLEAN)
+
+        show["a"].deserialize()
+        self.assertEqual(show["a"].clip_number, 12, "Repair did not convert a value of the wrong type")
+
+    def test_undecodable_file(self):
+        with open(self.manager["show"]["c"].get_file(), "wb") as stream:
+            stream.write(b"\xff\xfe\x00garbage")
+
+        report = scrub_project(self.manager)
+        self.assertEqual(report.files_checked, 5, "Scrub stopped at the undecodable file")
+        self.assertDictEqual(report.count(), {FileIssue.UNREADABLE_FILE: 1})
+
+        scrub_project(self.manager, repair=True)
+        self.assertEqual(scrub_project(self.manager).exit_code, ScrubExitCode.CLEAN)
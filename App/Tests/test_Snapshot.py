@@ -0,0 +1,47 @@
+import os
+
+from App.ShowManager.Manager import Manager
+from App.ShowManager.Snapshot import ProjectSnapshot
+from App.Tests.test_setup import SetupBaseDirectory
+
+
+class TestSnapshot(SetupBaseDirectory):
+    def setUp(self) -> None:
+        super().setUp()
+        self.manager = Manager()
+        self.manager.set_folder(os.path.join(self.test_folder_path, "snapshot"))
+        self.manager.build()
+        self.manager.create_element("show")
+        self.manager["show"].description = "A show"
+        for shot_name, characters in [("a", {"hero"}), ("b", {"villain"})]:
+            self.manager["show"].create_element(shot_name)
+            self.manager["show"][shot_name].characters = characters
+
+    def tearDown(self) -> None:
+        self.manager.delete_folder()
+        super().tearDown()
+
+    def check(self, snapshot: ProjectSnapshot):
+        self.assertListEqual(snapshot.get_show_names(), ["show"])
+        self.assertListEqual(snapshot.get_shot_names("show"), ["a", "b"])
+        self.assertEqual(snapshot.get_show_data("show")["description"], "A show")
+        self.assertListEqual(snapshot.get_shot_data("show", "b")["characters"], ["villain"])
+        found = list(snapshot.find_shots(lambda show, shot, data: "hero" in data["characters"]))
+        self.assertListEqual([(show, shot) for show, shot, _ in found], [("show", "a")])
+
+    def test_shared_memory(self):
+        published = ProjectSnapshot.publish(self.manager)
+        try:
+            attached = ProjectSnapshot.attach(published.get_name())
+            self.check(attached)
+            attached.close()
+        finally:
+            published.close()
+            published.unlink()
+
+    def test_file(self):
+        file = os.path.join(self.test_folder_path, "project.snapshot")
+        ProjectSnapshot.save(self.manager, file)
+        snapshot = ProjectSnapshot.open(file)
+        self.check(snapshot)
+        snapshot.close()
@@ -0,0 +1,90 @@
+import os
+
+from App.ShowManager.Manager import Manager, MigrateExitCode
+from App.ShowManager.Serializable.SerializableDict import LoadFromFolderExitCode
+from App.ShowManager.Serializable.Serializable import BuildExitCode
+from App.ShowManager.Serializable.SqliteStorage import SqliteStorage, DATABASE_FILE_NAME
+from App.ShowManager.Serializable.StatCache import StatCache
+from App.ShowManager.Serializable.Storage import FOLDER_STORAGE
+from App.Tests.test_setup import SetupBaseDirectory
+
+
+class TestSqliteStorage(SetupBaseDirectory):
+    def setUp(self) -> None:
+        super().setUp()
+        self.folder_path = os.path.join(self.test_folder_path, "database_project")
+        self.manager = Manager()
+        self.manager.set_folder(self.folder_path)
+        self.manager.use_database()
+
+    def tearDown(self) -> None:
+        self.manager.delete_folder()
+        super().tearDown()
+
+    def test_build(self):
+        self.assertEqual(self.manager.build(), BuildExitCode.SUCCESS)
+        self.assertTrue(os.path.isfile(os.path.join(self.folder_path, DATABASE_FILE_NAME)), "Database file was not created")
+        self.assertFalse(os.path.exists(self.manager.get_file()), "Meta file was written to the file system")
+        self.assertTrue(self.manager.file_exists(), "Meta file is not in the database")
+        self.assertEqual(self.manager.build(), BuildExitCode.PROJECT_OVERRIDE)
+
+    def test_create_load_delete(self):
+        self.manager.build()
+        self.manager.create_element("show")
+        self.manager["show"].create_element("shot")
+        self.manager["show"]["shot"].characters.add("hero")
+        self.manager["show"]["shot"].serialize()
+        self.assertFalse(os.path.exists(os.path.join(self.folder_path, "show")), "Show folder was written to the file system")
+
+        loaded = Manager()
+        loaded.set_folder(self.folder_path)
+        self.assertIsInstance(loaded.get_storage(), SqliteStorage, "Database project was not detected")
+        loaded.load_from_folder()
+        self.assertListEqual(loaded.get_names(), ["show"])
+        self.assertSetEqual(loaded["show"]["shot"].characters, {"hero"})
+
+        loaded["show"].delete("shot")
+        loaded.delete("show")
+        self.assertListEqual(self.manager.get_storage().list_folders(self.folder_path), [])
+        loaded.get_storage().close()
+
+    def test_migrate_to_database(self):
+        self.manager.set_storage(FOLDER_STORAGE)
+        self.manager.build()
+        for show_name in ["one", "two"]:
+            self.manager.create_element(show_name)
+            self.manager[show_name].create_element("shot")
+
+        migrated = Manager()
+        migrated.set_folder(self.folder_path)
+        self.assertEqual(migrated.migrate_to_database(), MigrateExitCode.SUCCESS)
+        self.assertEqual(migrated.migrate_to_database(), MigrateExitCode.ALREADY_MIGRATED)
+        migrated.get_storage().close()
+
+        loaded = Manager()
+        loaded.set_folder(self.folder_path)
+        self.assertIsInstance(loaded.get_storage(), SqliteStorage, "Migrated project was not detected")
+        loaded.load_from_folder()
+        self.assertListEqual(sorted(loaded.get_names()), ["one", "two"])
+        self.assertListEqual(loaded["two"].get_names(), ["shot"])
+        loaded.get_storage().close()
+
+    def test_stat_cache(self):
+        FOLDER_STORAGE.set_stat_cache(StatCache(60))
+        try:
+            self.assertFalse(self.manager.folder_exists())
+            self.assertEqual(self.manager.build(), BuildExitCode.SUCCESS)
+            self.assertTrue(self.manager.folder_exists(), "Cached listing missed the project folder")
+
+            loaded = Manager()
+            loaded.set_folder(self.folder_path)
+            self.assertEqual(loaded.load_from_folder(), LoadFromFolderExitCode.SUCCESS)
+            loaded.get_storage().close()
+
+            self.manager.delete_folder()
+            self.assertFalse(os.path.exists(self.folder_path), "Project folder was not deleted")
+            self.assertFalse(self.manager.folder_exists(), "Cached listing kept the deleted project folder")
+            self.manager.use_database()
+            self.assertEqual(self.manager.build(), BuildExitCode.SUCCESS)
+        finally:
+            FOLDER_STORAGE.set_stat_cache(None)
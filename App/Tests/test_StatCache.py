@@ -0,0 +1,60 @@
+import os
+
+from App.ShowManager.Manager import Manager
+from App.ShowManager.Serializable.StatCache import StatCache
+from App.ShowManager.Serializable.Storage import FolderStorage, FOLDER_STORAGE
+from App.Tests.test_setup import SetupBaseDirectory
+
+
+class TestStatCache(SetupBaseDirectory):
+    def setUp(self) -> None:
+        super().setUp()
+        self.cache = StatCache(ttl=60)
+        self.storage = FolderStorage(self.cache)
+        self.folder = os.path.join(self.test_folder_path, "cache")
+        os.mkdir(self.folder)
+
+    def tearDown(self) -> None:
+        FOLDER_STORAGE.set_stat_cache(None)
+        self.storage.delete_folder(self.folder)
+        super().tearDown()
+
+    def test_checks_served_from_memory(self):
+        self.storage.create_folder(os.path.join(self.folder, "a"))
+        self.storage.write_file(os.path.join(self.folder, "a", "A.meta"), "")
+        for _ in range(3):
+            self.assertTrue(self.storage.exists(os.path.join(self.folder, "a")))
+            self.assertTrue(self.storage.exists(os.path.join(self.folder, "a", "A.meta")))
+            self.assertFalse(self.storage.exists(os.path.join(self.folder, "b")))
+        self.assertListEqual(self.storage.list_folders(self.folder), ["a"])
+        self.assertEqual(self.cache.misses, 2, "Folders were listed more than once")
+
+        self.storage.delete_folder(os.path.join(self.folder, "a"))
+        self.assertFalse(self.storage.exists(os.path.join(self.folder, "a")))
+        self.assertFalse(self.storage.exists(os.path.join(self.folder, "a", "A.meta")))
+
+    def test_external_changes(self):
+        self.assertFalse(self.storage.exists(os.path.join(self.folder, "a")))
+        os.mkdir(os.path.join(self.folder, "a"))
+        self.assertFalse(self.storage.exists(os.path.join(self.folder, "a")), "Listing was not cached")
+        self.storage.invalidate(os.path.join(self.folder, "a"))
+        self.assertTrue(self.storage.exists(os.path.join(self.folder, "a")))
+
+        self.cache.ttl = 0
+        os.mkdir(os.path.join(self.folder, "b"))
+        self.assertTrue(self.storage.exists(os.path.join(self.folder, "b")))
+
+    def test_project_on_cached_storage(self):
+        FOLDER_STORAGE.set_stat_cache(StatCache(ttl=60))
+        manager = Manager()
+        manager.set_folder(os.path.join(self.folder, "project"))
+        manager.build()
+        manager.create_element("show")
+        manager["show"].create_element("sh010")
+
+        reloaded = Manager()
+        reloaded.set_folder(manager.get_folder())
+        reloaded.load_from_folder()
+        self.assertListEqual(reloaded["show"].get_names(), ["sh010"])
+        reloaded.delete("show")
+        self.assertEqual(manager["show"].load_from_folder().name, "NO_FOLDER_FOUND")
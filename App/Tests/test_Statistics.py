@@ -0,0 +1,60 @@
+import os
+from datetime import time
+
+from App.ShowManager.Manager import Manager
+from App.ShowManager.Statistics import ProjectStatistics, length_in_seconds
+from App.Tests.test_setup import SetupBaseDirectory
+
+
+class TestStatistics(SetupBaseDirectory):
+    def setUp(self) -> None:
+        super().setUp()
+        self.manager = Manager()
+        self.manager.set_folder(os.path.join(self.test_folder_path, "statistics"))
+        self.manager.build()
+        for show_name, clips in [("one", [1, 2, 5]), ("two", [1])]:
+            self.manager.create_element(show_name)
+            for clip_number in clips:
+                shot_name = f"shot_{clip_number}"
+                self.manager[show_name].create_element(shot_name)
+                shot = self.manager[show_name][shot_name]
+                shot.clip_number = clip_number
+                shot.length = time(0, 0, 10)
+                shot.characters = {"hero"} if clip_number % 2 else {"hero", "villain"}
+                shot.environments = {"forest"}
+        self.statistics = ProjectStatistics(self.manager, frame_rate=24)
+
+    def tearDown(self) -> None:
+        self.manager.delete_folder()
+        super().tearDown()
+
+    def test_length_in_seconds(self):
+        self.assertEqual(length_in_seconds(time(1, 2, 3, 500000)), 3723.5)
+        self.assertEqual(length_in_seconds("00:01:30"), 90)
+        self.assertEqual(length_in_seconds("not a time"), 0)
+
+    def test_rollups(self):
+        self.assertDictEqual(self.statistics.runtime_per_show(), {"one": 30, "two": 10})
+        self.assertDictEqual(self.statistics.runtime_per_show(in_frames=True), {"one": 720, "two": 240})
+        self.assertDictEqual(self.statistics.shot_counts(), {"one": 3, "two": 1})
+        self.assertDictEqual(self.statistics.character_frequency(), {"hero": 4, "villain": 1})
+        self.assertDictEqual(self.statistics.environment_frequency(), {"forest": 4})
+        self.assertDictEqual(self.statistics.clip_number_gaps(), {"one": [3, 4]})
+
+    def test_incremental_updates(self):
+        shot = self.manager["one"]["shot_2"]
+        shot.characters = {"sidekick"}
+        shot.length = time(0, 1, 0)
+        self.statistics.update_shot("one", "shot_2")
+        self.assertDictEqual(self.statistics.character_frequency(), {"hero": 3, "sidekick": 1})
+        self.assertEqual(self.statistics.runtime_per_show()["one"], 80)
+
+        self.statistics.remove_shot("one", "shot_5")
+        self.assertDictEqual(self.statistics.clip_number_gaps(), {})
+        self.statistics.remove_show("two")
+        self.assertDictEqual(self.statistics.shot_counts(), {"one": 2})
+
+        self.manager["two"].create_element("shot_3")
+        self.manager["two"]["shot_3"].clip_number = 3
+        self.statistics.update_shot("two", "shot_3")
+        self.assertDictEqual(self.statistics.shot_counts(), {"one": 2, "two": 1})
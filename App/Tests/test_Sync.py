@@ -0,0 +1,118 @@
+import os
+import shutil
+
+from App.ShowManager.Manager import Manager
+from App.ShowManager.Sync import SyncDirection, SyncExitCode, HashManifest
+from App.Tests.test_setup import SetupBaseDirectory
+
+
+class TestSync(SetupBaseDirectory):
+    def setUp(self) -> None:
+        super().setUp()
+        self.local_folder = os.path.join(self.test_folder_path, "local")
+        self.remote_folder = os.path.join(self.test_folder_path, "remote")
+        self.local = Manager()
+        self.local.set_folder(self.local_folder)
+        self.local.build()
+        self.local.create_element("show")
+        self.local["show"].create_element("shot")
+        shutil.copytree(self.local_folder, self.remote_folder)
+        self.remote = Manager()
+        self.remote.set_folder(self.remote_folder)
+        self.remote.load_from_folder()
+
+    def tearDown(self) -> None:
+        self.local.delete_folder()
+        self.remote.delete_folder()
+        super().tearDown()
+
+    def test_first_sync_is_clean(self):
+        report = self.local.sync(self.remote_folder)
+        self.assertEqual(report.exit_code, SyncExitCode.SUCCESS)
+        self.assertListEqual(report.pushed + report.pulled + report.conflicts, [])
+
+    def test_push_pull_and_delete(self):
+        self.local.sync(self.remote_folder)
+        self.local["show"]["shot"].characters.add("hero")
+        self.local["show"]["shot"].serialize()
+        self.remote.create_element("new_show")
+
+        report = self.local.sync(self.remote_folder, SyncDirection.PUSH)
+        self.assertListEqual(report.pushed, ["show/shot/Shot.meta"])
+        self.assertListEqual(report.skipped, ["new_show/Show.meta"])
+
+        report = self.local.sync(self.remote_folder)
+        self.assertListEqual(report.pulled, ["new_show/Show.meta"])
+        self.assertIn("new_show", self.local, "Pulled show was not loaded")
+
+        self.remote.load_from_folder()
+        self.assertSetEqual(self.remote["show"]["shot"].characters, {"hero"})
+
+        self.local.delete("new_show")
+        report = self.local.sync(self.remote_folder)
+        self.assertListEqual(report.pushed, ["new_show/Show.meta"])
+        self.assertFalse(os.path.exists(os.path.join(self.remote_folder, "new_show")), "Deleted show folder was not removed")
+
+    def test_conflict(self):
+        self.local.sync(self.remote_folder)
+        for manager, character in [(self.local, "hero"), (self.remote, "villain")]:
+            manager["show"]["shot"].characters.add(character)
+            manager["show"]["shot"].serialize()
+
+        report = self.local.sync(self.remote_folder)
+        self.assertEqual(report.exit_code, SyncExitCode.CONFLICTS)
+        self.assertListEqual(report.conflicts, ["show/shot/Shot.meta"])
+
+    def test_manifest_skips_unchanged_files(self):
+        manifest = HashManifest(self.local_folder)
+        hashes = manifest.scan()
+        manifest.files["show/Show.meta"][2] = "cached"
+        self.assertEqual(manifest.scan()["show/Show.meta"], "cached", "Unchanged file was hashed again")
+        self.assertEqual(hashes["show/shot/Shot.meta"], manifest.scan()["show/shot/Shot.meta"])
+
+    def write_asset(self, manager: Manager, show_name: str, shot_name: str, file_name: str = "plate.exr") -> str:
+        file = os.path.join(manager[show_name][shot_name].get_folder(), file_name)
+        with open(file, "w") as stream:
+            stream.write("plate")
+        return file
+
+    def test_delete_non_empty_folder(self):
+        self.local["show"].create_element("kept")
+        self.local.sync(self.remote_folder)
+        self.remote.load_from_folder()
+        self.write_asset(self.remote, "show", "shot")
+        self.write_asset(self.remote, "show", "shot", ".tasks.json")
+
+        self.local["show"].delete("shot")
+        report = self.local.sync(self.remote_folder)
+        self.assertListEqual(report.pushed, ["show/shot/Shot.meta"])
+        self.assertFalse(os.path.exists(os.path.join(self.remote_folder, "show", "shot")), "Deleted shot folder was kept")
+        self.remote.load_from_folder()
+        self.assertListEqual(self.remote["show"].get_names(), ["kept"])
+
+        self.remote["show"]["kept"].characters.add("villain")
+        self.remote["show"]["kept"].serialize()
+        self.local.delete("show")
+        report = self.local.sync(self.remote_folder)
+        self.assertListEqual(report.conflicts, ["show/Show.meta", "show/kept/Shot.meta"])
+        self.assertTrue(os.path.isfile(self.remote["show"].get_file()), "Show holding a kept shot was deleted")
+
+    def test_archived_show(self):
+        self.local.sync(self.remote_folder)
+        self.local["show"]["shot"].characters.add("hero")
+        self.local["show"]["shot"].serialize()
+        self.local.archive("show")
+        self.write_asset(self.remote, "show", "shot")
+
+        report = self.local.sync(self.remote_folder)
+        self.assertListEqual(report.pushed, ["show.pack", "show/Show.meta", "show/shot/Shot.meta"])
+        self.assertFalse(os.path.exists(os.path.join(self.remote_folder, "show")), "Archived show folder was kept")
+        self.remote.load_from_folder()
+        self.assertTrue(self.remote.is_archived(self.remote["show"]), "Pack did not replace the show folder")
+        self.assertSetEqual(self.remote["show"]["shot"].characters, {"hero"})
+
+        self.remote.unarchive("show")
+        report = self.local.sync(self.remote_folder)
+        self.assertListEqual(report.pulled, ["show.pack", "show/Show.meta", "show/shot/Shot.meta"])
+        self.assertFalse(self.local.is_archived(self.local["show"]), "Unarchived show was not pulled back")
+        self.assertSetEqual(self.local["show"]["shot"].characters, {"hero"})
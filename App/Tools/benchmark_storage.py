@@ -0,0 +1,76 @@
+""" Compare the folder storage and the sqlite storage on load, query and bulk update
+
+usage: python -m App.Tools.benchmark_storage [shows] [shots per show]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from App.ShowManager.Manager import Manager
+
+
+def build_project(folder: str, show_count: int, shot_count: int, use_database: bool) -> None:
+    """ Build a project with show_count shows holding shot_count shots each """
+    manager = Manager()
+    manager.set_folder(folder)
+    if use_database:
+        manager.use_database()
+    manager.build()
+    with manager.get_storage().batch():
+        for show_index in range(show_count):
+            show_name = f"show_{show_index:04}"
+            manager.create_element(show_name)
+            for shot_index in range(shot_count):
+                manager[show_name].create_element(f"shot_{shot_index:04}")
+    manager.get_storage().close()
+
+
+def measure(task) -> float:
+    """ Run a task and return how many seconds it took """
+    start = time.perf_counter()
+    task()
+    return time.perf_counter() - start
+
+
+def benchmark(folder: str, show_count: int) -> dict[str, float]:
+    """ Time a full load, a query on a single show, and a bulk update of every shot of the project """
+    manager = Manager()
+    manager.set_folder(folder)
+    results = {"load": measure(manager.load_from_folder)}
+
+    middle_show = f"show_{show_count // 2:04}"
+    results["query"] = measure(lambda: manager[middle_show].load_from_folder())
+
+    def bulk_update():
+        with manager.get_storage().batch():
+            for show in manager.values():
+                for shot in show.values():
+                    shot.environments.add("benchmark")
+                    shot.serialize()
+
+    results["bulk update"] = measure(bulk_update)
+    manager.get_storage().close()
+    return results
+
+
+def main(show_count: int, shot_count: int) -> None:
+    root = tempfile.mkdtemp()
+    try:
+        print(f"{show_count} shows x {shot_count} shots")
+        print(f"{'operation':<12}{'folders':>12}{'sqlite':>12}")
+        folder_project, database_project = os.path.join(root, "folders"), os.path.join(root, "sqlite")
+        build_project(folder_project, show_count, shot_count, False)
+        build_project(database_project, show_count, shot_count, True)
+        folder_results = benchmark(folder_project, show_count)
+        database_results = benchmark(database_project, show_count)
+        for operation, seconds in folder_results.items():
+            print(f"{operation:<12}{seconds:>11.3f}s{database_results[operation]:>11.3f}s")
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == '__main__':
+    arguments = [int(argument) for argument in sys.argv[1:3]]
+    main(*(arguments + [50, 100][len(arguments):]))
@@ -0,0 +1,15 @@
+""" Upgrade every metafile of a project to the current schema of its class
+
+usage: python -m App.Tools.migrate_schema <project folder> [--dry-run]
+"""
+import sys
+
+from App.ShowManager.Proxy import manager, migrate_schema
+
+if __name__ == '__main__':
+    arguments = [argument for argument in sys.argv[1:] if argument != "--dry-run"]
+    if len(arguments) != 1:
+        print(__doc__)
+        sys.exit(1)
+    manager.set_folder(arguments[0])
+    sys.exit(migrate_schema("--dry-run" in sys.argv))
@@ -0,0 +1,13 @@
+""" Copy a project saved as one folder per element into a single sqlite database file
+
+usage: python -m App.Tools.migrate_to_database <project folder>
+"""
+import sys
+
+from App.ShowManager.Proxy import migrate_to_database
+
+if __name__ == '__main__':
+    if len(sys.argv) != 2:
+        print(__doc__)
+        sys.exit(1)
+    sys.exit(migrate_to_database(sys.argv[1]))
@@ -0,0 +1,15 @@
+""" Check every metafile of a project, and optionally repair the broken ones
+
+usage: python -m App.Tools.scrub_project <project folder> [--repair]
+"""
+import sys
+
+from App.ShowManager.Proxy import manager, scrub
+
+if __name__ == '__main__':
+    arguments = [argument for argument in sys.argv[1:] if argument != "--repair"]
+    if len(arguments) != 1:
+        print(__doc__)
+        sys.exit(1)
+    manager.set_folder(arguments[0])
+    sys.exit(scrub("--repair" in sys.argv))
@@ -0,0 +1,255 @@
+""" Drive a generated project with concurrent readers and writers, report tail latencies, then verify what was written
+
+usage: python -m App.Tools.stress_test [--threads N] [--duration SECONDS] [--interval SECONDS] [--shows N]
+                                       [--shots N] [--hot N] [--database] [--stat-cache TTL] [--folder FOLDER] [--keep]
+                                       [--seed N]
+
+Each worker thread runs a random mix of reads, edits, creates and deletes on one shared Manager, the way Proxy uses it.
+Every worker owns a share of the shots and is the only one editing them, so their final state is known exactly, while a
+few hot shots are edited by every worker to stress concurrent writes on the same files. Latency percentiles and
+throughput are printed for every interval. At the end the project is loaded again from storage and compared with what
+the workers wrote: a missing or unexpected shot, or a value that differs from the last one written, is a lost update,
+and any metafile found broken by a scrub is corruption. Reads of files being written, which may see partial data, are
+reported as torn reads. The exit code is 1 when the final verification fails.
+"""
+from __future__ import annotations
+
+import argparse
+import math
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+from App.ShowManager.Manager import Manager
+from App.ShowManager.Scrub import scrub_project
+from App.ShowManager.Proxy import set_stat_cache_ttl
+
+OPERATIONS: dict[str, int] = {"read": 60, "edit": 25, "create": 10, "delete": 5}
+""" Relative weight of each operation in the workload """
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """ Get the nearest rank percentile of sorted values, 0 when there are none """
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))]
+
+
+class Worker(threading.Thread):
+    """ Runs random operations until told to stop, recording the latency of each and the state it left each shot in
+
+    Attributes:
+        samples (list[tuple[str, float, float]]): (operation, finish time, seconds) of every operation.
+        owned (dict[tuple[str, str], int]): Last clip number written to each shot this worker owns.
+        hot_writes (dict[tuple[str, str], set[int]]): Clip numbers written to each hot shot.
+        created (set[tuple[str, str]]): Shots this worker created and did not delete.
+        deleted (set[tuple[str, str]]): Shots this worker deleted.
+        torn_reads (int): Reads that found a partial or broken metafile.
+        errors (list[str]): Operations that raised.
+    """
+
+    def __init__(self, index: int, manager: Manager, owned: list[tuple[str, str]], hot: list[tuple[str, str]],
+                 stop: threading.Event, seed: int):
+        super().__init__(name=f"stress-{index}", daemon=True)
+        self.index: int = index
+        self.manager: Manager = manager
+        self.owned: dict[tuple[str, str], int] = {key: 0 for key in owned}
+        self.hot: list[tuple[str, str]] = hot
+        self.stop: threading.Event = stop
+        self.random = random.Random(seed)
+        self.samples: list[tuple[str, float, float]] = []
+        self.hot_writes: dict[tuple[str, str], set[int]] = {key: set() for key in hot}
+        self.created: set[tuple[str, str]] = set()
+        self.deleted: set[tuple[str, str]] = set()
+        self.torn_reads: int = 0
+        self.errors: list[str] = []
+        self._counter: int = 0
+
+    def next_value(self) -> int:
+        """ Get a clip number no other worker writes """
+        self._counter += 1
+        return self._counter * 1000 + self.index
+
+    def read(self) -> None:
+        show = self.manager[self.random.choice(self.manager.get_names())]
+        names = show.get_names()
+        if not names:
+            return
+        shot = show.get(self.random.choice(names))
+        if shot is None:
+            return
+        try:
+            file_string = shot.get_storage().read_file(shot.get_file())
+        except OSError:
+            return
+        if shot.inspect_file_data(file_string):
+            self.torn_reads += 1
+
+    def edit(self) -> None:
+        if self.hot and self.random.random() < 0.5:
+            key = self.random.choice(self.hot)
+            self.hot_writes[key].add(self.write(key))
+        elif self.owned:
+            key = self.random.choice(list(self.owned))
+            self.owned[key] = self.write(key)
+
+    def write(self, key: tuple[str, str]) -> int:
+        value = self.next_value()
+        shot = self.manager[key[0]][key[1]]
+        shot.clip_number = value
+        shot.serialize()
+        return value
+
+    def create(self) -> None:
+        key = (self.random.choice(self.manager.get_names()), f"stress_{self.index}_{self.next_value()}")
+        self.manager[key[0]].create_element(key[1])
+        self.created.add(key)
+
+    def delete(self) -> None:
+        if not self.created:
+            return self.create()
+        key = self.random.choice(sorted(self.created))
+        self.manager[key[0]].delete(key[1])
+        self.created.discard(key)
+        self.deleted.add(key)
+
+    def run(self) -> None:
+        operations, weights = list(OPERATIONS), list(OPERATIONS.values())
+        while not self.stop.is_set():
+            operation = self.random.choices(operations, weights)[0]
+            start = time.perf_counter()
+            try:
+                getattr(self, operation)()
+            except Exception as error:
+                self.errors.append(f"{operation}: {error!r}")
+            finish = time.perf_counter()
+            self.samples.append((operation, finish, finish - start))
+
+
+def generate_project(folder: str, show_count: int, shot_count: int, use_database: bool) -> Manager:
+    """ Build a project with show_count shows holding shot_count shots each """
+    manager = Manager()
+    manager.set_folder(folder)
+    if use_database:
+        manager.use_database()
+    manager.build()
+    with manager.get_storage().batch():
+        for show_index in range(show_count):
+            show_name = f"show_{show_index:03}"
+            manager.create_element(show_name)
+            for shot_index in range(shot_count):
+                manager[show_name].create_element(f"shot_{shot_index:04}")
+    return manager
+
+
+def report_interval(label: str, samples: list[tuple[str, float, float]], seconds: float) -> None:
+    """ Print the throughput and latency percentiles of the operations finished during an interval """
+    line = f"{label:>8} {len(samples) / seconds:>9.0f} op/s"
+    for operation in OPERATIONS:
+        latencies = sorted(sample[2] * 1000 for sample in samples if sample[0] == operation)
+        line += f" | {operation} {percentile(latencies, .5):.2f}/{percentile(latencies, .95):.2f}/{percentile(latencies, .99):.2f}"
+    print(line)
+
+
+def verify(folder: str, workers: list[Worker]) -> list[str]:
+    """ Load the project again from storage and list every way it differs from what the workers wrote """
+    manager = Manager()
+    manager.set_folder(folder)
+    manager.load_from_folder()
+    problems = [f"Corruption, {issue}" for issue in scrub_project(manager).issues]
+
+    def find(key: tuple[str, str]):
+        return manager[key[0]].get(key[1]) if key[0] in manager else None
+
+    for worker in workers:
+        for key, value in worker.owned.items():
+            shot = find(key)
+            if shot is None or shot.clip_number != value:
+                problems.append(f"Lost update, {'/'.join(key)} is {shot and shot.clip_number} instead of {value}")
+        for key in worker.created:
+            if find(key) is None:
+                problems.append(f"Lost update, created {'/'.join(key)} is missing")
+        for key in worker.deleted:
+            if find(key) is not None:
+                problems.append(f"Lost update, deleted {'/'.join(key)} is still there")
+
+    for key in workers[0].hot_writes if workers else []:
+        written = set().union(*(worker.hot_writes[key] for worker in workers))
+        shot = find(key)
+        if shot is None or (written and shot.clip_number not in written):
+            problems.append(f"Lost update, hot {'/'.join(key)} is {shot and shot.clip_number}, a value never written")
+    manager.get_storage().close()
+    return problems
+
+
+def main(arguments: argparse.Namespace) -> int:
+    root = arguments.folder or tempfile.mkdtemp()
+    folder = os.path.join(root, "stress")
+    try:
+        print(f"Generating {arguments.shows} shows x {arguments.shots} shots in {folder}")
+        manager = generate_project(folder, arguments.shows, arguments.shots, arguments.database)
+        shots = [(show_name, shot_name) for show_name in manager.get_names() for shot_name in manager[show_name].get_names()]
+        hot, owned = shots[:arguments.hot], shots[arguments.hot:]
+
+        stop = threading.Event()
+        workers = [Worker(index, manager, owned[index::arguments.threads], hot, stop, arguments.seed + index)
+                   for index in range(arguments.threads)]
+        print(f"{arguments.threads} workers for {arguments.duration}s, latencies in ms as p50/p95/p99")
+        start = time.perf_counter()
+        for worker in workers:
+            worker.start()
+
+        interval_start = start
+        while interval_start - start < arguments.duration:
+            time.sleep(min(arguments.interval, max(0.0, start + arguments.duration - interval_start)))
+            now = time.perf_counter()
+            samples = [sample for worker in workers for sample in worker.samples[:] if interval_start <= sample[1] < now]
+            report_interval(f"{now - start:.0f}s", samples, max(now - interval_start, 1e-9))
+            interval_start = now
+
+        stop.set()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - start
+        report_interval("total", [sample for worker in workers for sample in worker.samples], elapsed)
+        manager.get_storage().close()
+
+        errors = [error for worker in workers for error in worker.errors]
+        for error in errors[:20]:
+            print(f"Error, {error}")
+        print(f"{len(errors)} failed operations, {sum(worker.torn_reads for worker in workers)} torn reads")
+
+        problems = verify(folder, workers)
+        for problem in problems:
+            print(problem)
+        print("Verification failed" if problems else "Verification passed, no corruption or lost update found")
+        return 1 if problems else 0
+    finally:
+        if arguments.keep:
+            print(f"Project kept in {folder}")
+        elif arguments.folder:
+            shutil.rmtree(folder, ignore_errors=True)
+        else:
+            shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds, hours of soak are 3600 times the hours")
+    parser.add_argument("--interval", type=float, default=5.0, help="seconds between two reports")
+    parser.add_argument("--shows", type=int, default=5)
+    parser.add_argument("--shots", type=int, default=50)
+    parser.add_argument("--hot", type=int, default=4, help="shots every worker edits")
+    parser.add_argument("--database", action="store_true", help="store the project in a sqlite database")
+    parser.add_argument("--stat-cache", type=float, default=0.0, help="seconds folder listings are cached, 0 disables it")
+    parser.add_argument("--folder", help="folder to generate the project in, a temporary folder by default")
+    parser.add_argument("--keep", action="store_true", help="keep the project once done")
+    parser.add_argument("--seed", type=int, default=0)
+    parsed_arguments = parser.parse_args()
+    set_stat_cache_ttl(parsed_arguments.stat_cache)
+    sys.exit(main(parsed_arguments))
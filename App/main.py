@@ -14,8 +14,10 @@ from rich.prompt import Prompt, Confirm
 from rich.tree import Tree
 
 from App.ShowManager.Proxy import *
+from App.ShowManager.Prefetcher import Prefetcher
 from App.ShowManager.Shot import Shot
 from App.ShowManager.Show import Show
+from App.ShowManager.Serializable.Encodable import coerce_value
 
 
 class State(Enum):
@@ -99,6 +101,21 @@ inspected_shot = ""
 run = True
 """ variable that control the application loop """
 
+RESIDENCY_MAX_SHOWS = 32
+""" const most shows keeping their shots in memory, the others are loaded from storage when opened, or prefetched """
+
+PREFETCH_LIMIT = 8
+""" const most shows prefetched when the show list is displayed, fewer when the residency budget is smaller """
+
+STAT_CACHE_TTL = 2.0
+""" const seconds folder listings are trusted while navigating, changes made by other users show up after at most that long """
+
+prefetcher = Prefetcher()
+""" background prefetcher loading back the unloaded shows the user is likely to open next, cancelled whenever the state changes """
+
+view_cache: dict = {}
+""" show list, shot lists and encoded data drawn by the states, dropped when the event bus reports they changed """
+
 
 def is_string_in_list(string: str, string_list: list[str]) -> bool:
     """ this method verifies if a string is within a string array, but different from string in array, this method is not case-sensitive """
@@ -150,6 +167,40 @@ def draw_element_list(elements: list[str], default_message, root_name) -> str |
     return message
 
 
+def neighbours(element: str, elements: list[str], limit: int = PREFETCH_LIMIT) -> list[str]:
+    """ List the elements closest to an element in a list, nearest first, starting from the top when it is not in the list """
+    if element not in elements:
+        return elements[:limit]
+    index = elements.index(element)
+    ordered = sorted(range(len(elements)), key=lambda other: (abs(other - index), other))
+    return [elements[other] for other in ordered if other != index][:limit]
+
+
+def refresh_view_cache(event: ChangeEvent) -> None:
+    """ Drop the cached views a change made stale, so the next draw asks the proxy again """
+    if event.change_type == ChangeType.RELOADED:
+        view_cache.clear()
+    elif event.shot_name is None:
+        view_cache.pop(("show", event.show_name), None)
+        if event.change_type != ChangeType.UPDATED:
+            view_cache.pop("shows", None)
+            view_cache.pop(("shots", event.show_name), None)
+    else:
+        view_cache.pop(("shot", event.show_name, event.shot_name), None)
+        if event.change_type != ChangeType.UPDATED:
+            view_cache.pop(("shots", event.show_name), None)
+
+
+events.subscribe(refresh_view_cache)
+
+
+def cached(key, getter, *arguments):
+    """ Get a view from the cache, asking the proxy only when it is not cached """
+    if key not in view_cache:
+        view_cache[key] = getter(*arguments)
+    return view_cache[key]
+
+
 def state_landing() -> State:
     """ First state of UIs state machine, it's the landing view when the application starts """
     global project_name, folder_path
@@ -174,7 +225,7 @@ def state_landing() -> State:
 
         elif not manager.folder_exists():
             if display_instructions(f"No project was found in folder.", "Build new project?", Confirm.ask):
-                install(project_folder)
+                install(project_folder, Confirm.ask("Store project in a single database file?", default=False))
                 return State.PROJECT_INSPECTOR
 
 
@@ -182,7 +233,10 @@ def state_project_inspector():
     """ Second state, this state display information of a project """
     global inspected_show, run
 
-    shows = get_shows_list()
+    shows = cached("shows", get_shows_list)
+    pin_show(inspected_show if inspected_show in shows else None)
+    for show in get_shows_to_warm(([inspected_show] if inspected_show in shows else []) + neighbours(inspected_show, shows), PREFETCH_LIMIT):
+        prefetcher.prefetch(warm_show, show)
 
     show_list = draw_element_list(shows, "Project does not have any shows.\nType a show name to create a new show.", "Shows")
 
@@ -212,36 +266,55 @@ def state_show_inspector():
     """ Third state, this state display information of a show """
     global inspected_show, inspected_shot, run
 
-    show_data = draw_json_table(get_show_data(inspected_show))
-    shots = get_shot_list(inspected_show)
+    pin_show(inspected_show)
+    show_data = draw_json_table(cached(("show", inspected_show), get_show_data, inspected_show))
+    shots = cached(("shots", inspected_show), get_shot_list, inspected_show)
+
     shots_list = draw_element_list(shots, "Show does not have any shots.", "Shots")
 
     SET = Command("Set", "Set value of <[cyan]Key[/cyan]> to <[magenta]Value[/magenta]>.", "Key", "Value")
+    BULK = Command("Bulk", "On every shot matching <[cyan]Pattern[/cyan]>, <[cyan]Operation[/cyan]> (set, add or remove) <[magenta]Value[/magenta]> on <[cyan]Key[/cyan]>.", "Pattern", "Key", "Operation", "Value")
     CREATE = Command("", "Create/Get a shot named <[magenta]Name[/magenta]>", "Name")
     DELETE = Command("Delete", "Delete this show.")
-    command_table = draw_command_table(SET, CREATE, DELETE, BACK, EXIT)
+    ARCHIVE = Command("Archive", "Pack this show into a single read-only file.")
+    UNARCHIVE = Command("Unarchive", "Restore this show's folders so it can be changed.")
+    command_table = draw_command_table(SET, BULK, CREATE, DELETE, ARCHIVE, UNARCHIVE, BACK, EXIT)
 
     user_input = display_instructions(Group(show_data, shots_list, command_table), "Command", Prompt.ask, f"{inspected_show} data")
-    user_command = Command.interpret_input(user_input, SET, CREATE, DELETE, BACK, EXIT)
+    user_command = Command.interpret_input(user_input, SET, BULK, CREATE, DELETE, ARCHIVE, UNARCHIVE, BACK, EXIT)
 
     if user_command == DELETE:
         delete_show(inspected_show)
         return State.PROJECT_INSPECTOR
 
+    elif user_command == ARCHIVE:
+        archive_show(inspected_show)
+        Prompt.ask("Press enter to continue")
+
+    elif user_command == UNARCHIVE:
+        unarchive_show(inspected_show)
+        Prompt.ask("Press enter to continue")
+
     elif user_command == SET:
         if len(user_command.arguments) == 2:
             key = user_command.arguments[0].strip().lower().replace(" ", "_")
             try:
-                value = Show().__dict__[key]
-                if isinstance(value, list) or isinstance(value, set):
-                    value = [element for element in user_command.arguments[1].strip("[]{}").split(",")]
-                elif isinstance(value, dict):
-                    value = ast.literal_eval(user_command.arguments[1])
-                else:
-                    value = user_command.arguments[1]
-                set_show_data(inspected_show, {key: value})
-            except:
+                default, text = Show().__dict__[key], user_command.arguments[1]
+                if isinstance(default, (list, set)):
+                    text = text.strip("[]{}")
+                elif isinstance(default, dict):
+                    text = ast.literal_eval(text)
+                value = coerce_value(default, text)
+            except (KeyError, ValueError, TypeError, SyntaxError):
                 return
+            set_show_data(inspected_show, {key: value})
+
+    elif user_command == BULK:
+        if len(user_command.arguments) == 4:
+            pattern, key, operation, value = user_command.arguments
+            if operation.upper() in BulkOperation.__members__:
+                bulk_edit(inspected_show, pattern, key.lower().replace(" ", "_"), BulkOperation[operation.upper()], value.strip("[]{}"))
+                Prompt.ask("Press enter to continue")
 
     elif user_command == CREATE:
         inspected_shot = user_command.arguments[0]
@@ -263,7 +336,8 @@ def state_shot_inspector():
     """ Last state, this one shows information of a shot """
     global inspected_show, inspected_shot, run
 
-    shot_data = draw_json_table(get_shot_data(inspected_show, inspected_shot))
+    pin_show(inspected_show)
+    shot_data = draw_json_table(cached(("shot", inspected_show, inspected_shot), get_shot_data, inspected_show, inspected_shot))
 
     SET = Command("Set", "Set value of <[cyan]Key[/cyan]> to <[magenta]Value[/magenta]>.", "Key", "Value")
     DELETE = Command("Delete", "Delete this shot.")
@@ -280,16 +354,15 @@ def state_shot_inspector():
         if len(user_command.arguments) == 2:
             key = user_command.arguments[0].strip().lower().replace(" ", "_")
             try:
-                value = Shot().__dict__[key]
-                if isinstance(value, list) or isinstance(value, set):
-                    value = [element for element in user_command.arguments[1].strip("[]{}").split(",")]
-                elif isinstance(value, dict):
-                    value = ast.literal_eval(user_command.arguments[1])
-                else:
-                    value = user_command.arguments[1]
-                set_shot_data(inspected_show, inspected_shot, {key: value})
-            except:
+                default, text = Shot().__dict__[key], user_command.arguments[1]
+                if isinstance(default, (list, set)):
+                    text = text.strip("[]{}")
+                elif isinstance(default, dict):
+                    text = ast.literal_eval(text)
+                value = coerce_value(default, text)
+            except (KeyError, ValueError, TypeError, SyntaxError):
                 return
+            set_shot_data(inspected_show, inspected_shot, {key: value})
 
     elif user_command == BACK:
         return State.SHOW_INSPECTOR
@@ -299,6 +372,8 @@ def state_shot_inspector():
 
 
 if __name__ == '__main__':
+    set_stat_cache_ttl(STAT_CACHE_TTL)
+    set_residency_budget(RESIDENCY_MAX_SHOWS)
     state = State.LANDING
     new_state = None
     while run:
@@ -319,4 +394,8 @@ if __name__ == '__main__':
             pass
 
         if new_state:
+            if new_state != state:
+                prefetcher.cancel()
             state = new_state
+
+    prefetcher.shutdown()